@@ -3,7 +3,9 @@ Agent Controller
 LangGraph 워크플로우 진입점
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncGenerator
+import asyncio
+import logging
 import uuid
 
 from ..config.logger import get_logger
@@ -15,6 +17,7 @@ from ..services.simple_search_service import get_simple_search_service
 # from ..db.repositories import SessionRepository
 # from ..db.models import WorkflowTypeEnum, RoleEnum
 from .workflows import run_qa_workflow
+from .streaming_controller import get_streaming_controller
 
 logger = get_logger()
 chat_cache = get_chat_cache()
@@ -118,6 +121,59 @@ class AgentController:
                 "error": str(e)
             }
     
+    @staticmethod
+    async def arun_qa(
+        session_id: str,
+        policy_id: int,
+        user_message: str
+    ) -> Dict[str, Any]:
+        """
+        Q&A 워크플로우 실행 (비동기)
+        
+        워크플로우(LLM 호출, 웹 검색)는 동기 I/O 이므로
+        워커 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
+        
+        Args:
+            session_id: 세션 ID
+            policy_id: 정책 ID
+            user_message: 사용자 메시지
+        
+        Returns:
+            Dict: 실행 결과
+        """
+        return await asyncio.to_thread(
+            AgentController.run_qa,
+            session_id=session_id,
+            policy_id=policy_id,
+            user_message=user_message
+        )
+    
+    @staticmethod
+    async def run_qa_stream(
+        session_id: str,
+        policy_id: int,
+        user_message: str
+    ) -> AsyncGenerator[str, None]:
+        """
+        Q&A 스트리밍 실행 (SSE)
+        
+        run_qa 와 같은 입력을 받아 토큰 단위로 SSE 이벤트를 생성합니다.
+        근거(evidence)는 답변 생성 후 마지막 이벤트로 전송됩니다.
+        
+        Args:
+            session_id: 세션 ID
+            policy_id: 정책 ID
+            user_message: 사용자 메시지
+        
+        Yields:
+            str: SSE 형식 이벤트 문자열
+        """
+        controller = get_streaming_controller()
+        async for event in controller.process_query_stream(
+            session_id, policy_id, user_message
+        ):
+            yield event
+    
     @staticmethod
     @trace_workflow(
         name="agent_controller_run_search",
@@ -145,15 +201,16 @@ class AgentController:
             Dict: 검색 결과
         """
         try:
-            logger.info(
-                "Running search workflow",
-                extra={
-                    "query": query,
-                    "session_id": session_id,
-                    "region": region,
-                    "category": category
-                }
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Running search workflow",
+                    extra={
+                        "query": query,
+                        "session_id": session_id,
+                        "region": region,
+                        "category": category
+                    }
+                )
             
             # SimpleSearchService로 검색 실행
             search_service = get_simple_search_service()
@@ -166,14 +223,15 @@ class AgentController:
                 include_web_search=True
             )
             
-            logger.info(
-                "Search workflow completed",
-                extra={
-                    "session_id": result.get("session_id"),
-                    "total_count": result.get("total_count"),
-                    "is_sufficient": result.get("is_sufficient")
-                }
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Search workflow completed",
+                    extra={
+                        "session_id": result.get("session_id"),
+                        "total_count": result.get("total_count"),
+                        "is_sufficient": result.get("is_sufficient")
+                    }
+                )
             
             return result
             
@@ -208,6 +266,39 @@ class AgentController:
                 "error": str(e)
             }
     
+    @staticmethod
+    async def arun_search(
+        query: str,
+        session_id: Optional[str] = None,
+        region: Optional[str] = None,
+        category: Optional[str] = None,
+        target_group: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        검색 실행 (비동기)
+        
+        검색 파이프라인(임베딩, Qdrant, MySQL, Tavily)은 동기 I/O 이므로
+        워커 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
+        
+        Args:
+            query: 검색 쿼리
+            session_id: 세션 ID (없으면 자동 생성)
+            region: 지역 필터
+            category: 카테고리 필터
+            target_group: 대상 그룹 필터
+        
+        Returns:
+            Dict: 검색 결과
+        """
+        return await asyncio.to_thread(
+            AgentController.run_search,
+            query=query,
+            session_id=session_id,
+            region=region,
+            category=category,
+            target_group=target_group
+        )
+    
     @staticmethod
     def reset_session(session_id: str) -> bool:
         """
@@ -1,6 +1,6 @@
 """Workflow nodes"""
 
-from .classify_node import classify_query_type_node, classify_query_node
+from .classify_node import classify_query_type_node, aclassify_query_type_node, classify_query_node
 from .retrieve_node import load_cached_docs_node, retrieve_from_db_node
 from .check_node import check_sufficiency_node
 from .web_search_node import web_search_node
@@ -14,6 +14,7 @@ from .answer_node import (
 __all__ = [
     # 새 노드들
     "classify_query_type_node",
+    "aclassify_query_type_node",
     "load_cached_docs_node",
     "generate_answer_with_docs_node",
     "generate_answer_web_only_node",
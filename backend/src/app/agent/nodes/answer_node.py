@@ -4,15 +4,19 @@ LLM으로 최종 답변 생성 (3가지 노드)
 """
 
 from typing import Dict, Any
-from jinja2 import Template
-from pathlib import Path
 
 from ...config.logger import get_logger
 from ...observability import trace_llm_call
 from ...llm import get_openai_client
+from ...prompts import load_template
 
 logger = get_logger()
 
+# 프롬프트 템플릿 (import 시 한 번만 읽고 컴파일)
+DOCS_ONLY_TEMPLATE = load_template("policy_qa_docs_only_prompt.jinja2")
+WEB_ONLY_TEMPLATE = load_template("policy_qa_web_only_prompt.jinja2")
+HYBRID_TEMPLATE = load_template("policy_qa_hybrid_prompt.jinja2")
+
 
 @trace_llm_call(name="generate_answer_with_docs", tags=["node", "llm", "answer", "docs_only"])
 def generate_answer_with_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -26,7 +30,7 @@ def generate_answer_with_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: 현재 상태
     
     Returns:
-        Dict: 업데이트된 상태 (answer, evidence 추가)
+        Dict: 부분 업데이트 (answer, evidence 추가)
     """
     try:
         current_query = state.get("current_query", "")
@@ -34,15 +38,8 @@ def generate_answer_with_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
         retrieved_docs = state.get("retrieved_docs", [])
         messages = state.get("messages", [])
         
-        # Load prompt template
-        prompt_path = Path(__file__).parent.parent.parent / "prompts" / "policy_qa_docs_only_prompt.jinja2"
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            template_str = f.read()
-        
-        template = Template(template_str)
-        
         # Render prompt
-        prompt = template.render(
+        prompt = DOCS_ONLY_TEMPLATE.render(
             policy_name=policy_info.get("name", ""),
             policy_overview=policy_info.get("overview", ""),
             apply_target=policy_info.get("apply_target", ""),
@@ -83,7 +80,6 @@ def generate_answer_with_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
         )
         
         return {
-            **state,
             "answer": answer,
             "evidence": evidence
         }
@@ -95,7 +91,6 @@ def generate_answer_with_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
             exc_info=True
         )
         return {
-            **state,
             "answer": f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(e)}",
             "evidence": [],
             "error": str(e)
@@ -113,7 +108,7 @@ def generate_answer_web_only_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: 현재 상태
     
     Returns:
-        Dict: 업데이트된 상태 (answer, evidence 추가)
+        Dict: 부분 업데이트 (answer, evidence 추가)
     """
     try:
         current_query = state.get("current_query", "")
@@ -121,15 +116,8 @@ def generate_answer_web_only_node(state: Dict[str, Any]) -> Dict[str, Any]:
         web_sources = state.get("web_sources", [])
         messages = state.get("messages", [])
         
-        # Load prompt template
-        prompt_path = Path(__file__).parent.parent.parent / "prompts" / "policy_qa_web_only_prompt.jinja2"
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            template_str = f.read()
-        
-        template = Template(template_str)
-        
         # Render prompt
-        prompt = template.render(
+        prompt = WEB_ONLY_TEMPLATE.render(
             policy_name=policy_info.get("name", ""),
             web_sources=web_sources,
             user_question=current_query,
@@ -166,7 +154,6 @@ def generate_answer_web_only_node(state: Dict[str, Any]) -> Dict[str, Any]:
         )
         
         return {
-            **state,
             "answer": answer,
             "evidence": evidence
         }
@@ -178,7 +165,6 @@ def generate_answer_web_only_node(state: Dict[str, Any]) -> Dict[str, Any]:
             exc_info=True
         )
         return {
-            **state,
             "answer": f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(e)}",
             "evidence": [],
             "error": str(e)
@@ -196,7 +182,7 @@ def generate_answer_hybrid_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: 현재 상태
     
     Returns:
-        Dict: 업데이트된 상태 (answer, evidence 추가)
+        Dict: 부분 업데이트 (answer, evidence 추가)
     """
     try:
         current_query = state.get("current_query", "")
@@ -205,15 +191,8 @@ def generate_answer_hybrid_node(state: Dict[str, Any]) -> Dict[str, Any]:
         web_sources = state.get("web_sources", [])
         messages = state.get("messages", [])
         
-        # Load prompt template
-        prompt_path = Path(__file__).parent.parent.parent / "prompts" / "policy_qa_hybrid_prompt.jinja2"
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            template_str = f.read()
-        
-        template = Template(template_str)
-        
         # Render prompt
-        prompt = template.render(
+        prompt = HYBRID_TEMPLATE.render(
             policy_name=policy_info.get("name", ""),
             policy_overview=policy_info.get("overview", ""),
             apply_target=policy_info.get("apply_target", ""),
@@ -269,7 +248,6 @@ def generate_answer_hybrid_node(state: Dict[str, Any]) -> Dict[str, Any]:
         )
         
         return {
-            **state,
             "answer": answer,
             "evidence": evidence
         }
@@ -281,7 +259,6 @@ def generate_answer_hybrid_node(state: Dict[str, Any]) -> Dict[str, Any]:
             exc_info=True
         )
         return {
-            **state,
             "answer": f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(e)}",
             "evidence": [],
             "error": str(e)
@@ -4,6 +4,9 @@ Check Sufficiency Node
 """
 
 from typing import Dict, Any
+
+import numpy as np
+
 from ...config.logger import get_logger
 from ...observability import trace_workflow
 
@@ -23,7 +26,7 @@ def check_sufficiency_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: 현재 상태
     
     Returns:
-        Dict: 업데이트된 상태
+        Dict: 변경된 키만 담은 부분 업데이트 (LangGraph가 상태에 병합)
     """
     try:
         retrieved_docs = state.get("retrieved_docs", [])
@@ -33,7 +36,7 @@ def check_sufficiency_node(state: Dict[str, Any]) -> Dict[str, Any]:
         # Already flagged for web search
         if need_web_search:
             logger.info("Web search already flagged by classifier")
-            return state
+            return {"need_web_search": True}
         
         # 웹 컨텍스트인 경우 1개 문서만 있어도 충분
         if context_type == "web":
@@ -43,23 +46,30 @@ def check_sufficiency_node(state: Dict[str, Any]) -> Dict[str, Any]:
                     extra={"count": len(retrieved_docs), "context_type": "web"}
                 )
                 return {
-                    **state,
                     "need_web_search": False
                 }
         
+        # 점수 배열 (load_cached_docs 에서 생성, 없으면 문서에서 추출)
+        scores = state.get("retrieved_scores")
+        if scores is None:
+            scores = np.fromiter(
+                (doc.get("score", 0.0) for doc in retrieved_docs),
+                dtype=np.float32,
+                count=len(retrieved_docs)
+            )
+        
         # Check document count (정책 문서의 경우)
-        if len(retrieved_docs) < 2:
+        if scores.size < 2:
             logger.info(
                 "Insufficient documents retrieved",
-                extra={"count": len(retrieved_docs)}
+                extra={"count": int(scores.size)}
             )
             return {
-                **state,
                 "need_web_search": True
             }
         
         # Check average score
-        avg_score = sum(doc.get("score", 0.0) for doc in retrieved_docs) / len(retrieved_docs)
+        avg_score = float(scores.mean())
         
         if avg_score < 0.75:
             logger.info(
@@ -67,7 +77,6 @@ def check_sufficiency_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 extra={"avg_score": avg_score}
             )
             return {
-                **state,
                 "need_web_search": True
             }
         
@@ -80,7 +89,6 @@ def check_sufficiency_node(state: Dict[str, Any]) -> Dict[str, Any]:
         )
         
         return {
-            **state,
             "need_web_search": False
         }
         
@@ -91,7 +99,6 @@ def check_sufficiency_node(state: Dict[str, Any]) -> Dict[str, Any]:
             exc_info=True
         )
         return {
-            **state,
             "need_web_search": False,
             "error": str(e)
         }
@@ -1,12 +1,11 @@
 import json
 import re
 from typing import Dict, Any, Optional, Tuple, List
-from jinja2 import Template
-from pathlib import Path
 
 from ...config.logger import get_logger
 from ...observability import trace_workflow, trace_llm_call
 from ...llm import get_openai_client
+from ...prompts import load_template
 from ...db.engine import get_db
 from ...db.models import Policy
 
@@ -78,59 +77,98 @@ def _safe_json_loads(s: str) -> Any:
 def _normalize_text(x: str) -> str:
     return re.sub(r"\s+", " ", (x or "").strip()).lower()
 
+_JUDGE_SYSTEM_PROMPT = "당신은 정책 자격 조건 판정 전문가입니다. JSON 형식으로만 응답하세요."
+
+
+def _build_judge_messages(condition: Dict[str, Any], user_answer: str) -> Optional[List[Dict[str, str]]]:
+    """
+    판정용 LLM 메시지 생성 (템플릿이 없으면 None)
+    """
+    # Load prompt template (컴파일된 템플릿 재사용)
+    template = load_template("eligibility_judge.jinja2")
+    if template is None:
+        return None
+
+    prompt = template.render(
+        condition_name=condition.get("name", ""),
+        condition_description=condition.get("description", ""),
+        condition_type=condition.get("type", ""),
+        condition_value=condition.get("value", ""),
+        user_answer=user_answer
+    )
+
+    return [
+        {"role": "system", "content": _JUDGE_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
+
+def _parse_judgement(response: Any) -> Tuple[str, str]:
+    """
+    LLM 판정 응답 -> (status, reason)
+    """
+    response_clean = _extract_json_from_llm_response(response if isinstance(response, str) else response.content)
+    result = _safe_json_loads(response_clean)
+
+    status = result.get("status", "UNKNOWN")
+    reason = result.get("reason", "")
+
+    # Validate status
+    if status not in ("PASS", "FAIL", "UNKNOWN"):
+        status = "UNKNOWN"
+
+    return status, reason
+
 def _judge_with_llm(condition: Dict[str, Any], user_answer: str) -> Tuple[str, str]:
     """
     LLM을 사용하여 사용자 답변이 조건을 충족하는지 판정
     """
     try:
-        # Load prompt template
-        prompt_path = Path(__file__).parent.parent.parent / "prompts" / "eligibility_judge.jinja2"
-        if not prompt_path.exists():
+        messages = _build_judge_messages(condition, user_answer)
+        if messages is None:
             logger.warning("eligibility_judge.jinja2 not found, falling back to UNKNOWN")
             return "UNKNOWN", "판정 프롬프트를 찾을 수 없습니다."
 
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            template_str = f.read()
-
-        template = Template(template_str)
-        prompt = template.render(
-            condition_name=condition.get("name", ""),
-            condition_description=condition.get("description", ""),
-            condition_type=condition.get("type", ""),
-            condition_value=condition.get("value", ""),
-            user_answer=user_answer
-        )
-
         # Call LLM
         llm_client = get_openai_client()
-        response = llm_client.generate(
-            messages=[
-                {"role": "system", "content": "당신은 정책 자격 조건 판정 전문가입니다. JSON 형식으로만 응답하세요."},
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.0,
-        )
+        response = llm_client.generate(messages=messages, temperature=0.0)
 
-        # Parse response
-        response_clean = _extract_json_from_llm_response(response if isinstance(response, str) else response.content)
-        result = _safe_json_loads(response_clean)
+        return _parse_judgement(response)
 
-        status = result.get("status", "UNKNOWN")
-        reason = result.get("reason", "")
+    except Exception as e:
+        logger.error(f"LLM judgment failed: {e}", exc_info=True)
+        return "UNKNOWN", f"LLM 판정 중 오류 발생: {str(e)}"
 
-        # Validate status
-        if status not in ("PASS", "FAIL", "UNKNOWN"):
-            status = "UNKNOWN"
+def _judge_batch_with_llm(pairs: List[Tuple[Dict[str, Any], str]]) -> List[Tuple[str, str]]:
+    """
+    여러 (조건, 사용자 답변) 쌍을 한 번의 배치 LLM 호출로 판정
+    """
+    try:
+        messages_list = [_build_judge_messages(condition, user_answer) for condition, user_answer in pairs]
+        if any(messages is None for messages in messages_list):
+            logger.warning("eligibility_judge.jinja2 not found, falling back to UNKNOWN")
+            return [("UNKNOWN", "판정 프롬프트를 찾을 수 없습니다.")] * len(pairs)
 
-        return status, reason
+        llm_client = get_openai_client()
+        responses = llm_client.generate_batch(messages_list, temperature=0.0)
 
     except Exception as e:
-        logger.error(f"LLM judgment failed: {e}", exc_info=True)
-        return "UNKNOWN", f"LLM 판정 중 오류 발생: {str(e)}"
+        logger.error(f"LLM batch judgment failed: {e}", exc_info=True)
+        return [("UNKNOWN", f"LLM 판정 중 오류 발생: {str(e)}")] * len(pairs)
 
-def _judge_with_slot(condition: Dict[str, Any], user_slots: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    results = []
+    for response in responses:
+        try:
+            if isinstance(response, Exception):
+                raise response
+            results.append(_parse_judgement(response))
+        except Exception as e:
+            logger.error(f"LLM judgment failed: {e}", exc_info=True)
+            results.append(("UNKNOWN", f"LLM 판정 중 오류 발생: {str(e)}"))
+    return results
+
+def _slot_answer(condition: Dict[str, Any], user_slots: Dict[str, Any]) -> Optional[str]:
     """
-    condition + user_slots -> PASS/UNKNOWN/FAIL 판정 (LLM 기반)
+    condition 에 대응하는 user_slots 답변 (없으면 None)
     """
     ctype = condition.get("type")
     
@@ -139,11 +177,20 @@ def _judge_with_slot(condition: Dict[str, Any], user_slots: Dict[str, Any]) -> T
     if not slot_key:
         slot_key = ctype or condition.get("name") or "unknown"
 
-    # 사용자 답변이 없으면 UNKNOWN
     if slot_key not in user_slots or user_slots.get(slot_key) in (None, ""):
-        return "UNKNOWN", None
+        return None
+
+    return str(user_slots.get(slot_key))
 
-    user_answer = str(user_slots.get(slot_key))
+def _judge_with_slot(condition: Dict[str, Any], user_slots: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """
+    condition + user_slots -> PASS/UNKNOWN/FAIL 판정 (LLM 기반)
+    """
+    user_answer = _slot_answer(condition, user_slots)
+
+    # 사용자 답변이 없으면 UNKNOWN
+    if user_answer is None:
+        return "UNKNOWN", None
 
     # LLM으로 판정
     status, reason = _judge_with_llm(condition, user_answer)
@@ -171,11 +218,8 @@ def parse_conditions_node(state: Dict[str, Any]) -> Dict[str, Any]:
             }
 
         # Load prompt template
-        prompt_path = Path(__file__).parent.parent.parent / "prompts" / "eligibility_prompt.jinja2"
-        if prompt_path.exists():
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                template_str = f.read()
-            template = Template(template_str)
+        template = load_template("eligibility_prompt.jinja2")
+        if template is not None:
             prompt = template.render(apply_target=apply_target)
         else:
             prompt = f"다음 텍스트에서 지원 자격 조건을 JSON으로 추출하시오: {apply_target}"
@@ -264,15 +308,26 @@ def check_existing_slots_node(state: Dict[str, Any]) -> Dict[str, Any]:
         if not conditions:
             return {"current_condition_index": 0}
 
+        pending = []
         for condition in conditions:
             # 이미 판정된 것은 스킵
             if condition.get("status") in ("PASS", "FAIL"):
                 continue
 
-            status, reason = _judge_with_slot(condition, user_slots)
+            user_answer = _slot_answer(condition, user_slots)
+            if user_answer is None:
+                condition["status"] = "UNKNOWN"
+                condition["reason"] = None
+                continue
+
+            pending.append((condition, user_answer))
 
-            condition["status"] = status
-            condition["reason"] = reason
+        # 답변이 있는 조건들은 한 번의 배치 호출로 동시에 판정
+        if pending:
+            judgements = _judge_batch_with_llm(pending)
+            for (condition, _), (status, reason) in zip(pending, judgements):
+                condition["status"] = status
+                condition["reason"] = reason
 
         return {**state, "conditions": conditions, "current_condition_index": 0}
 
@@ -368,16 +423,12 @@ def generate_question_node(state: Dict[str, Any]) -> Dict[str, Any]:
         policy_name = ""
         if policy_id:
             with get_db() as db:
-                policy = db.query(Policy).filter(Policy.id == policy_id).first()
-                if policy:
-                    policy_name = policy.program_name
+                # 정책명 컬럼만 조회
+                policy_name = db.query(Policy.program_name).filter(Policy.id == policy_id).scalar() or ""
 
         # Load prompt template
-        prompt_path = Path(__file__).parent.parent.parent / "prompts" / "eligibility_question.jinja2"
-        if prompt_path.exists():
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                template_str = f.read()
-            template = Template(template_str)
+        template = load_template("eligibility_question.jinja2")
+        if template is not None:
             prompt = template.render(
                 policy_name=policy_name,
                 condition_name=next_condition.get("name"),
@@ -527,10 +578,11 @@ def final_decision_node(state: Dict[str, Any]) -> Dict[str, Any]:
         # DB에서 문의처 정보 가져오기 (UNKNOWN일 때 유용)
         if final_result_mapped == "UNKNOWN" and policy_id:
              with get_db() as db:
-                policy = db.query(Policy).filter(Policy.id == policy_id).first()
-                if policy:
-                    agency = policy.contact_agency or ""
-                    number = policy.contact_number or ""
+                # 문의처 컬럼만 조회
+                contact = db.query(Policy.contact_agency, Policy.contact_number).filter(Policy.id == policy_id).first()
+                if contact:
+                    agency = contact.contact_agency or ""
+                    number = contact.contact_number or ""
                     if agency or number:
                         reason += f" (문의: {agency} {number})"
 
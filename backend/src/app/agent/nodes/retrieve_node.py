@@ -4,6 +4,9 @@ Retrieve Node
 """
 
 from typing import Dict, Any, List
+
+import numpy as np
+
 from ...config.logger import get_logger
 from ...observability import trace_retrieval
 from ...cache import get_policy_cache
@@ -27,7 +30,7 @@ def load_cached_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: 현재 상태
     
     Returns:
-        Dict: 업데이트된 상태 (retrieved_docs, policy_info 추가)
+        Dict: 부분 업데이트 (retrieved_docs, policy_info 추가)
     """
     try:
         session_id = state.get("session_id")
@@ -35,7 +38,6 @@ def load_cached_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
         if not session_id:
             logger.error("No session_id provided")
             return {
-                **state,
                 "retrieved_docs": [],
                 "policy_info": {},
                 "error": "세션 ID가 없습니다."
@@ -52,7 +54,6 @@ def load_cached_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 extra={"session_id": session_id}
             )
             return {
-                **state,
                 "retrieved_docs": [],
                 "policy_info": {},
                 "error": error_msg
@@ -64,18 +65,32 @@ def load_cached_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
         context_type = policy_context.get("type", "policy")  # "policy" or "web"
         
         # Format documents for LLM
-        retrieved_docs = []
-        for doc in documents:
-            payload = doc.get("payload", {}) if isinstance(doc, dict) and "payload" in doc else doc
-            retrieved_docs.append({
-                "content": payload.get("content", ""),
-                "doc_type": payload.get("doc_type", ""),
-                "policy_id": payload.get("policy_id"),
-                "chunk_index": payload.get("chunk_index", 0),
-                "score": payload.get("score", 1.0),  # 캐시된 문서는 정책 전체이므로 최고 점수 부여
-                "source": payload.get("source", ""),  # 웹 공고 URL 포함
-                "url": payload.get("url", "")  # URL 필드도 포함
-            })
+        # 캐시된 컨텍스트는 세션 동안 바뀌지 않으므로 변환 결과를 컨텍스트에 저장해 재사용
+        formatted = policy_context.get("_formatted_docs")
+        if formatted is None:
+            retrieved_docs = []
+            for doc in documents:
+                payload = doc.get("payload", {}) if isinstance(doc, dict) and "payload" in doc else doc
+                retrieved_docs.append({
+                    "content": payload.get("content", ""),
+                    "doc_type": payload.get("doc_type", ""),
+                    "policy_id": payload.get("policy_id"),
+                    "chunk_index": payload.get("chunk_index", 0),
+                    "score": payload.get("score", 1.0),  # 캐시된 문서는 정책 전체이므로 최고 점수 부여
+                    "source": payload.get("source", ""),  # 웹 공고 URL 포함
+                    "url": payload.get("url", "")  # URL 필드도 포함
+                })
+            
+            # 충분성 판단용 점수 배열 (문서 dict 를 다시 순회하지 않도록 한 번에 생성)
+            retrieved_scores = np.fromiter(
+                (doc["score"] for doc in retrieved_docs),
+                dtype=np.float32,
+                count=len(retrieved_docs)
+            )
+            formatted = (retrieved_docs, retrieved_scores)
+            policy_cache.set_formatted_docs(session_id, documents, formatted)
+        
+        retrieved_docs, retrieved_scores = formatted
         
         logger.info(
             "Documents loaded from cache",
@@ -88,8 +103,8 @@ def load_cached_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
         )
         
         return {
-            **state,
             "retrieved_docs": retrieved_docs,
+            "retrieved_scores": retrieved_scores,
             "policy_info": policy_info,
             "context_type": context_type  # ✨ 컨텍스트 타입 추가
         }
@@ -101,7 +116,6 @@ def load_cached_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
             exc_info=True
         )
         return {
-            **state,
             "retrieved_docs": [],
             "policy_info": {},
             "error": str(e)
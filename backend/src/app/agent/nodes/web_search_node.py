@@ -3,7 +3,7 @@ Web Search Node
 DuckDuckGo/Tavily로 웹 검색 수행
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import date
 from ...config.logger import get_logger
 from ...config import get_settings
@@ -13,6 +13,28 @@ from ...web_search.clients.tavily_client import get_tavily_client
 logger = get_logger()
 settings = get_settings()
 
+# DuckDuckGo 클라이언트 (내부 httpx 커넥션을 요청 간 재사용)
+_ddgs: Optional[Any] = None
+
+
+def _get_ddgs() -> Any:
+    """
+    공유 DuckDuckGo 검색 클라이언트 반환
+    
+    호출마다 `with DDGS()`로 새 커넥션을 열지 않고 keep-alive 커넥션을 재사용합니다.
+    
+    Returns:
+        DDGS: DuckDuckGo 검색 클라이언트
+    
+    Raises:
+        ImportError: duckduckgo_search 미설치 시
+    """
+    global _ddgs
+    if _ddgs is None:
+        from duckduckgo_search import DDGS
+        _ddgs = DDGS()
+    return _ddgs
+
 
 @trace_tool(name="web_search", tags=["node", "web-search"])
 def web_search_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -23,7 +45,7 @@ def web_search_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: 현재 상태
     
     Returns:
-        Dict: 업데이트된 상태 (web_sources 추가)
+        Dict: 부분 업데이트 (web_sources, LangGraph가 상태에 병합)
     """
     try:
         current_query = state.get("current_query", "")
@@ -32,7 +54,6 @@ def web_search_node(state: Dict[str, Any]) -> Dict[str, Any]:
         if not current_query:
             logger.warning("No query provided for web search")
             return {
-                **state,
                 "web_sources": []
             }
         
@@ -50,13 +71,14 @@ def web_search_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 )
                 
                 # Format Tavily results
+                today = date.today().isoformat()
                 for result in results:
                     web_sources.append({
                         "url": result.get("url", ""),
                         "title": result.get("title", ""),
                         "snippet": result.get("content", ""),
                         "score": result.get("score", 0.0),
-                        "fetched_date": date.today().isoformat(),
+                        "fetched_date": today,
                         "source_type": "tavily"
                     })
                 
@@ -69,7 +91,6 @@ def web_search_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 )
                 
                 return {
-                    **state,
                     "web_sources": web_sources
                 }
                 
@@ -81,22 +102,20 @@ def web_search_node(state: Dict[str, Any]) -> Dict[str, Any]:
         
         # Fallback to DuckDuckGo
         try:
-            from duckduckgo_search import DDGS
-            
             # Perform search
-            with DDGS() as ddgs:
-                results = list(ddgs.text(
-                    current_query,
-                    max_results=3
-                ))
+            results = list(_get_ddgs().text(
+                current_query,
+                max_results=3
+            ))
             
             # Format web sources
+            today = date.today().isoformat()
             for result in results:
                 web_sources.append({
                     "url": result.get("href", ""),
                     "title": result.get("title", ""),
                     "snippet": result.get("body", ""),
-                    "fetched_date": date.today().isoformat(),
+                    "fetched_date": today,
                     "source_type": "duckduckgo"
                 })
             
@@ -109,14 +128,12 @@ def web_search_node(state: Dict[str, Any]) -> Dict[str, Any]:
             )
             
             return {
-                **state,
                 "web_sources": web_sources
             }
             
         except ImportError:
             logger.warning("DuckDuckGo search not available")
             return {
-                **state,
                 "web_sources": []
             }
         
@@ -127,7 +144,6 @@ def web_search_node(state: Dict[str, Any]) -> Dict[str, Any]:
             exc_info=True
         )
         return {
-            **state,
             "web_sources": [],
             "error": str(e)
         }
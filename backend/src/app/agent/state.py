@@ -18,6 +18,7 @@ class QAState(TypedDict):
         query_type: 질문 유형 (WEB_ONLY vs POLICY_QA)
         policy_info: 캐시된 정책 기본 정보
         retrieved_docs: 캐시에서 가져온 전체 문서 (Qdrant 검색 없음!)
+        retrieved_scores: retrieved_docs 점수 배열 (np.ndarray, float32)
         web_sources: 웹 검색 결과
         answer: 생성된 답변
         need_web_search: 웹 검색 필요 여부 (POLICY_QA에서 보완용)
@@ -35,6 +36,7 @@ class QAState(TypedDict):
     
     # 기존 필드
     retrieved_docs: List[Dict[str, Any]]  # 캐시에서 가져온 전체 문서
+    retrieved_scores: Any  # np.ndarray (float32), 충분성 판단용
     web_sources: List[Dict[str, Any]]
     answer: str
     need_web_search: bool  # POLICY_QA에서 웹 검색 보완 필요 여부
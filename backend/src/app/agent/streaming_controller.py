@@ -3,6 +3,7 @@ Streaming QA Controller
 스트리밍 방식 Q&A 처리 컨트롤러
 """
 
+import asyncio
 import json
 from typing import Dict, Any, AsyncGenerator
 
@@ -10,8 +11,8 @@ from ..config.logger import get_logger
 from ..cache import get_chat_cache, get_policy_cache
 from ..llm.openai_client import get_openai_client
 from ..prompts import render_template
-from .nodes import classify_query_type_node, load_cached_docs_node, check_sufficiency_node
-from ..web_search.clients.tavily_client import TavilyClient
+from .nodes import aclassify_query_type_node, load_cached_docs_node, check_sufficiency_node
+from ..web_search.clients.tavily_client import get_tavily_client
 
 logger = get_logger()
 chat_cache = get_chat_cache()
@@ -28,7 +29,7 @@ class StreamingQAController:
     
     def __init__(self):
         """Initialize streaming controller"""
-        self.tavily_client = TavilyClient()
+        self.tavily_client = get_tavily_client()
     
     async def process_query_stream(
         self,
@@ -62,7 +63,8 @@ class StreamingQAController:
             
             # 2. 쿼리 분류
             yield self._format_sse("status", {"step": "classifying", "message": "질문 분류 중..."})
-            state = classify_query_type_node(state)
+            # LLM 분류는 agenerate 로 호출하여 이벤트 루프를 막지 않음
+            state.update(await aclassify_query_type_node(state))
             query_type = state.get("query_type", "POLICY_QA")
             
             # 3. 문서 로드 또는 웹 검색
@@ -74,7 +76,7 @@ class StreamingQAController:
             else:
                 # 캐시에서 문서 로드
                 yield self._format_sse("status", {"step": "loading", "message": "문서 로드 중..."})
-                state = load_cached_docs_node(state)
+                state.update(load_cached_docs_node(state))
                 
                 # 캐시 미스 시 에러 이벤트 전송
                 if not state.get("retrieved_docs") or len(state.get("retrieved_docs", [])) == 0:
@@ -86,7 +88,7 @@ class StreamingQAController:
                     yield self._format_sse("error", {"message": error_msg, "code": "CACHE_MISS"})
                     return
                 
-                state = check_sufficiency_node(state)
+                state.update(check_sufficiency_node(state))
                 
                 need_web_search = state.get("need_web_search", False)
                 
@@ -205,10 +207,9 @@ class StreamingQAController:
             yield self._format_sse("error", {"message": str(e)})
     
     async def _search_web(self, query: str) -> list:
-        """웹 검색 수행"""
+        """웹 검색 수행 (동기 HTTP 호출이므로 워커 스레드에서 실행)"""
         try:
-            results = self.tavily_client.search(query, max_results=5)
-            return results.get("results", [])
+            return await asyncio.to_thread(self.tavily_client.search, query, max_results=5)
         except Exception as e:
             logger.error(f"Web search failed: {e}")
             return []
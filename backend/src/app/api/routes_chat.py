@@ -4,18 +4,18 @@ Q&A 멀티턴 대화 엔드포인트 (스트리밍 지원)
 """
 
 import uuid
-from fastapi import APIRouter, HTTPException
+import hashlib
+from datetime import datetime
+from typing import Optional, Union
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ..agent import AgentController
-from ..agent.streaming_controller import get_streaming_controller
 from ..domain.chat import ChatRequest, ChatResponse, SessionResetResponse
 from ..config.logger import get_logger
-from ..cache import get_policy_cache, get_chat_cache
+from ..cache import get_policy_cache, get_chat_cache, get_policy_snapshot
 from ..vector_store import get_qdrant_manager
-from ..db.engine import get_db
-from ..db.models import Policy
 
 logger = get_logger()
 router = APIRouter()
@@ -24,6 +24,17 @@ router = APIRouter()
 policy_cache = get_policy_cache()
 chat_cache = get_chat_cache()
 
+# init-policy 응답 캐시 정책 (세션별 데이터이므로 private)
+# 서버 세션 캐시가 세션당 하나의 정책만 보관하므로 매번 ETag 로 재검증 (304 로 저렴하게 응답)
+INIT_POLICY_CACHE_CONTROL = "private, no-cache"
+
+# SSE 응답 공통 헤더
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"  # Nginx 버퍼링 비활성화
+}
+
 
 # Request/Response models
 class InitPolicyRequest(BaseModel):
@@ -72,7 +83,7 @@ class CleanupResponse(BaseModel):
     description="특정 정책에 대한 멀티턴 Q&A를 수행합니다.",
     tags=["Chat"]
 )
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, http_request: Request):
     """
     Q&A 채팅 API
     
@@ -81,6 +92,7 @@ async def chat(request: ChatRequest):
     - Qdrant + MySQL 기반 RAG
     - 필요시 DuckDuckGo 웹 검색
     - 모든 답변에 근거(evidence) 제공
+    - `Accept: text/event-stream` 요청 시 SSE 로 토큰 단위 스트리밍
     
     **워크플로우:**
     1. classify_query: 질문 분류 (웹 검색 필요 여부)
@@ -102,8 +114,20 @@ async def chat(request: ChatRequest):
         # Generate session_id if not provided
         session_id = request.session_id or str(uuid.uuid4())
         
+        # SSE 요청이면 첫 토큰부터 바로 전송
+        if "text/event-stream" in http_request.headers.get("accept", ""):
+            return StreamingResponse(
+                AgentController.run_qa_stream(
+                    session_id=session_id,
+                    policy_id=request.policy_id,
+                    user_message=request.message
+                ),
+                media_type="text/event-stream",
+                headers=SSE_HEADERS
+            )
+        
         # Run Q&A workflow
-        result = AgentController.run_qa(
+        result = await AgentController.arun_qa(
             session_id=session_id,
             policy_id=request.policy_id,
             user_message=request.message
@@ -126,6 +150,114 @@ async def chat(request: ChatRequest):
         )
 
 
+def _compute_policy_etag(policy_id: int, updated_at: Optional[datetime]) -> str:
+    """
+    정책 문서 ETag 계산
+
+    정책이 재적재(updated_at 변경)되기 전까지 동일한 값을 반환합니다.
+
+    Args:
+        policy_id: 정책 ID
+        updated_at: 정책 수정 시각
+
+    Returns:
+        str: 따옴표로 감싼 ETag 값
+    """
+    stamp = updated_at.isoformat() if updated_at else ""
+    digest = hashlib.blake2b(
+        f"{policy_id}:{stamp}".encode(),
+        digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def _initialize_policy_context(
+    session_id: str,
+    policy_id: int,
+    http_request: Request,
+    response: Response
+) -> Union[InitPolicyResponse, Response]:
+    """
+    정책 문서를 세션 캐시에 적재 (POST/GET 공용)
+
+    If-None-Match 가 현재 ETag 와 같고 세션 캐시에 같은 정책이 남아 있으면
+    Qdrant scroll 없이 304 를 반환합니다.
+
+    Args:
+        session_id: 세션 ID
+        policy_id: 정책 ID
+        http_request: 원본 HTTP 요청 (If-None-Match 확인용)
+        response: 응답 객체 (ETag/Cache-Control 헤더 설정용)
+
+    Returns:
+        InitPolicyResponse 또는 304 Response
+    """
+    # 1. 정책 정보 조회 (TTL 캐시된 스냅샷)
+    policy = get_policy_snapshot(policy_id)
+    
+    if not policy:
+        raise HTTPException(
+            status_code=404,
+            detail=f"정책 ID {policy_id}를 찾을 수 없습니다."
+        )
+    
+    etag = _compute_policy_etag(policy_id, policy["updated_at"])
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": INIT_POLICY_CACHE_CONTROL
+    }
+    
+    # 브라우저 캐시가 유효하고 서버 세션 캐시도 살아 있으면 재적재 생략
+    if http_request.headers.get("If-None-Match") == etag:
+        cached = policy_cache.get_policy_context(session_id)
+        if cached and cached.get("policy_id") == policy_id:
+            logger.debug(
+                "Policy init not modified",
+                extra={"session_id": session_id, "policy_id": policy_id}
+            )
+            return Response(status_code=304, headers=cache_headers)
+    
+    policy_info = {
+        "name": policy["program_name"],
+        "overview": policy["program_overview"] or "",
+        "apply_target": policy["apply_target"] or "",
+        "support_description": policy["support_description"] or ""
+    }
+    
+    # 2. Qdrant에서 해당 정책의 모든 문서 가져오기 (벡터 검색 아님!)
+    qdrant_manager = get_qdrant_manager()
+    documents = qdrant_manager.get_all_documents(
+        filter_dict={"policy_id": policy_id}
+    )
+    
+    # 3. 캐시에 저장
+    policy_cache.set_policy_context(
+        session_id=session_id,
+        policy_id=policy_id,
+        policy_info=policy_info,
+        documents=documents
+    )
+    
+    logger.info(
+        "Policy initialized successfully",
+        extra={
+            "session_id": session_id,
+            "policy_id": policy_id,
+            "documents_count": len(documents)
+        }
+    )
+    
+    response.headers.update(cache_headers)
+    
+    return InitPolicyResponse(
+        session_id=session_id,
+        policy_id=policy_id,
+        status="initialized",
+        message="정책 문서가 로드되었습니다.",
+        documents_count=len(documents)
+    )
+
+
 @router.post(
     "/chat/init-policy",
     response_model=InitPolicyResponse,
@@ -133,13 +265,18 @@ async def chat(request: ChatRequest):
     description="사용자가 공고를 클릭했을 때 해당 정책의 전체 문서를 캐시에 저장합니다.",
     tags=["Chat"]
 )
-async def init_policy(request: InitPolicyRequest):
+async def init_policy(
+    request: InitPolicyRequest,
+    http_request: Request,
+    response: Response
+):
     """
     공고 선택 시 문서 초기화 API
     
     **기능:**
     - 공고 선택 시 정책 문서 전체를 캐시에 저장
     - 이후 질문에서는 Qdrant 검색 없이 캐시 재사용 (100배 빠름!)
+    - 응답에 ETag / Cache-Control 헤더 포함
     
     **예시:**
     ```json
@@ -150,55 +287,55 @@ async def init_policy(request: InitPolicyRequest):
     ```
     """
     try:
-        session_id = request.session_id
-        policy_id = request.policy_id
-        
-        # 1. DB에서 정책 정보 조회
-        with get_db() as db:
-            policy = db.query(Policy).filter(Policy.id == policy_id).first()
-            
-            if not policy:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"정책 ID {policy_id}를 찾을 수 없습니다."
-                )
-            
-            policy_info = {
-                "name": policy.program_name,
-                "overview": policy.program_overview or "",
-                "apply_target": policy.apply_target or "",
-                "support_description": policy.support_description or ""
-            }
-        
-        # 2. Qdrant에서 해당 정책의 모든 문서 가져오기 (벡터 검색 아님!)
-        qdrant_manager = get_qdrant_manager()
-        documents = qdrant_manager.get_all_documents(
-            filter_dict={"policy_id": policy_id}
+        return _initialize_policy_context(
+            request.session_id, request.policy_id, http_request, response
         )
         
-        # 3. 캐시에 저장
-        policy_cache.set_policy_context(
-            session_id=session_id,
-            policy_id=policy_id,
-            policy_info=policy_info,
-            documents=documents
-        )
-        
-        logger.info(
-            "Policy initialized successfully",
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(
+            "Error initializing policy",
             extra={
-                "session_id": session_id,
-                "policy_id": policy_id,
-                "documents_count": len(documents)
-            }
+                "session_id": request.session_id,
+                "policy_id": request.policy_id,
+                "error": str(e)
+            },
+            exc_info=True
         )
-        
-        return InitPolicyResponse(
-            session_id=session_id,
-            policy_id=policy_id,
-            status="initialized",
-            message="정책 문서가 로드되었습니다.",
-            documents_count=len(documents)
+        raise HTTPException(
+            status_code=500,
+            detail=f"정책 초기화 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get(
+    "/chat/init-policy/{policy_id}",
+    response_model=InitPolicyResponse,
+    summary="공고 선택 시 문서 초기화 (캐시 가능)",
+    description="init-policy 의 GET 버전. 브라우저가 ETag 로 재요청을 생략할 수 있습니다.",
+    tags=["Chat"]
+)
+async def init_policy_cacheable(
+    policy_id: int,
+    session_id: str,
+    http_request: Request,
+    response: Response
+):
+    """
+    공고 선택 시 문서 초기화 API (GET)
+    
+    POST 응답은 브라우저가 캐시하지 않으므로, 같은 공고로 돌아올 때
+    If-None-Match 조건부 요청이 가능하도록 GET 경로를 함께 제공합니다.
+    
+    **예시:**
+    ```
+    GET /chat/init-policy/5?session_id=abc-123
+    ```
+    """
+    try:
+        return _initialize_policy_context(
+            session_id, policy_id, http_request, response
         )
         
     except HTTPException:
@@ -207,8 +344,8 @@ async def init_policy(request: InitPolicyRequest):
         logger.error(
             "Error initializing policy",
             extra={
-                "session_id": request.session_id,
-                "policy_id": request.policy_id,
+                "session_id": session_id,
+                "policy_id": policy_id,
                 "error": str(e)
             },
             exc_info=True
@@ -441,18 +578,11 @@ async def chat_stream(request: ChatRequest):
             }
         )
         
-        # 스트리밍 컨트롤러 생성
-        controller = get_streaming_controller()
-        
         # 스트리밍 응답 생성
         return StreamingResponse(
-            controller.process_query_stream(session_id, policy_id, user_query),
+            AgentController.run_qa_stream(session_id, policy_id, user_query),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no"  # Nginx 버퍼링 비활성화
-            }
+            headers=SSE_HEADERS
         )
         
     except Exception as e:
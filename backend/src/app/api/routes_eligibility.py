@@ -8,8 +8,9 @@ from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 
 from ..config.logger import get_logger
+from ..cache import get_policy_snapshot
 from ..db.engine import get_db_session
-from ..db.models import Policy, ChecklistResult, Session as DBSession, WorkflowTypeEnum
+from ..db.models import ChecklistResult, Session as DBSession, WorkflowTypeEnum
 from ..domain.eligibility import (
     EligibilityStartRequest,
     EligibilityStartResponse,
@@ -61,12 +62,12 @@ async def start_eligibility_check(
         EligibilityStartResponse: 첫 번째 질문 포함
     """
     try:
-        # Get policy
-        policy = db.query(Policy).filter(Policy.id == request.policy_id).first()
+        # Get policy (TTL 캐시된 스냅샷)
+        policy = get_policy_snapshot(request.policy_id)
         if not policy:
             raise HTTPException(status_code=404, detail="정책을 찾을 수 없습니다.")
         
-        if not policy.apply_target:
+        if not policy["apply_target"]:
             raise HTTPException(status_code=400, detail="정책에 신청 대상 정보가 없습니다.")
         
         # Generate session ID
@@ -76,7 +77,7 @@ async def start_eligibility_check(
         result = run_eligibility_start(
             session_id=session_id,
             policy_id=request.policy_id,
-            apply_target=policy.apply_target
+            apply_target=policy["apply_target"]
         )
         
         # Save session to DB
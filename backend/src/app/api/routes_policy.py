@@ -3,19 +3,29 @@ Policy API Routes
 정책 검색 및 조회 API 라우터
 """
 
-from typing import Optional, List, Dict, Any
+import logging
+from typing import Optional, List, Dict, Any, Literal
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 from ..db.engine import get_db
 from ..services.policy_search_service import PolicySearchService
 from ..domain.policy import PolicyResponse
 from ..config.logger import get_logger
+from ..cache import TTLCache
 from ..agent.controller import AgentController
 
 logger = get_logger()
-router = APIRouter()
+# 목록/검색 응답이 커서 stdlib json 대신 orjson 으로 직렬화
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# 지역/카테고리 목록 캐시 ("regions" / "categories" -> 정렬된 목록)
+# 정책 데이터는 배치로 갱신되므로 요청마다 DISTINCT 조회할 필요 없음
+FACET_CACHE_TTL_SECONDS = 300
+_facet_cache: TTLCache[List[str]] = TTLCache(maxsize=2, ttl_seconds=FACET_CACHE_TTL_SECONDS)
 
 def get_db_session():
     """
@@ -31,7 +41,7 @@ def get_db_session():
 
 class ParsedQueryResponse(BaseModel):
     """분석된 쿼리 정보"""
-    intent: str = Field(default="policy_search", description="검색 의도")
+    intent: Literal["policy_search"] = Field(default="policy_search", description="검색 의도")
     keywords: List[str] = Field(default_factory=list, description="추출된 키워드")
     filters: Dict[str, Any] = Field(default_factory=dict, description="필터 조건")
     sort_preference: str = Field(default="relevance", description="정렬 선호도")
@@ -45,7 +55,7 @@ class WebSourceResponse(BaseModel):
     snippet: str = Field(..., description="요약")
     score: float = Field(default=0.0, description="점수")
     fetched_date: str = Field(..., description="조회일")
-    source_type: str = Field(..., description="소스 타입 (tavily/duckduckgo)")
+    source_type: Literal["tavily", "duckduckgo", "unknown"] = Field(..., description="소스 타입 (tavily/duckduckgo)")
 
 
 class SearchAgentPolicyResponse(BaseModel):
@@ -66,49 +76,30 @@ class SearchAgentPolicyResponse(BaseModel):
     contact_agency: Optional[str] = Field(None, description="연락처 기관")
     created_at: Optional[str] = Field(None, description="생성일")
     score: Optional[float] = Field(None, description="유사도 점수")
-    source_type: str = Field(default="internal", description="소스 타입 (internal/web)")
+    source_type: Literal["internal", "web"] = Field(default="internal", description="소스 타입 (internal/web)")
     url: Optional[str] = Field(None, description="웹 소스 URL (웹 결과인 경우)")
     favicon_url: Optional[str] = Field(None, description="파비콘 URL (웹 결과인 경우)")
     screenshot_url: Optional[str] = Field(None, description="스크린샷 URL (웹 결과인 경우)")
 
+    @field_validator("contact_agency", "application_method", mode="before")
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SearchAgentPolicyResponse":
-        """리스트를 문자열로 변환하여 생성"""
-        # contact_agency가 리스트인 경우 문자열로 변환
-        contact_agency = data.get("contact_agency")
-        if isinstance(contact_agency, list):
-            contact_agency = ", ".join(str(item) for item in contact_agency) if contact_agency else None
-        
-        # application_method가 리스트인 경우 문자열로 변환
-        application_method = data.get("application_method")
-        if isinstance(application_method, list):
-            application_method = ", ".join(str(item) for item in application_method) if application_method else None
-        
-        return cls(
-            id=data.get("id", 0),
-            program_id=data.get("program_id"),
-            program_name=data.get("program_name", ""),
-            program_overview=data.get("program_overview"),
-            region=data.get("region"),
-            category=data.get("category"),
-            support_description=data.get("support_description"),
-            support_budget=data.get("support_budget"),
-            support_scale=data.get("support_scale"),
-            supervising_ministry=data.get("supervising_ministry"),
-            apply_target=data.get("apply_target"),
-            announcement_date=data.get("announcement_date"),
-            application_method=application_method,
-            contact_agency=contact_agency,
-            created_at=data.get("created_at"),
-            score=data.get("score"),
-            source_type=data.get("source_type", "internal"),
-            url=data.get("url"),
-            favicon_url=data.get("favicon_url"),
-            screenshot_url=data.get("screenshot_url")
-        )
+    def join_list(cls, value: Any) -> Any:
+        """리스트(JSON 컬럼)는 쉼표로 이어 붙인 문자열로 변환"""
+        if isinstance(value, list):
+            if not value:
+                return None
+            try:
+                # 대부분 문자열 리스트이므로 str() 변환 없이 바로 결합
+                return ", ".join(value)
+            except TypeError:
+                return ", ".join(map(str, value))
+        return value
+
+    model_config = ConfigDict(from_attributes=True)
+
 
-    class Config:
-        from_attributes = True
+# 정책 리스트를 한 번에 검증/변환 (pydantic-core 에서 일괄 처리)
+_POLICIES_ADAPTER = TypeAdapter(List[SearchAgentPolicyResponse])
 
 
 class SearchMetricsResponse(BaseModel):
@@ -126,6 +117,11 @@ class SearchMetricsResponse(BaseModel):
     sufficiency_reason: str = Field(default="", description="충분성 판단 사유")
 
 
+# 기본값으로 채운 지표 템플릿 (요청마다 model_copy 로 존재하는 필드만 덮어씀)
+_EMPTY_METRICS = SearchMetricsResponse.model_construct()
+_METRICS_FIELDS = frozenset(SearchMetricsResponse.model_fields)
+
+
 class SearchEvidenceResponse(BaseModel):
     """검색 근거 정보"""
     policy_id: int = Field(..., description="정책 ID")
@@ -154,11 +150,8 @@ class SearchAgentResponse(BaseModel):
 # Search Endpoint (빠른 벡터 검색 - LLM 호출 없음)
 # =============================================================================
 
-@router.get(
-    "/search",
-    response_model=SearchAgentResponse,
-    summary="정책 검색 (빠른 벡터 검색)",
-    description="""
+# OpenAPI 문서용 설명 (모듈 상수로 분리)
+_SEARCH_DESCRIPTION = """
 빠른 정책 검색 API (LLM 호출 없음)
 
 **특징:**
@@ -177,11 +170,19 @@ class SearchAgentResponse(BaseModel):
 - `/api/v1/policies/search?query=프리랜서 지원금`
 - `/api/v1/policies/search?query=창업 지원&region=서울`
 - `/api/v1/policies/search?query=R&D&category=사업화`
-""",
+"""
+
+
+@router.get(
+    "/search",
+    # 응답 모델은 문서화에만 사용 (핸들러가 직접 검증된 모델을 만들어 반환)
+    responses={200: {"model": SearchAgentResponse}},
+    summary="정책 검색 (빠른 벡터 검색)",
+    description=_SEARCH_DESCRIPTION,
     tags=["Policies"]
 )
 async def search_policies_with_agent(
-    query: str = Query(..., description="검색 쿼리 (필수)", min_length=1),
+    query: str = Query("", description="검색 쿼리 (비우면 필터 조건만으로 최신 공고순 조회)"),
     session_id: Optional[str] = Query(None, description="세션 ID (선택, 미입력 시 자동 생성)"),
     region: Optional[str] = Query(None, description="지역 필터 (선택)"),
     category: Optional[str] = Query(None, description="카테고리 필터 (선택)"),
@@ -203,19 +204,20 @@ async def search_policies_with_agent(
     - 최고 유사도 >= 0.35
     """
     try:
-        logger.info(
-            "Search request received",
-            extra={
-                "query": query,
-                "session_id": session_id,
-                "region": region,
-                "category": category,
-                "target_group": target_group
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Search request received",
+                extra={
+                    "query": query,
+                    "session_id": session_id,
+                    "region": region,
+                    "category": category,
+                    "target_group": target_group
+                }
+            )
 
         # Run search via AgentController (uses SimpleSearchService)
-        result = AgentController.run_search(
+        result = await AgentController.arun_search(
             query=query,
             session_id=session_id,
             region=region,
@@ -230,15 +232,13 @@ async def search_policies_with_agent(
         metrics = result.get("metrics", {})
         evidence = result.get("evidence", [])
 
-        response = SearchAgentResponse(
+        # 서비스 결과는 신뢰된 dict 이므로 검증 없이 model_construct 로 조립
+        response = SearchAgentResponse.model_construct(
             session_id=result.get("session_id", ""),
             summary=result.get("summary", ""),
-            policies=[
-                SearchAgentPolicyResponse.from_dict(p)
-                for p in policies
-            ],
+            policies=_POLICIES_ADAPTER.validate_python(policies),
             total_count=result.get("total_count", 0),
-            parsed_query=ParsedQueryResponse(
+            parsed_query=ParsedQueryResponse.model_construct(
                 intent=parsed_query.get("intent", "policy_search"),
                 keywords=parsed_query.get("keywords", []),
                 filters=parsed_query.get("filters", {}),
@@ -249,7 +249,7 @@ async def search_policies_with_agent(
             is_sufficient=result.get("is_sufficient", False),
             sufficiency_reason=result.get("sufficiency_reason", ""),
             web_sources=[
-                WebSourceResponse(
+                WebSourceResponse.model_construct(
                     url=ws.get("url", ""),
                     title=ws.get("title", ""),
                     snippet=ws.get("snippet", ""),
@@ -259,21 +259,11 @@ async def search_policies_with_agent(
                 )
                 for ws in web_sources
             ],
-            metrics=SearchMetricsResponse(
-                total_candidates=metrics.get("total_candidates", 0),
-                filtered_count=metrics.get("filtered_count", 0),
-                final_count=metrics.get("final_count", 0),
-                top_score=metrics.get("top_score", 0.0),
-                avg_score=metrics.get("avg_score", 0.0),
-                min_score=metrics.get("min_score", 0.0),
-                score_threshold_used=metrics.get("score_threshold_used", 0.0),
-                web_search_triggered=metrics.get("web_search_triggered", False),
-                web_search_count=metrics.get("web_search_count", 0),
-                search_time_ms=metrics.get("search_time_ms", 0),
-                sufficiency_reason=metrics.get("sufficiency_reason", "")
+            metrics=_EMPTY_METRICS.model_copy(
+                update={k: v for k, v in metrics.items() if k in _METRICS_FIELDS}
             ) if metrics else None,
             evidence=[
-                SearchEvidenceResponse(
+                SearchEvidenceResponse.model_construct(
                     policy_id=e.get("policy_id", 0),
                     matched_content=e.get("matched_content", ""),
                     score=e.get("score", 0.0),
@@ -284,17 +274,20 @@ async def search_policies_with_agent(
             error=result.get("error")
         )
 
-        logger.info(
-            "Search request completed",
-            extra={
-                "session_id": response.session_id,
-                "total_count": response.total_count,
-                "is_sufficient": response.is_sufficient,
-                "search_time_ms": metrics.get("search_time_ms", 0)
-            }
-        )
-
-        return response
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Search request completed",
+                extra={
+                    "session_id": response.session_id,
+                    "total_count": response.total_count,
+                    "is_sufficient": response.is_sufficient,
+                    "search_time_ms": metrics.get("search_time_ms", 0)
+                }
+            )
+
+        # 모델에서 바로 JSON 바이트로 직렬화 (중간 dict 없이 pydantic-core 에서 처리)
+        # (Response 를 직접 반환하면 FastAPI 의 응답 모델 재검증/인코딩 단계를 건너뜀)
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except Exception as e:
         logger.error(
@@ -364,13 +357,21 @@ def get_regions(db: Session = Depends(get_db_session)):
     """
     정책에 등록된 모든 지역 목록을 조회합니다.
     """
+    cached = _facet_cache.get("regions")
+    if cached is not None:
+        return cached
+    
     try:
         from ..db.models import Policy
         
-        regions = db.query(Policy.region).filter(Policy.region.isnot(None)).distinct().all()
-        region_list = [r[0] for r in regions if r[0]]
+        # idx_region 인덱스로 DISTINCT 처리, Row 래핑 없이 스칼라로 조회
+        regions = db.execute(
+            select(Policy.region).where(Policy.region.isnot(None)).distinct()
+        ).scalars().all()
+        region_list = sorted(filter(None, regions))
         
-        return sorted(region_list)
+        _facet_cache.set("regions", region_list)
+        return region_list
     except Exception as e:
         logger.error("Error getting regions", extra={"error": str(e)}, exc_info=True)
         raise HTTPException(status_code=500, detail=f"지역 목록 조회 중 오류가 발생했습니다: {str(e)}")
@@ -381,22 +382,35 @@ def get_categories(db: Session = Depends(get_db_session)):
     """
     정책에 등록된 모든 카테고리 목록을 조회합니다.
     """
+    cached = _facet_cache.get("categories")
+    if cached is not None:
+        return cached
+    
     try:
         from ..db.models import Policy
         
-        categories = db.query(Policy.category).filter(Policy.category.isnot(None)).distinct().all()
-        category_list = [c[0] for c in categories if c[0]]
+        # idx_category 인덱스로 DISTINCT 처리, Row 래핑 없이 스칼라로 조회
+        categories = db.execute(
+            select(Policy.category).where(Policy.category.isnot(None)).distinct()
+        ).scalars().all()
+        category_list = sorted(filter(None, categories))
         
-        return sorted(category_list)
+        _facet_cache.set("categories", category_list)
+        return category_list
     except Exception as e:
         logger.error("Error getting categories", extra={"error": str(e)}, exc_info=True)
         raise HTTPException(status_code=500, detail=f"카테고리 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
 
-@router.get("/{policy_id}", response_model=PolicyResponse, summary="정책 상세 조회")
+@router.get(
+    "/{policy_id}",
+    responses={200: {"model": PolicyResponse}},
+    summary="정책 상세 조회"
+)
 def get_policy_detail(policy_id: int, db: Session = Depends(get_db_session)):
     service = PolicySearchService(db)
     policy = service.get_by_id(policy_id)
     if not policy:
         raise HTTPException(status_code=404, detail="해당 정책을 찾을 수 없습니다.")
-    return policy
\ No newline at end of file
+    # 서비스에서 타입을 맞춰 생성한 모델이므로 응답 재검증 없이 바로 JSON 바이트로 직렬화
+    return Response(content=policy.model_dump_json(), media_type="application/json")
\ No newline at end of file
@@ -7,7 +7,7 @@ from typing import Optional
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.orm import Session
 
 from ..config.logger import get_logger
@@ -33,8 +33,7 @@ class WebSourceResponse(BaseModel):
     fetched_date: Optional[str] = Field(None, description="조회일")
     created_at: str = Field(..., description="생성일")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================
@@ -5,11 +5,23 @@ Cache Module
 
 from .chat_cache import ChatCache, get_chat_cache
 from .policy_cache import PolicyCache, get_policy_cache
+from .ttl_cache import TTLCache
+from .policy_snapshot import (
+    get_policy_snapshot,
+    get_policy_row_cache,
+    invalidate_policy_snapshot,
+)
+from .sweeper import cache_sweeper
 
 __all__ = [
     "ChatCache",
     "PolicyCache",
+    "TTLCache",
     "get_chat_cache",
     "get_policy_cache",
+    "get_policy_snapshot",
+    "get_policy_row_cache",
+    "invalidate_policy_snapshot",
+    "cache_sweeper",
 ]
 
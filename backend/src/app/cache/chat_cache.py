@@ -5,9 +5,14 @@ Chat History Cache
 
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+import sys
 import threading
 
 
+# Python 3.13t (free-threaded) 에서는 GIL 이 비활성화될 수 있음
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
 class ChatCache:
     """
     대화 이력 캐시 (메모리)
@@ -55,22 +60,32 @@ class ChatCache:
             role: 메시지 역할 (user/assistant)
             content: 메시지 내용
         """
-        with self._lock:
-            if session_id not in self._cache:
-                self._cache[session_id] = []
-            
-            # 메시지 추가
-            self._cache[session_id].append({
-                "role": role,
-                "content": content,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            # 턴 제한 없음 (무제한 저장)
-            # 브라우저 탭 닫을 때 cleanup API가 호출되어 자동 삭제
-            
-            # 타임스탬프 업데이트
-            self._timestamps[session_id] = datetime.now()
+        if not _GIL_ENABLED:
+            # free-threaded 빌드에서는 원자성이 보장되지 않으므로 락 사용
+            with self._lock:
+                self._append_message(session_id, role, content)
+            return
+        
+        # GIL 하에서 dict.setdefault / list.append / dict 대입은 원자적
+        self._append_message(session_id, role, content)
+    
+    def _append_message(self, session_id: str, role: str, content: str):
+        """
+        메시지 추가 본체 (락 여부는 호출자가 결정)
+        
+        턴 제한 없음 (무제한 저장)
+        브라우저 탭 닫을 때 cleanup API가 호출되어 자동 삭제
+        """
+        now = datetime.now()
+        messages = self._cache.setdefault(session_id, [])
+        messages.append({
+            "role": role,
+            "content": content,
+            "timestamp": now.isoformat()
+        })
+        
+        # 타임스탬프 업데이트
+        self._timestamps[session_id] = now
     
     def clear_session(self, session_id: str):
         """
@@ -83,6 +98,24 @@ class ChatCache:
             self._cache.pop(session_id, None)
             self._timestamps.pop(session_id, None)
     
+    def purge_expired(self) -> int:
+        """
+        TTL 이 지난 세션 일괄 삭제 (백그라운드 스위퍼용)
+        
+        Returns:
+            int: 삭제된 세션 수
+        """
+        cutoff = datetime.now() - timedelta(seconds=self.TTL_SECONDS)
+        with self._lock:
+            # add_message 가 락 없이 쓰므로 스냅샷 후 순회
+            expired = [
+                sid for sid, ts in list(self._timestamps.items()) if ts < cutoff
+            ]
+            for sid in expired:
+                self._cache.pop(sid, None)
+                self._timestamps.pop(sid, None)
+        return len(expired)
+    
     def set_ttl(self, session_id: str, seconds: int):
         """
         TTL 설정 (백업용)
@@ -162,6 +162,28 @@ class PolicyCache:
             
             return context.copy() if context else None
     
+    def set_formatted_docs(
+        self,
+        session_id: str,
+        documents: List[Dict[str, Any]],
+        formatted: Any
+    ) -> None:
+        """
+        컨텍스트 문서를 LLM 용으로 변환한 결과를 원본 캐시 항목에 저장
+        
+        get_policy_context 는 복사본을 반환하므로 변환 결과는 이 메서드로 저장합니다.
+        그 사이 컨텍스트가 교체되었다면 (documents 가 다르면) 저장하지 않습니다.
+        
+        Args:
+            session_id: 세션 ID
+            documents: 변환에 사용한 컨텍스트 문서 리스트
+            formatted: 변환 결과 (retrieved_docs, retrieved_scores)
+        """
+        with self._lock:
+            context = self._cache.get(session_id)
+            if context is not None and context.get("documents") is documents:
+                context["_formatted_docs"] = formatted
+    
     def clear_policy_context(self, session_id: str):
         """
         정책 문서 캐시 제거 (대화창 나갈 때 호출)
@@ -183,6 +205,23 @@ class PolicyCache:
                     }
                 )
     
+    def purge_expired(self) -> int:
+        """
+        TTL 이 지난 세션 일괄 삭제 (백그라운드 스위퍼용)
+        
+        Returns:
+            int: 삭제된 세션 수
+        """
+        cutoff = datetime.now() - timedelta(seconds=self.TTL_SECONDS)
+        with self._lock:
+            expired = [
+                sid for sid, ts in self._timestamps.items() if ts < cutoff
+            ]
+            for sid in expired:
+                self._cache.pop(sid, None)
+                self._timestamps.pop(sid, None)
+        return len(expired)
+    
     def set_ttl(self, session_id: str, seconds: int):
         """
         TTL 설정 (백업용)
@@ -0,0 +1,107 @@
+"""
+Policy Snapshot Cache
+자주 조회되는 정책 행(Policy row) 스냅샷 TTL 캐시
+"""
+
+from typing import Dict, Any, Optional
+
+from ..config.logger import get_logger
+from ..db.engine import get_db
+from ..db.models import Policy
+from .ttl_cache import TTLCache
+
+logger = get_logger()
+
+SNAPSHOT_TTL_SECONDS = 300  # 5분
+SNAPSHOT_MAX_SIZE = 1024
+
+# policy_id -> 스냅샷
+_snapshots: TTLCache[Dict[str, Any]] = TTLCache(
+    maxsize=SNAPSHOT_MAX_SIZE, ttl_seconds=SNAPSHOT_TTL_SECONDS
+)
+
+# 검색 결과 조립용 정책 Row 캐시 (policy_id -> Row)
+_search_rows: TTLCache[Any] = TTLCache(maxsize=5000, ttl_seconds=SNAPSHOT_TTL_SECONDS)
+
+
+def _to_snapshot(policy: Policy) -> Dict[str, Any]:
+    """
+    ORM 객체를 세션과 무관한 dict 로 변환
+    
+    Args:
+        policy: Policy ORM 객체
+    
+    Returns:
+        Dict: 정책 스냅샷
+    """
+    return {
+        "id": policy.id,
+        "program_name": policy.program_name,
+        "program_overview": policy.program_overview,
+        "apply_target": policy.apply_target,
+        "support_description": policy.support_description,
+        "updated_at": policy.updated_at,
+    }
+
+
+def get_policy_snapshot(policy_id: int) -> Optional[Dict[str, Any]]:
+    """
+    정책 스냅샷 조회 (TTL 캐시)
+    
+    init-policy, 자격 확인 시작처럼 같은 정책을 반복 조회하는 경로에서
+    DB 왕복을 줄이기 위해 사용합니다. 존재하지 않는 정책은 캐시하지 않습니다.
+    
+    Args:
+        policy_id: 정책 ID
+    
+    Returns:
+        Optional[Dict]: 정책 스냅샷, 없으면 None
+    """
+    snapshot = _snapshots.get(policy_id)
+    if snapshot is not None:
+        return snapshot
+    
+    with get_db() as db:
+        policy = db.query(Policy).filter(Policy.id == policy_id).first()
+        if not policy:
+            return None
+        snapshot = _to_snapshot(policy)
+    
+    _snapshots.set(policy_id, snapshot)
+    
+    return snapshot
+
+
+def get_policy_row_cache() -> TTLCache[Any]:
+    """
+    검색 결과 조립용 정책 Row 캐시 반환
+    
+    검색 상위 정책은 쿼리가 달라도 자주 겹치므로 policy_id 별 Row 를
+    보관하여 MySQL 조회를 캐시 미스 ID 로만 줄입니다.
+    
+    Returns:
+        TTLCache: policy_id -> Row 캐시
+    """
+    return _search_rows
+
+
+def invalidate_policy_snapshot(policy_id: Optional[int] = None):
+    """
+    정책 스냅샷 무효화 (정책 수정/삭제 시 호출)
+    
+    검색용 정책 Row 캐시도 함께 무효화합니다.
+    
+    Args:
+        policy_id: 정책 ID (None 이면 전체 삭제)
+    """
+    if policy_id is None:
+        _snapshots.clear()
+        _search_rows.clear()
+    else:
+        _snapshots.pop(policy_id)
+        _search_rows.pop(policy_id)
+    
+    logger.debug(
+        "Policy snapshot invalidated",
+        extra={"policy_id": policy_id}
+    )
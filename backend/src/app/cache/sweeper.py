@@ -0,0 +1,50 @@
+"""
+Cache Sweeper
+만료된 세션 캐시를 주기적으로 정리하는 백그라운드 작업
+"""
+
+import asyncio
+
+from ..config.logger import get_logger
+from .chat_cache import get_chat_cache
+from .policy_cache import get_policy_cache
+
+logger = get_logger()
+
+SWEEP_INTERVAL_SECONDS = 900  # 15분
+
+
+async def cache_sweeper(interval_seconds: int = SWEEP_INTERVAL_SECONDS):
+    """
+    만료 세션 정리 루프
+    
+    get_* 호출 시에만 TTL 을 확인하면 버려진 세션이 영구히 남으므로,
+    주기적으로 전체 세션을 스캔하여 TTL 이 지난 항목을 제거합니다.
+    
+    Args:
+        interval_seconds: 스캔 주기 (초)
+    """
+    chat_cache = get_chat_cache()
+    policy_cache = get_policy_cache()
+    
+    while True:
+        await asyncio.sleep(interval_seconds)
+        
+        try:
+            chat_purged = chat_cache.purge_expired()
+            policy_purged = policy_cache.purge_expired()
+            
+            if chat_purged or policy_purged:
+                logger.info(
+                    "Expired cache sessions purged",
+                    extra={
+                        "chat_sessions": chat_purged,
+                        "policy_sessions": policy_purged
+                    }
+                )
+        except Exception as e:
+            logger.error(
+                "Cache sweep failed",
+                extra={"error": str(e)},
+                exc_info=True
+            )
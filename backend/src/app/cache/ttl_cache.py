@@ -0,0 +1,78 @@
+"""
+TTL Cache
+크기 제한 + 만료 시간을 가진 범용 메모리 캐시 (LRU 교체)
+"""
+
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+import threading
+import time
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    스레드 안전 TTL + LRU 캐시
+    
+    maxsize 를 넘으면 가장 오래 사용하지 않은 항목부터 제거하고,
+    ttl_seconds 가 지난 항목은 조회 시 미스로 처리합니다.
+    
+    Attributes:
+        maxsize: 최대 항목 수
+        ttl_seconds: 항목 유효 시간 (초)
+    """
+    
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Optional[V]:
+        """
+        캐시 조회
+        
+        Args:
+            key: 캐시 키
+            default: 미스 시 반환값
+        
+        Returns:
+            캐시된 값 또는 default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key: Hashable, value: V):
+        """
+        캐시 저장
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable):
+        """항목 제거"""
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self):
+        """전체 제거"""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     environment: str = "development"
     debug: bool = True
     port: int = 8000
+    threadpool_size: int = 40  # sync 라우트(anyio) 및 asyncio.to_thread(기본 executor) 워커 스레드 수
     
     # Database (MySQL)
     database_url: str
@@ -57,11 +58,16 @@ class Settings(BaseSettings):
     retrieval_top_k: int = 5
     retrieval_score_threshold: float = 0.7
     
+    # BM25 index cache
+    bm25_cache_path: str = ".bm25_cache/bm25_index.pkl"
+    bm25_cache_ttl_seconds: int = 86400  # 경과 시 백그라운드 재구축
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True  # 프로세스 전역에서 공유하는 단일 인스턴스이므로 변경 금지
     )
 
 
@@ -6,7 +6,7 @@ SQLAlchemy 엔진 및 세션 관리
 from typing import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, Session as SASession
 from sqlalchemy.pool import QueuePool
 
@@ -55,6 +55,9 @@ def init_db() -> None:
         # Create all tables
         Base.metadata.create_all(bind=engine)
         
+        # create_all 은 기존 테이블에 인덱스를 추가하지 않으므로 별도 확인
+        ensure_fulltext_index()
+        
         logger.info("Database tables initialized successfully")
     except Exception as e:
         logger.error(
@@ -65,6 +68,33 @@ def init_db() -> None:
         raise
 
 
+def ensure_fulltext_index() -> None:
+    """
+    policies.ft_search (ngram) FULLTEXT 인덱스가 없으면 추가 (멱등)
+    
+    001_init.sql 이전에 만들어진 DB 를 위한 마이그레이션입니다.
+    실패해도 기동은 계속하며, 검색은 LIKE 로 대체됩니다 (PolicyRepository.search).
+    """
+    try:
+        indexes = inspect(engine).get_indexes("policies")
+        if any(index["name"] == "ft_search" for index in indexes):
+            return
+        
+        logger.info("Adding FULLTEXT index ft_search to policies")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE policies "
+                "ADD FULLTEXT INDEX ft_search (program_name, program_overview) WITH PARSER ngram"
+            ))
+        logger.info("FULLTEXT index ft_search added")
+    except Exception as e:
+        logger.warning(
+            "Failed to ensure FULLTEXT index ft_search, keyword search will use LIKE",
+            extra={"error": str(e)},
+            exc_info=True
+        )
+
+
 def close_db() -> None:
     """
     Close database connections
@@ -101,6 +101,14 @@ class Policy(Base):
         Index("idx_category", "category"),
         Index("idx_program_name", "program_name"),
         Index("idx_created_at", "created_at"),
+        # 한국어 키워드 검색용 FULLTEXT 인덱스 (ngram 파서)
+        Index(
+            "ft_search",
+            "program_name",
+            "program_overview",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
     )
     
     def __repr__(self) -> str:
@@ -3,15 +3,51 @@ Policy Repository
 정책 데이터 접근 계층 (Repository Pattern)
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, select, func
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.dialects.mysql import match
 
 from ..models import Policy, Document
 from ...config.logger import get_logger
+from ...cache.policy_snapshot import invalidate_policy_snapshot
 
 logger = get_logger()
 
+# MySQL ngram 파서 기본 토큰 길이 (이보다 짧은 쿼리는 FULLTEXT 로 찾을 수 없음)
+NGRAM_TOKEN_SIZE = 2
+
+# MySQL 에러 코드: Can't find FULLTEXT index matching the column list
+_ER_FT_MATCHING_KEY_NOT_FOUND = 1191
+
+# ft_search 인덱스가 없는 DB 에서는 LIKE 검색으로 대체 (첫 실패 시 설정)
+_fulltext_unavailable = False
+
+# 검색 응답(PolicyResponse)에 필요한 컬럼
+SEARCH_COLUMNS = (
+    Policy.id,
+    Policy.program_id,
+    Policy.region,
+    Policy.category,
+    Policy.program_name,
+    Policy.program_overview,
+    Policy.support_description,
+    Policy.support_budget,
+    Policy.support_scale,
+    Policy.supervising_ministry,
+    Policy.apply_target,
+    Policy.announcement_date,
+    Policy.biz_process,
+    Policy.application_method,
+    Policy.contact_agency,
+    Policy.contact_number,
+    Policy.required_documents,
+    Policy.collected_date,
+    Policy.created_at,
+)
+
 
 class PolicyRepository:
     """
@@ -77,10 +113,13 @@ class PolicyRepository:
         query: Optional[str] = None,
         limit: int = 10,
         offset: int = 0
-    ) -> List[Policy]:
+    ) -> Tuple[List[Row], int]:
         """
         조건별 정책 검색
         
+        ORM 객체 대신 응답에 필요한 컬럼만 Core select 로 조회하고,
+        COUNT(*) OVER () 윈도 함수로 전체 개수를 같은 쿼리에서 함께 가져옵니다.
+        
         Args:
             region: 지역 필터
             category: 카테고리 필터
@@ -89,31 +128,45 @@ class PolicyRepository:
             offset: 오프셋
         
         Returns:
-            List[Policy]: 정책 리스트
+            Tuple[List[Row], int]: (정책 행 리스트, 필터 적용 전체 개수)
+                FULLTEXT 검색 시 각 행에 score 컬럼 포함
         """
         try:
-            q = self.db.query(Policy)
-            
-            # Apply filters
-            if region:
-                q = q.filter(Policy.region == region)
+            query = query.strip() if query else None
+            use_fulltext = (
+                bool(query)
+                and len(query) >= NGRAM_TOKEN_SIZE
+                and not _fulltext_unavailable
+            )
             
-            if category:
-                q = q.filter(Policy.category == category)
+            try:
+                rows = self.db.execute(
+                    self._search_statement(region, category, query, use_fulltext)
+                    .limit(limit)
+                    .offset(offset)
+                ).all()
+            except OperationalError as e:
+                if not (use_fulltext and getattr(e.orig, "args", (None,))[0] == _ER_FT_MATCHING_KEY_NOT_FOUND):
+                    raise
+                # ft_search 인덱스가 없는 DB (마이그레이션 전) -> LIKE 검색으로 대체
+                self._disable_fulltext(e)
+                rows = self.db.execute(
+                    self._search_statement(region, category, query, False)
+                    .limit(limit)
+                    .offset(offset)
+                ).all()
             
-            if query:
-                # Search in program_name or program_overview
-                search_filter = or_(
-                    Policy.program_name.like(f"%{query}%"),
-                    Policy.program_overview.like(f"%{query}%")
-                )
-                q = q.filter(search_filter)
+            if rows:
+                return rows, rows[0].total_count
             
-            # Order by created_at (newest first)
-            q = q.order_by(Policy.created_at.desc())
+            if offset > 0:
+                # 마지막 페이지 이후는 윈도 함수 값이 없으므로 전체 개수를 따로 조회
+                matched = self._search_statement(
+                    region, category, query, use_fulltext and not _fulltext_unavailable
+                ).order_by(None).subquery()
+                return rows, self.db.execute(select(func.count()).select_from(matched)).scalar_one()
             
-            # Apply limit and offset
-            return q.limit(limit).offset(offset).all()
+            return rows, 0
             
         except Exception as e:
             logger.error(
@@ -128,6 +181,76 @@ class PolicyRepository:
             )
             raise
     
+    def _search_statement(
+        self,
+        region: Optional[str],
+        category: Optional[str],
+        query: Optional[str],
+        use_fulltext: bool
+    ):
+        """
+        검색 SELECT 문 생성 (limit/offset 제외)
+        
+        Args:
+            region: 지역 필터
+            category: 카테고리 필터
+            query: 검색 쿼리 (공백 제거됨)
+            use_fulltext: FULLTEXT(ngram) 검색 여부 (False 면 LIKE)
+        
+        Returns:
+            Select: 검색 쿼리
+        """
+        total_column = func.count().over().label("total_count")
+        
+        if use_fulltext:
+            # ft_search (ngram) 인덱스 조회 + 관련도 점수
+            relevance = match(
+                Policy.program_name,
+                Policy.program_overview,
+                against=query
+            )
+            stmt = select(
+                *SEARCH_COLUMNS, relevance.label("score"), total_column
+            ).where(relevance > 0)
+        else:
+            stmt = select(*SEARCH_COLUMNS, total_column)
+        
+        # Apply filters
+        if region:
+            stmt = stmt.where(Policy.region == region)
+        
+        if category:
+            stmt = stmt.where(Policy.category == category)
+        
+        if use_fulltext:
+            # Order by relevance, then created_at (newest first)
+            return stmt.order_by(relevance.desc(), Policy.created_at.desc())
+        
+        if query:
+            # ngram 토큰보다 짧은 쿼리 (또는 FULLTEXT 인덱스 없음) 는 LIKE 로 검색
+            stmt = stmt.where(or_(
+                Policy.program_name.like(f"%{query}%"),
+                Policy.program_overview.like(f"%{query}%")
+            ))
+        
+        # Order by created_at (newest first)
+        return stmt.order_by(Policy.created_at.desc())
+    
+    def _disable_fulltext(self, error: OperationalError) -> None:
+        """
+        ft_search 인덱스가 없을 때 이후 검색을 LIKE 로 전환
+        
+        Args:
+            error: MySQL 1191 에러
+        """
+        global _fulltext_unavailable
+        _fulltext_unavailable = True
+        self.db.rollback()
+        logger.warning(
+            "FULLTEXT index ft_search missing, falling back to LIKE search",
+            extra={"error": str(error)}
+        )
+    
     def get_all(self, limit: int = 100, offset: int = 0) -> List[Policy]:
         """
         모든 정책 조회
@@ -202,6 +325,7 @@ class PolicyRepository:
             
             self.db.commit()
             self.db.refresh(policy)
+            invalidate_policy_snapshot(policy_id)
             
             logger.info(
                 "Policy updated",
@@ -236,6 +360,7 @@ class PolicyRepository:
             
             self.db.delete(policy)
             self.db.commit()
+            invalidate_policy_snapshot(policy_id)
             
             logger.info(
                 "Policy deleted",
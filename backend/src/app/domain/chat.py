@@ -4,7 +4,7 @@ Chat Domain Models
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .evidence import Evidence
 
@@ -16,14 +16,15 @@ class ChatRequest(BaseModel):
     policy_id: int = Field(..., description="정책 ID")
     message: str = Field(..., min_length=1, description="사용자 메시지")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "policy_id": 1,
                 "message": "이 정책 신청 마감일이 언제야?"
             }
         }
+    )
 
 
 class ChatResponse(BaseModel):
@@ -35,8 +36,8 @@ class ChatResponse(BaseModel):
     evidence: List[Evidence] = Field(default_factory=list, description="근거 목록")
     error: Optional[str] = Field(None, description="에러 메시지")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "policy_id": 1,
@@ -51,6 +52,7 @@ class ChatResponse(BaseModel):
                 ]
             }
         }
+    )
 
 
 class SessionResetResponse(BaseModel):
@@ -60,12 +62,13 @@ class SessionResetResponse(BaseModel):
     success: bool = Field(..., description="성공 여부")
     message: str = Field(..., description="메시지")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "success": True,
                 "message": "세션이 초기화되었습니다."
             }
         }
+    )
 
@@ -4,7 +4,7 @@ Eligibility Domain Models
 """
 
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Condition(BaseModel):
@@ -24,13 +24,14 @@ class EligibilityStartRequest(BaseModel):
     session_id: Optional[str] = Field(None, description="세션 ID")
     policy_id: int = Field(..., description="정책 ID")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "policy_id": 1
             }
         }
+    )
 
 
 class EligibilityStartResponse(BaseModel):
@@ -41,8 +42,8 @@ class EligibilityStartResponse(BaseModel):
     question: str = Field(..., description="첫 번째 질문")
     progress: dict = Field(..., description="진행률 {'current': 1, 'total': 5}")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "policy_id": 1,
@@ -50,6 +51,7 @@ class EligibilityStartResponse(BaseModel):
                 "progress": {"current": 1, "total": 3}
             }
         }
+    )
 
 
 class EligibilityAnswerRequest(BaseModel):
@@ -58,13 +60,14 @@ class EligibilityAnswerRequest(BaseModel):
     session_id: str = Field(..., description="세션 ID")
     answer: str = Field(..., min_length=1, description="사용자 답변")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "answer": "예비창업자입니다"
             }
         }
+    )
 
 
 class EligibilityAnswerResponse(BaseModel):
@@ -75,8 +78,8 @@ class EligibilityAnswerResponse(BaseModel):
     progress: dict = Field(..., description="진행률")
     completed: bool = Field(False, description="완료 여부")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "question": "거주 지역을 알려주세요.",
@@ -84,6 +87,7 @@ class EligibilityAnswerResponse(BaseModel):
                 "completed": False
             }
         }
+    )
 
 
 class ConditionResult(BaseModel):
@@ -103,8 +107,8 @@ class EligibilityResult(BaseModel):
     reason: str = Field(..., description="종합 판정 사유")
     details: List[ConditionResult] = Field(..., description="조건별 상세 결과")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "policy_id": 1,
@@ -124,3 +128,4 @@ class EligibilityResult(BaseModel):
                 ]
             }
         }
+    )
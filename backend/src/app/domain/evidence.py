@@ -5,7 +5,7 @@ Evidence Domain Models
 
 from typing import Optional
 from datetime import date
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -25,8 +25,8 @@ class Evidence(BaseModel):
     fetched_date: Optional[date] = Field(None, description="조회일 (웹 검색인 경우)")
     score: Optional[float] = Field(None, description="관련도 점수")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "type": "internal",
                 "source": "정책 문서 섹션 3",
@@ -34,4 +34,5 @@ class Evidence(BaseModel):
                 "score": 0.95
             }
         }
+    )
 
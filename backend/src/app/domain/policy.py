@@ -5,7 +5,7 @@ Policy Domain Models
 
 from typing import Optional, List
 from datetime import datetime, date
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PolicySearchRequest(BaseModel):
@@ -17,8 +17,8 @@ class PolicySearchRequest(BaseModel):
     limit: int = Field(10, ge=1, le=100, description="반환 개수")
     offset: int = Field(0, ge=0, description="오프셋")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "query": "서울 창업 지원금",
                 "region": "서울",
@@ -27,6 +27,7 @@ class PolicySearchRequest(BaseModel):
                 "offset": 0
             }
         }
+    )
 
 
 class PolicyResponse(BaseModel):
@@ -59,9 +60,9 @@ class PolicyResponse(BaseModel):
     screenshot_url: Optional[str] = Field(None, description="웹사이트 스크린샷 URL")
     favicon_url: Optional[str] = Field(None, description="웹사이트 파비콘 URL")
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "program_id": 1,
@@ -78,6 +79,7 @@ class PolicyResponse(BaseModel):
                 "score": 0.95
             }
         }
+    )
 
 
 class PolicyListResponse(BaseModel):
@@ -89,8 +91,8 @@ class PolicyListResponse(BaseModel):
     limit: int = Field(..., description="제한")
     policies: List[PolicyResponse] = Field(..., description="정책 리스트")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total": 508,
                 "count": 10,
@@ -107,4 +109,5 @@ class PolicyListResponse(BaseModel):
                 ]
             }
         }
+    )
 
@@ -3,21 +3,28 @@ QA Agent 평가 모듈
 LangSmith를 사용한 자동화된 평가
 """
 
-from .datasets import QA_EVALUATION_DATASET
+from .datasets import QA_EVALUATION_DATASET, DATASET_COLUMNS, EvalExample, iter_examples
 from .evaluators import (
     check_answer_relevance,
     check_citation_format,
     check_query_classification,
     check_evidence_type,
-    check_response_time
+    check_response_time,
+    evaluate_batch,
+    meta_evaluator
 )
 
 __all__ = [
     "QA_EVALUATION_DATASET",
+    "DATASET_COLUMNS",
+    "EvalExample",
+    "iter_examples",
     "check_answer_relevance",
     "check_citation_format",
     "check_query_classification",
     "check_evidence_type",
     "check_response_time",
+    "evaluate_batch",
+    "meta_evaluator",
 ]
 
@@ -2,7 +2,46 @@
 QA Agent 평가 데이터셋
 """
 
-QA_EVALUATION_DATASET = [
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# 인용 마커 (intern 하여 평가 시 동일 객체 재사용)
+POLICY_CITATION_MARKER = sys.intern("[정책문서")
+WEB_CITATION_MARKER = sys.intern("[웹")
+
+
+@lru_cache(maxsize=None)
+def citation_marker_for(citation_format: Optional[str]) -> Optional[str]:
+    """
+    기대 인용 형식에서 답변에서 찾을 마커 결정
+    
+    Args:
+        citation_format: 기대 인용 형식 (예: "[정책문서 X]")
+    
+    Returns:
+        Optional[str]: 인용 마커, 해당 없으면 None
+    """
+    if not citation_format:
+        return None
+    if POLICY_CITATION_MARKER in citation_format:
+        return POLICY_CITATION_MARKER
+    if WEB_CITATION_MARKER in citation_format:
+        return WEB_CITATION_MARKER
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class EvalExample:
+    """평가 예시 (불변)"""
+    
+    input: Dict[str, Any]
+    expected_output: Dict[str, Any]
+    metadata: Dict[str, Any]
+
+
+_RAW_DATASET = [
     # 1. 정책 내용 질문 (문서 충분)
     {
         "input": {
@@ -143,3 +182,70 @@ QA_EVALUATION_DATASET = [
     },
 ]
 
+
+def _to_example(raw: Dict[str, Any]) -> EvalExample:
+    """
+    원본 dict 를 EvalExample 로 변환
+    """
+    return EvalExample(
+        input=raw["input"],
+        expected_output=raw["expected_output"],
+        metadata=raw["metadata"],
+    )
+
+
+QA_EVALUATION_DATASET: Tuple[EvalExample, ...] = tuple(map(_to_example, _RAW_DATASET))
+del _RAW_DATASET
+
+
+def _build_columns() -> Dict[str, Tuple[Any, ...]]:
+    """
+    데이터셋을 열(column) 단위 튜플로 변환 (Struct-of-Arrays)
+    
+    평가/업로드 시 예시별 중첩 dict 를 반복 탐색하지 않도록
+    import 시점에 한 번만 변환합니다.
+    
+    Returns:
+        Dict[str, Tuple]: 열 이름 -> 값 튜플 (모든 열의 길이 동일)
+    """
+    inputs = [ex.input for ex in QA_EVALUATION_DATASET]
+    outputs = [ex.expected_output for ex in QA_EVALUATION_DATASET]
+    return {
+        "inputs_session_id": tuple(i["session_id"] for i in inputs),
+        "inputs_policy_id": tuple(i["policy_id"] for i in inputs),
+        "inputs_current_query": tuple(i["current_query"] for i in inputs),
+        "expected_keywords": tuple(tuple(o.get("answer_should_contain", ())) for o in outputs),
+        "expected_citation_marker": tuple(citation_marker_for(o.get("citation_format")) for o in outputs),
+        "expected_query_type": tuple(o.get("query_type") for o in outputs),
+        "expected_output": tuple(outputs),
+        "metadata": tuple(ex.metadata for ex in QA_EVALUATION_DATASET),
+    }
+
+
+DATASET_COLUMNS = _build_columns()
+
+
+def iter_examples() -> Iterator[Dict[str, Any]]:
+    """
+    열 저장소에서 예시 dict 를 하나씩 생성
+    
+    Yields:
+        Dict: {"input", "expected_output", "metadata"} 형식의 예시
+    """
+    columns = DATASET_COLUMNS
+    for session_id, policy_id, query, expected, metadata in zip(
+        columns["inputs_session_id"],
+        columns["inputs_policy_id"],
+        columns["inputs_current_query"],
+        columns["expected_output"],
+        columns["metadata"],
+    ):
+        yield {
+            "input": {
+                "session_id": session_id,
+                "policy_id": policy_id,
+                "current_query": query,
+            },
+            "expected_output": expected,
+            "metadata": metadata,
+        }
@@ -2,7 +2,134 @@
 QA Agent 평가 함수들
 """
 
-from typing import Dict, Any
+import bisect
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Pattern, Tuple
+
+from .datasets import citation_marker_for
+
+
+# 응답 시간 구간 (초) 과 구간별 점수: <=3초 1.0, <=5초 0.5, 그 외 0.0
+_LATENCY_THRESHOLDS = (3.0, 5.0)
+_LATENCY_SCORES = (1.0, 0.5, 0.0)
+
+
+def _latency_score(latency_seconds: float) -> float:
+    """응답 시간(초)을 구간 점수로 변환"""
+    return _LATENCY_SCORES[bisect.bisect_left(_LATENCY_THRESHOLDS, latency_seconds)]
+
+
+@lru_cache(maxsize=256)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> Pattern[str]:
+    """
+    키워드 집합을 단일 정규식으로 컴파일 (예제별 1회)
+    
+    긴 키워드를 먼저 두고 lookahead 로 감싸 모든 위치에서 매칭을 시도합니다.
+    
+    Args:
+        keywords: 정렬된 키워드 튜플
+    
+    Returns:
+        Pattern: 컴파일된 alternation 패턴
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+
+
+def _find_keywords(answer: str, keywords: Tuple[str, ...]) -> FrozenSet[str]:
+    """
+    답변에 포함된 키워드를 한 번의 스캔으로 찾기
+    
+    같은 위치에서는 가장 긴 키워드만 잡히므로, 그 접두어인 키워드도 포함 처리합니다.
+    
+    Args:
+        answer: 답변 텍스트
+        keywords: 정렬된 키워드 튜플
+    
+    Returns:
+        FrozenSet[str]: 답변에 포함된 키워드
+    """
+    hits = {m.group(1) for m in _keyword_pattern(keywords).finditer(answer)}
+    return frozenset(
+        kw for kw in keywords
+        if kw in hits or any(hit.startswith(kw) for hit in hits)
+    )
+
+
+def _latency_seconds(latency: float) -> float:
+    """LangSmith latency 를 초 단위로 변환 (100 초과면 밀리초로 간주)"""
+    return latency / 1000 if latency > 100 else latency
+
+
+# ============================================================
+# 열(column) 단위 채점 - 지표별 유일한 구현
+# 예시별 평가 함수는 길이 1 의 열로, evaluate_batch 는 전체 열로 호출합니다.
+# ============================================================
+
+def _answer_relevance_scores(
+    answers: List[str], expected: List[Dict[str, Any]]
+) -> List[Optional[float]]:
+    """기대 키워드 포함 비율 (기대 키워드가 없으면 None)"""
+    scores: List[Optional[float]] = []
+    for answer, outputs in zip(answers, expected):
+        keywords = outputs.get("answer_should_contain", [])
+        if not keywords:
+            scores.append(None)
+            continue
+        # 키워드 포함 여부 확인 (단일 패스 스캔)
+        found = _find_keywords(answer, tuple(sorted(set(keywords))))
+        scores.append(sum(kw in found for kw in keywords) / len(keywords))
+    return scores
+
+
+def _citation_format_scores(
+    answers: List[str], expected: List[Dict[str, Any]]
+) -> List[Optional[float]]:
+    """기대 인용 마커 포함 여부 (기대 형식이 없으면 None)"""
+    scores: List[Optional[float]] = []
+    for answer, outputs in zip(answers, expected):
+        if not outputs.get("citation_format"):
+            scores.append(None)
+            continue
+        # 형식별 마커는 citation_marker_for 에서 캐시됨
+        marker = citation_marker_for(outputs["citation_format"])
+        scores.append(1.0 if marker is not None and answer.find(marker) >= 0 else 0.0)
+    return scores
+
+
+def _query_classification_scores(
+    query_types: List[Optional[str]], expected: List[Dict[str, Any]]
+) -> List[Optional[float]]:
+    """질문 유형 일치 여부 (기대 유형이 없으면 None)"""
+    return [
+        (1.0 if got == outputs["query_type"] else 0.0) if outputs.get("query_type") else None
+        for got, outputs in zip(query_types, expected)
+    ]
+
+
+def _evidence_type_scores(
+    evidence_types: List[FrozenSet[Optional[str]]], expected: List[Dict[str, Any]]
+) -> List[Optional[float]]:
+    """기대 근거 유형 사용 여부 (기대 유형이 없으면 None)"""
+    return [
+        (1.0 if outputs["evidence_type"] in types else 0.0) if outputs.get("evidence_type") else None
+        for types, outputs in zip(evidence_types, expected)
+    ]
+
+
+def _response_time_scores(latencies: List[Optional[float]]) -> List[Optional[float]]:
+    """응답 시간 구간 점수 (latency 가 없으면 None)"""
+    return [
+        None if latency is None else _latency_score(_latency_seconds(latency))
+        for latency in latencies
+    ]
+
+
+def _evidence_types(run) -> FrozenSet[Optional[str]]:
+    """run 의 근거 유형 집합"""
+    return frozenset(e.get("type") for e in run.outputs.get("evidence", []))
 
 
 def check_answer_relevance(run, example) -> Dict[str, Any]:
@@ -12,20 +139,17 @@ def check_answer_relevance(run, example) -> Dict[str, Any]:
     - 질문에 대한 답변이 적절한가?
     - 기대하는 키워드가 포함되어 있는가?
     """
-    answer = run.outputs.get("answer", "")
-    expected_keywords = example.outputs.get("answer_should_contain", [])
-    
-    if not expected_keywords:
+    [score] = _answer_relevance_scores(
+        [run.outputs.get("answer", "")], [example.outputs]
+    )
+    if score is None:
         return {"key": "answer_relevance", "score": None}
     
-    # 키워드 포함 여부 확인
-    found_keywords = [kw for kw in expected_keywords if kw in answer]
-    score = len(found_keywords) / len(expected_keywords)
-    
+    expected_count = len(example.outputs["answer_should_contain"])
     return {
         "key": "answer_relevance",
         "score": score,
-        "comment": f"Found {len(found_keywords)}/{len(expected_keywords)} keywords"
+        "comment": f"Found {round(score * expected_count)}/{expected_count} keywords"
     }
 
 
@@ -35,25 +159,16 @@ def check_citation_format(run, example) -> Dict[str, Any]:
     
     - [정책문서 X] 또는 [웹 X] 형식이 포함되어 있는가?
     """
-    answer = run.outputs.get("answer", "")
-    expected_format = example.outputs.get("citation_format", None)
-    
-    if not expected_format:
+    [score] = _citation_format_scores(
+        [run.outputs.get("answer", "")], [example.outputs]
+    )
+    if score is None:
         return {"key": "citation_format", "score": None}
     
-    # 정책문서 인용
-    if "[정책문서" in expected_format:
-        has_citation = "[정책문서" in answer
-    # 웹 인용
-    elif "[웹" in expected_format:
-        has_citation = "[웹" in answer
-    else:
-        has_citation = False
-    
     return {
         "key": "citation_format",
-        "score": 1.0 if has_citation else 0.0,
-        "comment": f"Citation format: {expected_format}"
+        "score": score,
+        "comment": f"Citation format: {example.outputs['citation_format']}"
     }
 
 
@@ -64,17 +179,14 @@ def check_query_classification(run, example) -> Dict[str, Any]:
     - WEB_ONLY vs POLICY_QA 분류가 올바른가?
     """
     query_type = run.outputs.get("query_type", None)
-    expected_type = example.outputs.get("query_type", None)
-    
-    if not expected_type:
+    [score] = _query_classification_scores([query_type], [example.outputs])
+    if score is None:
         return {"key": "query_classification", "score": None}
     
-    is_correct = (query_type == expected_type)
-    
     return {
         "key": "query_classification",
-        "score": 1.0 if is_correct else 0.0,
-        "comment": f"Expected: {expected_type}, Got: {query_type}"
+        "score": score,
+        "comment": f"Expected: {example.outputs['query_type']}, Got: {query_type}"
     }
 
 
@@ -84,27 +196,25 @@ def check_evidence_type(run, example) -> Dict[str, Any]:
     
     - internal (정책 문서) vs web 근거가 올바르게 사용되었는가?
     """
-    evidence = run.outputs.get("evidence", [])
-    expected_type = example.outputs.get("evidence_type", None)
-    
-    if not expected_type:
+    [score] = _evidence_type_scores([_evidence_types(run)], [example.outputs])
+    if score is None:
         return {"key": "evidence_type", "score": None}
     
-    if not evidence:
-        return {
-            "key": "evidence_type",
-            "score": 0.0,
-            "comment": "No evidence provided"
-        }
+    evidence = run.outputs.get("evidence", [])
+    expected_type = example.outputs["evidence_type"]
     
-    # Evidence 유형 확인
-    evidence_types = [e.get("type") for e in evidence]
-    has_expected = expected_type in evidence_types
+    if not evidence:
+        comment = "No evidence provided"
+    elif score:
+        comment = f"Expected: {expected_type}, Found"
+    else:
+        # 불일치 시에만 전체 유형 목록 생성
+        comment = f"Expected: {expected_type}, Got: {[e.get('type') for e in evidence]}"
     
     return {
         "key": "evidence_type",
-        "score": 1.0 if has_expected else 0.0,
-        "comment": f"Expected: {expected_type}, Got: {evidence_types}"
+        "score": score,
+        "comment": comment
     }
 
 
@@ -117,24 +227,97 @@ def check_response_time(run, example) -> Dict[str, Any]:
     - 5초 이상: 0.0
     """
     # LangSmith run에서 실행 시간 가져오기
-    latency = run.latency if hasattr(run, 'latency') else None
-    
-    if latency is None:
+    latency = getattr(run, "latency", None)
+    [score] = _response_time_scores([latency])
+    if score is None:
         return {"key": "response_time", "score": None}
     
-    # 밀리초 → 초 변환
-    latency_seconds = latency / 1000 if latency > 100 else latency
-    
-    if latency_seconds <= 3:
-        score = 1.0
-    elif latency_seconds <= 5:
-        score = 0.5
-    else:
-        score = 0.0
-    
     return {
         "key": "response_time",
         "score": score,
-        "comment": f"Latency: {latency_seconds:.2f}s"
+        "comment": f"Latency: {_latency_seconds(latency):.2f}s"
     }
 
+
+# 예시별 평가 함수 (서로 독립적이므로 병렬 실행 가능)
+ROW_EVALUATORS = (
+    check_answer_relevance,
+    check_citation_format,
+    check_query_classification,
+    check_evidence_type,
+    check_response_time,
+)
+
+_evaluator_pool = ThreadPoolExecutor(
+    max_workers=len(ROW_EVALUATORS),
+    thread_name_prefix="evaluator"
+)
+
+
+def meta_evaluator(run, example) -> Dict[str, Any]:
+    """
+    예시별 평가 함수들을 스레드 풀에서 동시에 실행해 결과를 합침
+    
+    LLM-as-judge 처럼 무거운 평가 함수가 추가되면 행당 평가 시간이
+    가장 느린 평가 함수 하나의 시간으로 줄어듭니다.
+    
+    Returns:
+        Dict: {"results": [각 평가 함수 결과, ...]}
+    """
+    futures = [_evaluator_pool.submit(fn, run, example) for fn in ROW_EVALUATORS]
+    return {"results": [future.result() for future in futures]}
+
+
+def _mean(scores: List[Optional[float]]) -> Optional[float]:
+    """None 을 제외한 평균 (값이 없으면 None)"""
+    valid = [score for score in scores if score is not None]
+    return sum(valid) / len(valid) if valid else None
+
+
+def evaluate_batch(runs: List[Any], examples: List[Any]) -> Dict[str, Any]:
+    """
+    전체 실행 결과를 한 번에 평가하는 요약 평가 함수 (LangSmith summary evaluator)
+    
+    필요한 값을 열(column) 단위로 한 번만 추출한 뒤, 예시별 평가 함수와
+    같은 열 단위 채점 함수로 지표별 평균을 계산합니다.
+    
+    Args:
+        runs: LangSmith run 리스트
+        examples: runs 와 같은 순서의 example 리스트
+    
+    Returns:
+        Dict: {"results": [{"key", "score"}, ...]}
+    """
+    answers = [run.outputs.get("answer", "") for run in runs]
+    expected = [example.outputs for example in examples]
+    
+    return {
+        "results": [
+            {
+                "key": "answer_relevance_mean",
+                "score": _mean(_answer_relevance_scores(answers, expected)),
+            },
+            {
+                "key": "citation_format_mean",
+                "score": _mean(_citation_format_scores(answers, expected)),
+            },
+            {
+                "key": "query_classification_mean",
+                "score": _mean(_query_classification_scores(
+                    [run.outputs.get("query_type") for run in runs], expected
+                )),
+            },
+            {
+                "key": "evidence_type_mean",
+                "score": _mean(_evidence_type_scores(
+                    [_evidence_types(run) for run in runs], expected
+                )),
+            },
+            {
+                "key": "response_time_mean",
+                "score": _mean(_response_time_scores(
+                    [getattr(run, "latency", None) for run in runs]
+                )),
+            },
+        ]
+    }
@@ -2,20 +2,123 @@
 QA Agent 평가 실행
 """
 
+import argparse
+import hashlib
+import os
+import subprocess
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
 from langsmith import Client
 from langsmith.evaluation import evaluate
 from ..agent.controller import AgentController
 from ..config.logger import get_logger
-from .evaluators import (
-    check_answer_relevance,
-    check_citation_format,
-    check_query_classification,
-    check_evidence_type,
-    check_response_time
-)
+from .evaluators import evaluate_batch, meta_evaluator
 
 logger = get_logger()
 
+# 평가 대상 컨트롤러 (예제마다 새로 만들지 않도록 최초 사용 시 1회 생성 후 공유)
+_controller: Optional[AgentController] = None
+_controller_lock = threading.Lock()
+
+# 동시에 실행할 예제 수 (LLM 왕복 지연이 병목이므로 병렬 실행)
+MAX_CONCURRENCY = 8
+
+# 평가 결과 디스크 캐시 (평가 함수만 수정하며 재실행할 때 LLM 호출 생략)
+EVAL_CACHE_DIR = Path(__file__).resolve().parent / ".eval_cache"
+EVAL_CACHE_MAX_BYTES = 1 << 30  # 1GB
+_use_eval_cache = True
+
+
+def _get_controller() -> AgentController:
+    """
+    평가 워커들이 공유하는 AgentController 반환 (스레드 안전 지연 생성)
+    
+    Returns:
+        AgentController: 컨트롤러 인스턴스
+    """
+    global _controller
+    
+    if _controller is None:
+        with _controller_lock:
+            if _controller is None:
+                _controller = AgentController()
+    
+    return _controller
+
+
+@lru_cache(maxsize=1)
+def _agent_version() -> str:
+    """
+    에이전트 코드 버전 (git 커밋 해시)
+    
+    코드가 바뀌면 캐시 키도 바뀌도록 캐시 키에 포함합니다.
+    
+    Returns:
+        str: 커밋 해시, git 을 쓸 수 없으면 "unknown"
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _eval_cache_key(inputs: dict) -> str:
+    """입력 dict + 에이전트 버전으로 캐시 키 생성"""
+    payload = orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(payload + _agent_version().encode()).hexdigest()
+
+
+def _eval_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """
+    캐시 조회 (적중 시 mtime 을 갱신해 LRU 순서 유지)
+    
+    Args:
+        key: 캐시 키
+    
+    Returns:
+        Optional[Dict]: 캐시된 출력, 없으면 None
+    """
+    path = EVAL_CACHE_DIR / f"{key}.json"
+    try:
+        value = orjson.loads(path.read_bytes())
+        os.utime(path)
+        return value
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _eval_cache_set(key: str, value: Dict[str, Any]):
+    """
+    캐시 저장 후 용량 초과 시 가장 오래 사용하지 않은 항목부터 삭제
+    
+    Args:
+        key: 캐시 키
+        value: 저장할 출력
+    """
+    EVAL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = EVAL_CACHE_DIR / f"{key}.json"
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(orjson.dumps(value))
+    os.replace(tmp_path, path)
+    
+    entries = [(p.stat(), p) for p in EVAL_CACHE_DIR.glob("*.json")]
+    total = sum(st.st_size for st, _ in entries)
+    for st, p in sorted(entries, key=lambda e: e[0].st_mtime):
+        if total <= EVAL_CACHE_MAX_BYTES:
+            break
+        p.unlink(missing_ok=True)
+        total -= st.st_size
+
 
 def qa_agent_target_function(inputs: dict) -> dict:
     """
@@ -29,21 +132,33 @@ def qa_agent_target_function(inputs: dict) -> dict:
     Returns:
         dict: {answer, evidence, query_type, need_web_search}
     """
+    cache_key = _eval_cache_key(inputs) if _use_eval_cache else None
+    if cache_key:
+        cached = _eval_cache_get(cache_key)
+        if cached is not None:
+            return cached
+    
     try:
-        controller = AgentController()
+        controller = _get_controller()
         
         result = controller.run_qa(
             session_id=inputs["session_id"],
             policy_id=inputs["policy_id"],
-            current_query=inputs["current_query"]
+            user_message=inputs["current_query"]
         )
         
-        return {
+        output = {
             "answer": result.get("answer", ""),
             "evidence": result.get("evidence", []),
             "query_type": result.get("query_type", ""),
             "need_web_search": result.get("need_web_search", False),
         }
+        
+        # 오류 응답은 캐시하지 않음
+        if cache_key and not result.get("error"):
+            _eval_cache_set(cache_key, output)
+        
+        return output
     except Exception as e:
         logger.error(f"평가 실행 중 에러: {e}", exc_info=True)
         return {
@@ -54,31 +169,39 @@ def qa_agent_target_function(inputs: dict) -> dict:
         }
 
 
-def run_evaluation(dataset_name: str = "qaagent-policy-qa-eval-v1"):
+def run_evaluation(
+    dataset_name: str = "qaagent-policy-qa-eval-v1",
+    max_concurrency: int = MAX_CONCURRENCY,
+    use_cache: bool = True
+):
     """
     QA Agent 평가 실행
     
     Args:
         dataset_name: LangSmith 데이터셋 이름
+        max_concurrency: 동시에 평가할 예제 수
+        use_cache: 디스크 캐시 사용 여부 (False 면 항상 에이전트 실행)
     
     Returns:
         평가 결과
     """
+    global _use_eval_cache
+    _use_eval_cache = use_cache
+    
     try:
-        logger.info(f"평가 시작: 데이터셋 '{dataset_name}'")
+        logger.info(f"평가 시작: 데이터셋 '{dataset_name}' (캐시: {use_cache})")
+        
+        # 동시 실행 전에 컨트롤러를 미리 생성해 워커들이 공유하도록 함
+        _get_controller()
         
         # 평가 실행
         results = evaluate(
             qa_agent_target_function,
             data=dataset_name,
-            evaluators=[
-                check_answer_relevance,
-                check_citation_format,
-                check_query_classification,
-                check_evidence_type,
-                check_response_time,
-            ],
+            evaluators=[meta_evaluator],
+            summary_evaluators=[evaluate_batch],
             experiment_prefix="qaagent-eval",
+            max_concurrency=max_concurrency,
             metadata={
                 "version": "v2_cache",
                 "model": "gpt-4o-mini",
@@ -99,5 +222,10 @@ def run_evaluation(dataset_name: str = "qaagent-policy-qa-eval-v1"):
 
 
 if __name__ == "__main__":
-    run_evaluation()
+    parser = argparse.ArgumentParser(description="QA Agent 평가 실행")
+    parser.add_argument("--dataset", default="qaagent-policy-qa-eval-v1", help="LangSmith 데이터셋 이름")
+    parser.add_argument("--no-cache", action="store_true", help="디스크 캐시를 사용하지 않고 에이전트를 다시 실행")
+    args = parser.parse_args()
+    
+    run_evaluation(dataset_name=args.dataset, use_cache=not args.no_cache)
 
@@ -2,47 +2,108 @@
 LangSmith에 평가 데이터셋 업로드
 """
 
+import hashlib
+from typing import Any, Dict, Optional
+
+import orjson
 from langsmith import Client
-from .datasets import QA_EVALUATION_DATASET
+from langsmith.utils import LangSmithNotFoundError
+from .datasets import DATASET_COLUMNS, iter_examples
 from ..config.logger import get_logger
 
 logger = get_logger()
 
 
+def _content_hash(obj: Any) -> str:
+    """
+    JSON 직렬화 기준 콘텐츠 해시
+    
+    Args:
+        obj: 해시할 객체 (JSON 직렬화 가능)
+    
+    Returns:
+        str: sha256 hex digest
+    """
+    return hashlib.sha256(orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _example_hash(inputs: Dict[str, Any], outputs: Optional[Dict[str, Any]]) -> str:
+    """예시의 inputs/outputs 콘텐츠 해시 (로컬/원격 비교용)"""
+    return _content_hash({"inputs": inputs, "outputs": outputs or {}})
+
+
 def upload_evaluation_dataset():
-    """LangSmith에 평가 데이터셋 업로드"""
+    """
+    LangSmith에 평가 데이터셋 업로드 (멱등)
+    
+    원격 예시의 inputs/outputs 해시를 로컬 예시와 비교해 추가/변경된 예시만
+    전송하고, 로컬에서 삭제된 예시는 제거합니다. 변경이 없으면 조회만 수행합니다.
+    
+    고정된 langsmith 0.0.87 클라이언트는 데이터셋/예시 metadata 를 지원하지 않으므로
+    해시는 원격에 저장하지 않고 매번 원격 콘텐츠에서 계산합니다.
+    """
     client = Client()
     
     # 데이터셋 이름
     dataset_name = "qaagent-policy-qa-eval-v1"
+    total = len(DATASET_COLUMNS["inputs_session_id"])
     
     try:
-        # 기존 데이터셋이 있으면 삭제 (optional)
         try:
-            client.delete_dataset(dataset_name=dataset_name)
-            logger.info(f"기존 데이터셋 '{dataset_name}' 삭제됨")
-        except:
-            pass
-        
-        # 새 데이터셋 생성
-        dataset = client.create_dataset(
-            dataset_name=dataset_name,
-            description="QA Agent 평가 데이터셋 (v1) - 정책 QA, 웹 검색, 하이브리드",
-        )
-        logger.info(f"데이터셋 '{dataset_name}' 생성됨 (ID: {dataset.id})")
-        
-        # 데이터 추가
-        for i, example in enumerate(QA_EVALUATION_DATASET):
-            client.create_example(
-                inputs=example["input"],
-                outputs=example["expected_output"],
-                dataset_id=dataset.id,
-                metadata=example["metadata"]
+            dataset = client.read_dataset(dataset_name=dataset_name)
+        except LangSmithNotFoundError:
+            # 새 데이터셋 생성
+            dataset = client.create_dataset(
+                dataset_name=dataset_name,
+                description="QA Agent 평가 데이터셋 (v1) - 정책 QA, 웹 검색, 하이브리드",
+            )
+            logger.info(f"데이터셋 '{dataset_name}' 생성됨 (ID: {dataset.id})")
+        
+        # 기존 예시를 session_id 기준으로 매핑
+        existing = {
+            ex.inputs.get("session_id"): ex
+            for ex in client.list_examples(dataset_id=dataset.id)
+        }
+        
+        new_examples = []
+        updated = 0
+        for example in iter_examples():
+            current = existing.get(example["input"]["session_id"])
+            
+            if current is None:
+                new_examples.append(example)
+            elif _example_hash(current.inputs, current.outputs) != _example_hash(
+                example["input"], example["expected_output"]
+            ):
+                client.update_example(
+                    example_id=current.id,
+                    inputs=example["input"],
+                    outputs=example["expected_output"],
+                )
+                updated += 1
+        
+        # 신규 예시는 한 번의 요청으로 일괄 생성
+        if new_examples:
+            client.create_examples(
+                inputs=[ex["input"] for ex in new_examples],
+                outputs=[ex["expected_output"] for ex in new_examples],
+                dataset_id=dataset.id
             )
-            logger.info(f"예시 {i+1}/{len(QA_EVALUATION_DATASET)} 추가됨")
+        created = len(new_examples)
+        
+        # 로컬에서 삭제된 예시는 원격에서도 제거
+        local_session_ids = set(DATASET_COLUMNS["inputs_session_id"])
+        stale = [ex for session_id, ex in existing.items() if session_id not in local_session_ids]
+        for ex in stale:
+            client.delete_example(ex.id)
+        deleted = len(stale)
+        
+        if not (created or updated or deleted):
+            logger.info(f"데이터셋 '{dataset_name}' 변경 없음 - 업로드 생략")
+            return dataset
         
         logger.info(f"\n✅ 데이터셋 '{dataset_name}' 업로드 완료!")
-        logger.info(f"   - 총 {len(QA_EVALUATION_DATASET)}개 예시")
+        logger.info(f"   - 총 {total}개 예시 (추가 {created}, 변경 {updated}, 삭제 {deleted})")
         logger.info(f"   - 데이터셋 ID: {dataset.id}")
         
         return dataset
@@ -54,4 +115,3 @@ def upload_evaluation_dataset():
 
 if __name__ == "__main__":
     upload_evaluation_dataset()
-
@@ -3,7 +3,7 @@ OpenAI Client
 LLM 호출 래퍼 (스트리밍 지원)
 """
 
-from typing import List, Dict, Any, Optional, AsyncGenerator
+from typing import List, Dict, Any, Optional, AsyncGenerator, Union
 from functools import lru_cache
 
 from langchain_openai import ChatOpenAI
@@ -16,6 +16,13 @@ from ..observability import trace_llm_call
 logger = get_logger()
 settings = get_settings()
 
+# role -> LangChain 메시지 클래스 (알 수 없는 role 은 user 로 처리)
+_MESSAGE_CLASSES = {
+    "system": SystemMessage,
+    "assistant": AIMessage,
+    "user": HumanMessage,
+}
+
 
 class OpenAIClient:
     """
@@ -27,6 +34,8 @@ class OpenAIClient:
         temperature: 온도 설정
     """
     
+    __slots__ = ("model", "model_name", "temperature")
+    
     def __init__(self):
         """Initialize OpenAI client"""
         self.model_name = settings.openai_model
@@ -122,6 +131,82 @@ class OpenAIClient:
         
         return self.generate(messages, temperature=temperature)
     
+    def generate_batch(
+        self,
+        messages_list: List[List[Dict[str, str]]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        max_concurrency: int = 8
+    ) -> List[Union[str, Exception]]:
+        """
+        여러 메시지 리스트를 동시에 응답 생성 (Non-streaming)
+        
+        서로 독립적인 프롬프트를 ChatOpenAI.batch 로 한 번에 보내
+        순차 호출 대비 대기 시간을 줄입니다.
+        
+        Args:
+            messages_list: 메시지 리스트들의 리스트
+            temperature: 온도 (선택)
+            max_tokens: 최대 토큰 (선택)
+            max_concurrency: 최대 동시 요청 수
+        
+        Returns:
+            List[Union[str, Exception]]: 입력 순서대로의 응답 (실패한 항목은 예외 객체)
+        """
+        if not messages_list:
+            return []
+        
+        responses = self.model.batch(
+            [self._convert_to_langchain_messages(messages) for messages in messages_list],
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True,
+            temperature=temperature or self.temperature,
+            max_tokens=max_tokens
+        )
+        
+        return [
+            response if isinstance(response, Exception) else response.content
+            for response in responses
+        ]
+    
+    async def agenerate(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """
+        메시지 기반 응답 생성 (비동기, Non-streaming)
+        
+        async 경로에서 이벤트 루프를 막지 않도록 ainvoke 를 사용합니다.
+        
+        Args:
+            messages: 메시지 리스트 [{"role": "user/assistant/system", "content": str}]
+            temperature: 온도 (선택)
+            max_tokens: 최대 토큰 (선택)
+        
+        Returns:
+            str: 생성된 응답
+        """
+        try:
+            lc_messages = self._convert_to_langchain_messages(messages)
+            
+            response = await self.model.ainvoke(
+                lc_messages,
+                temperature=temperature or self.temperature,
+                max_tokens=max_tokens
+            )
+            
+            return response.content
+            
+        except Exception as e:
+            logger.error(
+                "Error generating response",
+                extra={"error": str(e)},
+                exc_info=True
+            )
+            raise
+    
     async def generate_stream(
         self,
         messages: List[Dict[str, str]],
@@ -195,19 +280,11 @@ class OpenAIClient:
         Returns:
             List: LangChain 메시지 리스트
         """
-        lc_messages = []
-        for msg in messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            
-            if role == "system":
-                lc_messages.append(SystemMessage(content=content))
-            elif role == "assistant":
-                lc_messages.append(AIMessage(content=content))
-            else:  # user
-                lc_messages.append(HumanMessage(content=content))
-        
-        return lc_messages
+        get_class = _MESSAGE_CLASSES.get
+        return [
+            get_class(msg.get("role", "user"), HumanMessage)(content=msg.get("content", ""))
+            for msg in messages
+        ]
 
 
 @lru_cache()
@@ -3,9 +3,12 @@ FastAPI Application Entrypoint
 정책·지원금 AI Agent의 메인 애플리케이션
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -13,6 +16,8 @@ from fastapi.responses import JSONResponse
 from .config import get_settings
 from .config.logger import get_logger
 from .db.engine import init_db, close_db
+from .cache import cache_sweeper
+from .services.simple_search_service import get_simple_search_service
 from .api import routes_policy, routes_admin, routes_chat, routes_eligibility, routes_web_source
 
 # Initialize
@@ -28,10 +33,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     """
     logger.info("Starting application", extra={"environment": settings.environment})
     
+    # 워커 스레드 수 설정
+    # - anyio 리미터: sync 라우트 / run_in_threadpool
+    # - 이벤트 루프 기본 executor: asyncio.to_thread (arun_search, arun_qa, 스트리밍 웹 검색)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.threadpool_size, thread_name_prefix="to_thread")
+    )
+    
     # Initialize database
     init_db()
     logger.info("Database initialized")
     
+    # Warm up search service (임베딩 모델 + BM25 인덱스 로드를 첫 요청 전에 수행)
+    try:
+        await asyncio.to_thread(get_simple_search_service)
+        logger.info("Search service initialized")
+    except Exception as e:
+        # 실패해도 기동은 계속, 첫 검색 요청 시 다시 시도
+        logger.warning(
+            "Search service warmup failed",
+            extra={"error": str(e)},
+            exc_info=True
+        )
+    
     # Initialize LangSmith (if enabled)
     if settings.langsmith_tracing:
         import os
@@ -40,10 +65,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         os.environ["LANGCHAIN_PROJECT"] = settings.langsmith_project
         logger.info("LangSmith tracing enabled", extra={"project": settings.langsmith_project})
     
+    # Start background cache sweeper
+    sweeper_task = asyncio.create_task(cache_sweeper())
+    logger.info("Cache sweeper started")
+    
     yield
     
     # Cleanup
     logger.info("Shutting down application")
+    sweeper_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await sweeper_task
     close_db()
 
 
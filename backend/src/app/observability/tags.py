@@ -8,6 +8,9 @@ import os
 
 from ..config import get_settings
 
+# 실행 환경 태그 (설정은 프로세스 수명 동안 변하지 않으므로 한 번만 생성)
+_ENV_TAG = f"env:{get_settings().environment}"
+
 
 def get_base_tags() -> list[str]:
     """
@@ -20,8 +23,7 @@ def get_base_tags() -> list[str]:
         >>> get_base_tags()
         ['env:development']
     """
-    settings = get_settings()
-    return [f"env:{settings.environment}"]
+    return [_ENV_TAG]
 
 
 def get_feature_tags(
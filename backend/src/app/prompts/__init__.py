@@ -4,19 +4,37 @@ Jinja2 템플릿 렌더링 유틸리티
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import Dict, Any, Optional
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, select_autoescape
+
+from ..config import get_settings
 
 # 템플릿 디렉토리 경로
 TEMPLATE_DIR = Path(__file__).parent
 
-# Jinja2 환경 설정
+# 컴파일된 템플릿 바이트코드 캐시 경로 (새 프로세스에서 파싱/컴파일 생략)
+BYTECODE_CACHE_DIR = TEMPLATE_DIR / '.jinja_cache'
+
+
+def _create_bytecode_cache():
+    """바이트코드 캐시 생성 (디렉토리를 만들 수 없으면 사용하지 않음)"""
+    try:
+        BYTECODE_CACHE_DIR.mkdir(exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(directory=str(BYTECODE_CACHE_DIR))
+
+
+# Jinja2 환경 설정 (debug 가 아니면 템플릿 mtime 확인 생략)
 env = Environment(
     loader=FileSystemLoader(str(TEMPLATE_DIR)),
     autoescape=select_autoescape(['html', 'xml']),
     trim_blocks=True,
-    lstrip_blocks=True
+    lstrip_blocks=True,
+    bytecode_cache=_create_bytecode_cache(),
+    auto_reload=get_settings().debug
 )
 
 
@@ -32,8 +50,29 @@ def render_template(template_name: str, context: Dict[str, Any]) -> str:
         str: 렌더링된 프롬프트
     """
     template = env.get_template(template_name)
-    return template.render(**context)
+    # 키워드 인자로 풀지 않고 dict 를 그대로 전달 (컨텍스트 dict 복사 1회 절감)
+    return template.render(context)
+
+
+@lru_cache(maxsize=None)
+def load_template(template_name: str) -> Optional[Template]:
+    """
+    템플릿 파일을 한 번만 읽고 컴파일하여 재사용
+    
+    에이전트 노드의 프롬프트처럼 기본 Jinja2 설정(`Template(source)`)으로
+    렌더링하던 템플릿을 요청마다 파일 I/O + 파싱 없이 사용하기 위한 함수입니다.
+    
+    Args:
+        template_name: 템플릿 파일명 (예: 'policy_qa_hybrid_prompt.jinja2')
+    
+    Returns:
+        Optional[Template]: 컴파일된 템플릿 (파일이 없으면 None)
+    """
+    path = TEMPLATE_DIR / template_name
+    if not path.exists():
+        return None
+    return Template(path.read_text(encoding='utf-8'))
 
 
-__all__ = ['render_template']
+__all__ = ['render_template', 'load_template']
 
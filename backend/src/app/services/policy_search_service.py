@@ -6,18 +6,30 @@ Policy Search Service
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 from datetime import datetime
+from functools import cached_property
 
-from ..db.models import Policy
 from ..db.repositories import PolicyRepository
 from ..vector_store import get_qdrant_manager, get_embedder
 from ..domain.policy import PolicyResponse
 from ..config.logger import get_logger
+from ..cache import TTLCache
 from ..observability import trace_workflow, get_feature_tags
 from ..web_search.clients import TavilySearchClient
 # NOTE: create_search_workflow는 더 이상 사용하지 않음 (SimpleSearchService로 대체)
 
 logger = get_logger()
 
+# 웹 검색 보완 결과 캐시 (서비스가 요청마다 생성되므로 모듈 수준에서 공유)
+_web_search_cache: TTLCache[List[PolicyResponse]] = TTLCache(maxsize=512, ttl_seconds=3600)
+
+# 신뢰된 데이터(DB Row, 정제된 웹 결과)용 생성자 (Pydantic 검증 생략)
+_CONSTRUCT = PolicyResponse.model_construct
+
+
+def _normalize_query(query: str) -> str:
+    """캐시 키용 쿼리 정규화 (소문자 + 공백 정리)"""
+    return " ".join(query.lower().split())
+
 
 class PolicySearchService:
     """
@@ -45,10 +57,23 @@ class PolicySearchService:
         #   현재 요구사항은 "에이전트/LLM 없이, 우리가 정리한 정책 DB 기준으로 바로 검색 결과를 주는 것"이므로
         #   검색 API에서는 아래 리포지토리 기반 검색만 사용합니다.
         #
-        #   Qdrant/임베딩은 다른 기능(예: QA)에서 재사용할 수 있도록 초기화는 유지합니다.
-        self.qdrant_manager = get_qdrant_manager()
-        self.embedder = get_embedder()
-        self.tavily_client = TavilySearchClient()
+        #   Qdrant/임베딩/Tavily 는 요청마다 생성되는 서비스에서 쓰이지 않는 경우가 많으므로
+        #   처음 접근할 때 초기화합니다 (cached_property).
+    
+    @cached_property
+    def qdrant_manager(self):
+        """Qdrant 관리자 (지연 초기화)"""
+        return get_qdrant_manager()
+    
+    @cached_property
+    def embedder(self):
+        """임베딩 생성기 (지연 초기화)"""
+        return get_embedder()
+    
+    @cached_property
+    def tavily_client(self) -> TavilySearchClient:
+        """Tavily 클라이언트 (첫 웹 검색 시 초기화)"""
+        return TavilySearchClient()
     
     @trace_workflow(
         name="hybrid_search",
@@ -91,7 +116,7 @@ class PolicySearchService:
             #
             # 구현:
             #   - PolicyRepository.search 에서 program_name / program_overview 에 대해
-            #     LIKE 검색을 수행 (query가 없으면 전체 목록)
+            #     FULLTEXT(ngram) 검색을 수행 (query가 없으면 전체 목록)
             #   - region / category 는 그대로 필터링
             # ------------------------------------------------------------------
 
@@ -106,8 +131,8 @@ class PolicySearchService:
                 },
             )
 
-            # 1) 내부 DB 검색
-            policies = self.policy_repo.search(
+            # 1) 내부 DB 검색 (전체 개수도 같은 쿼리에서 함께 조회)
+            policies, total = self.policy_repo.search(
                 region=region,
                 category=category,
                 query=query,
@@ -115,21 +140,11 @@ class PolicySearchService:
                 offset=offset,
             )
 
-            # Policy ORM 객체를 PolicyResponse로 변환
+            # 검색 Row를 PolicyResponse로 변환
             policy_responses = [
                 self._to_response(policy, score=getattr(policy, "score", None))
                 for policy in policies
             ]
-            
-            # count도 query 파라미터를 포함해야 정확한 total을 계산할 수 있습니다
-            # 하지만 PolicyRepository.count는 query를 지원하지 않으므로,
-            # 검색 결과가 있을 때는 그 개수를 사용하고, 없을 때만 count를 사용합니다
-            if query:
-                # query가 있으면 검색 결과 개수를 total로 사용 (웹 검색 결과 포함 전)
-                total = len(policy_responses)
-            else:
-                # query가 없으면 필터만 적용한 전체 개수
-                total = self.policy_repo.count(region=region, category=category)
 
             # 2) 결과가 너무 적고 쿼리가 있을 때 웹 검색으로 보완
             web_results: List[PolicyResponse] = []
@@ -141,7 +156,7 @@ class PolicySearchService:
                     )
                     # 내부 DB 결과 뒤에 웹 검색 결과를 이어붙임
                     policy_responses.extend(web_results)
-                    total = len(policy_responses)
+                    total += len(web_results)
                 except Exception as e:
                     # 웹 검색 실패해도 DB 결과는 반환
                     logger.warning(
@@ -184,6 +199,12 @@ class PolicySearchService:
         Returns:
             List[PolicyResponse]: 웹 검색 결과를 PolicyResponse 형식으로 변환
         """
+        cache_key = (_normalize_query(query), max_results)
+        cached = _web_search_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Web search cache hit", extra={"query": query})
+            return list(cached)
+        
         try:
             # Tavily 웹 검색 실행
             web_results = self.tavily_client.search(
@@ -196,30 +217,35 @@ class PolicySearchService:
                 logger.warning("No web search results found")
                 return []
             
-            # 웹 검색 결과를 PolicyResponse 형식으로 변환
+            # 시각은 호출당 한 번만 계산
+            now = datetime.now().replace(microsecond=0)
+            today_str = now.strftime("%Y-%m-%d")
+            
+            # 웹 검색 결과를 PolicyResponse 형식으로 변환 (필드 타입을 맞춰 검증 생략)
             policy_responses = []
             for idx, result in enumerate(web_results):
+                url = result.get("url", "")
                 # 웹 검색 결과는 실제 정책이 아니므로 특별한 형식으로 변환
-                policy_response = PolicyResponse(
+                policy_response = _CONSTRUCT(
                     id=-1000 - idx,  # 음수 ID로 웹 검색 결과 표시
                     program_id=-1,
                     region="웹 검색",
                     category="웹 검색 결과",
                     program_name=result.get("title", "제목 없음"),
                     program_overview=result.get("content", ""),
-                    support_description=f"출처: {result.get('url', '')}",
+                    support_description=f"출처: {url}",
                     support_budget=0,
                     support_scale="웹 검색",
                     supervising_ministry="웹 검색",
                     apply_target="웹 검색 결과 - 자세한 내용은 출처 링크를 확인하세요",
-                    announcement_date=datetime.now().strftime("%Y-%m-%d"),
+                    announcement_date=today_str,
                     biz_process="",
-                    application_method=f"자세한 내용은 다음 링크를 참고하세요: {result.get('url', '')}",
-                    contact_agency=[result.get("url", "")],
+                    application_method=f"자세한 내용은 다음 링크를 참고하세요: {url}",
+                    contact_agency=[url],
                     contact_number=[],
                     required_documents=[],
-                    collected_date=datetime.now().strftime("%Y-%m-%d"),
-                    created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    collected_date=now.date(),
+                    created_at=now,
                     score=result.get("score", 0.5)
                 )
                 policy_responses.append(policy_response)
@@ -229,7 +255,9 @@ class PolicySearchService:
                 extra={"count": len(policy_responses)}
             )
             
-            return policy_responses
+            _web_search_cache.set(cache_key, policy_responses)
+            
+            return list(policy_responses)
             
         except Exception as e:
             logger.error(
@@ -269,12 +297,15 @@ class PolicySearchService:
             )
             raise
     
-    def _to_response(self, policy: Policy, score: Optional[float] = None) -> PolicyResponse:
+    def _to_response(self, policy: Any, score: Optional[float] = None) -> PolicyResponse:
         """
-        Policy 모델을 PolicyResponse로 변환
+        Policy 모델(또는 검색 Row)을 PolicyResponse로 변환
+        
+        DB 에서 읽은 신뢰된 값이므로 검증 없이 model_construct 로 생성합니다.
+        (검증을 생략하므로 타입 정규화는 여기서 수행)
         
         Args:
-            policy: Policy ORM 모델
+            policy: Policy ORM 모델 또는 동일 컬럼을 가진 Row
             score: 검색 스코어 (선택)
         
         Returns:
@@ -285,7 +316,16 @@ class PolicySearchService:
         if contact_agency and isinstance(contact_agency, str):
             contact_agency = [contact_agency]
         
-        return PolicyResponse(
+        # application_method는 JSON 컬럼이므로 배열이면 문자열로 변환
+        application_method = policy.application_method
+        if isinstance(application_method, list):
+            try:
+                application_method = "\n".join(application_method)
+            except TypeError:
+                # 문자열이 아닌 항목이 섞인 경우에만 변환
+                application_method = "\n".join(map(str, application_method))
+        
+        return _CONSTRUCT(
             id=policy.id,
             program_id=policy.program_id,
             region=policy.region,
@@ -299,11 +339,11 @@ class PolicySearchService:
             apply_target=policy.apply_target,
             announcement_date=policy.announcement_date,
             biz_process=policy.biz_process,
-            application_method=policy.application_method,
+            application_method=application_method,
             contact_agency=contact_agency,
             contact_number=policy.contact_number,
             required_documents=policy.required_documents,
             collected_date=policy.collected_date,
             created_at=policy.created_at,
             score=score
-        )
\ No newline at end of file
+        )
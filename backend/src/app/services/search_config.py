@@ -6,9 +6,15 @@ Search Configuration
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from enum import Enum
 
+try:
+    import ahocorasick
+except ImportError:  # 선택 의존성: 없으면 기존 부분 문자열 루프 사용
+    ahocorasick = None
+
 
 class SimilarityStrategy(Enum):
     """유사도 조정 전략"""
@@ -85,6 +91,14 @@ class SearchConfig:
     # 웹 검색 최대 결과 수
     web_search_max_results: int = 5
 
+    # 내부 검색과 동시에 웹 검색을 미리 시작할지 여부 (필터 없는 검색만)
+    # 웹 검색이 필요할 때 지연이 max(내부, 웹)으로 줄지만,
+    # 내부 결과가 충분한 검색에도 Tavily 호출 비용이 발생하므로 기본값은 비활성화
+    speculative_web_search: bool = False
+
+    # 선제 웹 검색 결과 대기 시간 (초)
+    web_search_timeout: float = 10.0
+
     # ==========================================================================
     # 하이브리드 검색 설정 (Dense + Sparse)
     # ==========================================================================
@@ -141,6 +155,45 @@ class SearchConfig:
     # 카테고리별 유사도 조정
     category_threshold_adjustments: Dict[str, float] = field(default_factory=lambda: {})
 
+    # 긴(구체적인) 키워드 순으로 정렬한 (키워드, 조정값) 튜플
+    _kw_items_sorted: Tuple[Tuple[str, float], ...] = field(default=(), init=False, repr=False, compare=False)
+
+    # _kw_items_sorted 로 만든 Aho-Corasick 오토마톤 (지연 생성, None 이면 재생성 필요)
+    _kw_automaton: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._refresh_keyword_index()
+
+    def _refresh_keyword_index(self) -> None:
+        """
+        keyword_threshold_adjustments 변경 후 정렬 튜플/오토마톤 갱신
+
+        긴 키워드가 먼저 매칭되도록 길이 내림차순으로 정렬합니다
+        (길이가 같으면 dict 순서 유지).
+        """
+        self._kw_items_sorted = tuple(
+            sorted(self.keyword_threshold_adjustments.items(), key=lambda item: -len(item[0]))
+        )
+        self._kw_automaton = None
+
+    def _get_kw_automaton(self) -> Any:
+        """
+        키워드 조정용 Aho-Corasick 오토마톤 반환 (필요 시 생성)
+
+        각 패턴의 값은 (정렬 순서, 조정값) 으로, 한 키워드에 여러 패턴이
+        매칭되면 기존 루프와 같이 _kw_items_sorted 에서 가장 앞선 조정값을 사용합니다.
+
+        Returns:
+            Any: ahocorasick.Automaton (패턴이 없으면 None)
+        """
+        if self._kw_automaton is None and self._kw_items_sorted:
+            automaton = ahocorasick.Automaton()
+            for order, (kw, adjustment) in enumerate(self._kw_items_sorted):
+                automaton.add_word(kw, (order, adjustment))
+            automaton.make_automaton()
+            self._kw_automaton = automaton
+        return self._kw_automaton
+
     def calculate_threshold(
         self,
         keywords: List[str] = None,
@@ -151,12 +204,62 @@ class SearchConfig:
         """
         동적으로 유사도 임계값 계산
 
+        결과 수는 적응형 조정에 영향을 주는 구간(부족/적정/초과)으로만 바꿔
+        같은 입력 조합은 LRU 캐시에서 바로 반환합니다.
+
         Args:
             keywords: 검색 키워드 리스트
             region: 지역 필터
             category: 카테고리 필터
             current_result_count: 현재 결과 수 (적응형 조정용)
 
+        Returns:
+            float: 계산된 유사도 임계값
+        """
+        # 적응형 조정 구간: -1 (목표 미만), 1 (목표 초과), 0 (적정 또는 조정 안 함)
+        bucket = 0
+        if self.similarity_strategy == SimilarityStrategy.ADAPTIVE and current_result_count is not None:
+            if current_result_count < self.target_min_results:
+                bucket = -1
+            elif current_result_count > self.target_max_results:
+                bucket = 1
+
+        return self._cached_threshold(tuple(keywords or ()), region, category, bucket)
+
+    @cached_property
+    def _cached_threshold(self) -> Callable[[Tuple[str, ...], Optional[str], Optional[str], int], float]:
+        """
+        인스턴스별 LRU 캐시가 적용된 임계값 계산 함수 (self 는 해시하지 않음)
+
+        설정이 바뀌면 update_search_config 에서 cache_clear() 로 비웁니다.
+        """
+        @lru_cache(maxsize=4096)
+        def cached(
+            keywords: Tuple[str, ...],
+            region: Optional[str],
+            category: Optional[str],
+            bucket: int
+        ) -> float:
+            return self._compute_threshold(keywords, region, category, bucket)
+
+        return cached
+
+    def _compute_threshold(
+        self,
+        keywords: Tuple[str, ...],
+        region: Optional[str],
+        category: Optional[str],
+        bucket: int
+    ) -> float:
+        """
+        유사도 임계값 계산 (캐시 없이)
+
+        Args:
+            keywords: 검색 키워드 튜플
+            region: 지역 필터
+            category: 카테고리 필터
+            bucket: 적응형 조정 구간 (-1, 0, 1)
+
         Returns:
             float: 계산된 유사도 임계값
         """
@@ -164,28 +267,34 @@ class SearchConfig:
 
         # 키워드별 조정
         if keywords:
-            for keyword in keywords:
-                for kw, adjustment in self.keyword_threshold_adjustments.items():
-                    if kw in keyword:
-                        threshold += adjustment
-                        break
+            automaton = self._get_kw_automaton() if ahocorasick is not None else None
+            if automaton is not None:
+                for keyword in keywords:
+                    matches = [value for _, value in automaton.iter(keyword)]
+                    if matches:
+                        threshold += min(matches)[1]
+            else:
+                for keyword in keywords:
+                    for kw, adjustment in self._kw_items_sorted:
+                        if kw in keyword:
+                            threshold += adjustment
+                            break
 
         # 지역별 조정
-        if region and region in self.region_threshold_adjustments:
-            threshold += self.region_threshold_adjustments[region]
+        if region:
+            threshold += self.region_threshold_adjustments.get(region, 0.0)
 
         # 카테고리별 조정
-        if category and category in self.category_threshold_adjustments:
-            threshold += self.category_threshold_adjustments[category]
+        if category:
+            threshold += self.category_threshold_adjustments.get(category, 0.0)
 
         # 적응형 조정: 결과 수에 따라
-        if self.similarity_strategy == SimilarityStrategy.ADAPTIVE and current_result_count is not None:
-            if current_result_count < self.target_min_results:
-                # 결과가 적으면 임계값 낮춤
-                threshold -= self.threshold_step
-            elif current_result_count > self.target_max_results:
-                # 결과가 많으면 임계값 높임
-                threshold += self.threshold_step
+        if bucket < 0:
+            # 결과가 적으면 임계값 낮춤
+            threshold -= self.threshold_step
+        elif bucket > 0:
+            # 결과가 많으면 임계값 높임
+            threshold += self.threshold_step
 
         # 범위 제한
         threshold = max(self.min_score_threshold, min(self.max_score_threshold, threshold))
@@ -251,4 +360,11 @@ def update_search_config(**kwargs) -> SearchConfig:
         if hasattr(config, key):
             setattr(config, key, value)
 
+    # 키워드 조정값이 바뀌면 정렬 튜플/오토마톤 갱신
+    if "keyword_threshold_adjustments" in kwargs:
+        config._refresh_keyword_index()
+
+    # 임계값 계산에 쓰이는 설정이 바뀌었을 수 있으므로 캐시 비움
+    config._cached_threshold.cache_clear()
+
     return config
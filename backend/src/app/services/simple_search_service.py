@@ -11,18 +11,32 @@ Simple Search Service
 - 검색 품질 평가 지표
 """
 
+import logging
+import os
+import pickle
+import re
+import threading
 import time
 import uuid
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import date
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
 
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from ..db.models import Policy
 from ..db.engine import get_db
 from ..vector_store import get_qdrant_manager, get_embedder, get_hybrid_searcher, HybridSearcher
 from ..config.logger import get_logger
+from ..cache import TTLCache, get_policy_row_cache
 from ..config import get_settings
 from ..observability import trace_workflow, get_feature_tags
 from ..web_search.clients.tavily_client import get_tavily_client
@@ -31,6 +45,228 @@ from .search_config import get_search_config, SearchConfig, SearchMode
 logger = get_logger()
 settings = get_settings()
 
+# Dense / Sparse 검색 병렬 실행용 스레드 풀
+_retrieval_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="retrieval")
+
+# 선제 웹 검색(Tavily) 실행용 스레드 풀 (검색 스레드 풀과 분리)
+_web_search_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="web-search")
+
+# 쿼리 임베딩 캐시 (정규화된 쿼리 -> 벡터)
+_query_embedding_cache: TTLCache[List[float]] = TTLCache(maxsize=2048, ttl_seconds=300)
+
+# 검색 결과 캐시 ((쿼리, 필터, 모드) -> 결과 dict)
+_search_result_cache: TTLCache[Dict[str, Any]] = TTLCache(maxsize=512, ttl_seconds=300)
+
+
+# 검색 결과 조립에 필요한 정책 컬럼
+_POLICY_COLUMNS = (
+    Policy.id,
+    Policy.program_name,
+    Policy.program_overview,
+    Policy.region,
+    Policy.category,
+    Policy.support_description,
+    Policy.support_budget,
+    Policy.apply_target,
+    Policy.announcement_date,
+    Policy.application_method,
+    Policy.contact_agency,
+    Policy.supervising_ministry,
+    Policy.support_scale,
+    Policy.created_at,
+)
+
+# 키워드 추출용 불용어 (조사) 및 토큰 패턴 (2글자 이상 한글/영문/숫자, "R&D" 등 포함)
+_STOPWORDS = frozenset({"을", "를", "이", "가", "은", "는", "에", "의", "로", "와", "과", "도", "만", "뿐"})
+_TOKEN_RE = re.compile(r"[가-힣A-Za-z0-9&]{2,}")
+
+
+def _build_doc(policy: Row, content: str, score: float, match_type: str) -> Dict[str, Any]:
+    """
+    정책 Row를 검색 결과 문서 dict로 변환
+
+    Args:
+        policy: 정책 Row
+        content: 매칭된 청크 내용
+        score: 검색 점수
+        match_type: 매칭 타입 (dense, sparse, hybrid, vector, filter)
+
+    Returns:
+        Dict: 검색 결과 문서
+    """
+    return {
+        "policy_id": policy.id,
+        "program_name": policy.program_name,
+        "program_overview": policy.program_overview,
+        "content": content,
+        "score": score,
+        "match_type": match_type,
+        "region": policy.region,
+        "category": policy.category,
+        "support_description": policy.support_description,
+        "support_budget": policy.support_budget,
+        "apply_target": policy.apply_target,
+        "announcement_date": policy.announcement_date,
+        "application_method": policy.application_method,
+        "created_at": str(policy.created_at) if policy.created_at else None,
+        "metadata": {
+            "supervising_ministry": policy.supervising_ministry,
+            "support_scale": policy.support_scale,
+            "contact_agency": policy.contact_agency
+        }
+    }
+
+
+# _build_doc / _web_search 가 항상 채우는 키 (PolicyResult 변환 시 C 레벨 일괄 조회)
+_DOC_FIELDS = itemgetter(
+    "policy_id", "program_name", "program_overview", "region", "category",
+    "support_description", "support_budget", "apply_target", "announcement_date",
+    "application_method", "created_at", "score", "metadata"
+)
+_DOC_METADATA_FIELDS = itemgetter("support_scale", "supervising_ministry", "contact_agency")
+_WEB_SOURCE_FIELDS = itemgetter("url", "title", "snippet", "fetched_date", "score")
+
+
+# 검색 요약 문구 템플릿 (_generate_summary 전용)
+_SUMMARY_EMPTY = "'{query}'에 대한 검색 결과가 없습니다."
+_SUMMARY_FOUND = "'{query}' 검색 결과 {total}건을 찾았습니다."
+_SUMMARY_TOP_POLICY = " '{top_policy}'이(가) 가장 관련도가 높습니다 (유사도: {top_score:.0%})."
+_SUMMARY_WEB_EXTRA = " 웹 검색으로 {web_count}건의 추가 정보를 확인했습니다."
+_SUMMARY_WEB_ONLY = "'{query}'에 대한 내부 정책을 찾지 못해 웹 검색 결과 {web_count}건을 제공합니다."
+
+
+@lru_cache(maxsize=256)
+def _format_summary(
+    query: str,
+    total: int,
+    web_count: int,
+    top_policy: Optional[str],
+    top_score: float
+) -> str:
+    """
+    검색 요약 문구 생성 (같은 결과 구성이면 캐시된 문구 재사용)
+
+    Args:
+        query: 검색 쿼리
+        total: 전체 결과 수
+        web_count: 웹 검색 결과 수
+        top_policy: 최상위 정책명 (내부 결과가 없으면 None)
+        top_score: 최고 유사도
+
+    Returns:
+        str: 검색 요약
+    """
+    if total == 0:
+        return _SUMMARY_EMPTY.format(query=query)
+
+    # 정책 리스트는 내부 결과 뒤에 웹 결과가 붙는 구조
+    if web_count == total:
+        return _SUMMARY_WEB_ONLY.format(query=query, web_count=web_count)
+
+    summary = _SUMMARY_FOUND.format(query=query, total=total)
+    if top_score >= 0.5:
+        summary += _SUMMARY_TOP_POLICY.format(
+            top_policy=top_policy or "정책",
+            top_score=top_score
+        )
+    if web_count > 0:
+        summary += _SUMMARY_WEB_EXTRA.format(web_count=web_count)
+
+    return summary
+
+
+@lru_cache(maxsize=512)
+def _build_tavily_query(
+    keywords: Tuple[str, ...],
+    region: Optional[str],
+    target_group: Optional[str],
+    query: str
+) -> str:
+    """
+    Tavily 웹 검색 쿼리 구성
+
+    Args:
+        keywords: 상위 키워드 (없으면 원본 쿼리 사용)
+        region: 지역 ("전국"은 제외)
+        target_group: 대상 그룹
+        query: 원본 쿼리
+
+    Returns:
+        str: 웹 검색 쿼리
+    """
+    return " ".join(filter(None, (
+        *(keywords or (query,)),
+        region if region != "전국" else None,
+        target_group,
+        "정부 지원 사업"
+    )))
+
+
+def _as_csv(value: Any) -> Any:
+    """리스트 값을 쉼표 구분 문자열로 변환 (빈 리스트는 None, 리스트가 아니면 그대로)"""
+    if isinstance(value, list):
+        if not value:
+            return None
+        try:
+            # JSON 컬럼 값은 대부분 문자열 리스트이므로 str() 변환 없이 바로 결합
+            return ", ".join(value)
+        except TypeError:
+            return ", ".join(map(str, value))
+    return value
+
+
+@lru_cache(maxsize=512)
+def _favicon_for(url: str) -> str:
+    """
+    URL의 도메인에 대한 favicon URL 생성 (Google favicon API 사용)
+
+    Args:
+        url: 웹 페이지 URL
+
+    Returns:
+        str: favicon URL (도메인을 알 수 없으면 빈 문자열)
+    """
+    domain = url.partition("//")[2].partition("/")[0]
+    if not domain:
+        return ""
+    return f"https://www.google.com/s2/favicons?domain={domain}&sz=64"
+
+
+def _matches_filters(
+    row: Row,
+    region: Optional[str],
+    category: Optional[str],
+    target_group: Optional[str]
+) -> bool:
+    """캐시된 정책 Row 가 검색 필터 조건을 만족하는지 확인 (SQL WHERE 절과 동일 조건)"""
+    if region and row.region != region:
+        return False
+    if category and row.category != category:
+        return False
+    if target_group and target_group not in (row.apply_target or ""):
+        return False
+    return True
+
+
+def _best_chunks(results: List[Dict[str, Any]]) -> Dict[int, Tuple[float, str]]:
+    """Qdrant 결과에서 정책 ID별 최고 점수 청크 (점수, 콘텐츠) 추출 (첫 등장 순서 보존)"""
+    best: Dict[int, Tuple[float, str]] = {}
+    for result in results:
+        payload = result.get("payload", {})
+        policy_id = payload.get("policy_id")
+        if not policy_id:
+            continue
+        score = result.get("score", 0.0)
+        current = best.get(policy_id)
+        if current is None or score > current[0]:
+            best[policy_id] = (score, payload.get("content", ""))
+    return best
+
+
+def _normalize_query(query: str) -> str:
+    """캐시 키용 쿼리 정규화 (앞뒤 공백 제거, 연속 공백 축약, 소문자)"""
+    return " ".join(query.split()).lower()
+
 
 @dataclass
 class SearchMetrics:
@@ -46,30 +282,45 @@ class SearchMetrics:
     web_search_count: int = 0           # 웹 검색 결과 수
     search_time_ms: int = 0             # 검색 소요 시간 (ms)
     sufficiency_reason: str = ""        # 충분성 판단 사유
-    search_mode: str = "hybrid"         # 검색 모드 (dense, sparse, hybrid)
+    search_mode: str = "hybrid"         # 검색 모드 (dense, sparse, hybrid, filter_only)
     dense_count: int = 0                # Dense 검색 결과 수
     sparse_count: int = 0               # Sparse 검색 결과 수
     hybrid_count: int = 0               # 둘 다 매칭된 수
 
+    # to_dict 시 소수점 4자리로 반올림할 필드
+    _ROUND_FIELDS = ("top_score", "avg_score", "min_score", "score_threshold_used")
+
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
-        return {
-            "total_candidates": self.total_candidates,
-            "filtered_count": self.filtered_count,
-            "final_count": self.final_count,
-            "top_score": round(self.top_score, 4),
-            "avg_score": round(self.avg_score, 4),
-            "min_score": round(self.min_score, 4),
-            "score_threshold_used": round(self.score_threshold_used, 4),
-            "web_search_triggered": self.web_search_triggered,
-            "web_search_count": self.web_search_count,
-            "search_time_ms": self.search_time_ms,
-            "sufficiency_reason": self.sufficiency_reason,
-            "search_mode": self.search_mode,
-            "dense_count": self.dense_count,
-            "sparse_count": self.sparse_count,
-            "hybrid_count": self.hybrid_count
-        }
+        data = asdict(self)
+        for key in self._ROUND_FIELDS:
+            data[key] = round(data[key], 4)
+        return data
+
+
+@dataclass(slots=True)
+class PolicyResult:
+    """검색 결과 정책 항목 (내부 정책 또는 웹 검색 결과)"""
+    id: int
+    program_id: int
+    program_name: str
+    program_overview: Optional[str] = None
+    region: Optional[str] = None
+    category: Optional[str] = None
+    support_description: Optional[str] = None
+    support_budget: Optional[int] = None
+    support_scale: Optional[str] = None
+    supervising_ministry: Optional[str] = None
+    apply_target: Optional[str] = None
+    announcement_date: Optional[str] = None
+    application_method: Optional[str] = None
+    contact_agency: Optional[str] = None
+    created_at: Optional[str] = None
+    score: Optional[float] = None
+    source_type: str = "internal"       # 출처 (internal, web)
+    url: Optional[str] = None           # 웹 검색 결과 전용
+    favicon_url: Optional[str] = None
+    screenshot_url: Optional[str] = None
 
 
 @dataclass
@@ -81,13 +332,12 @@ class SearchEvidence:
     match_type: str = "vector"          # 매칭 타입 (vector, keyword, hybrid)
 
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
-        return {
-            "policy_id": self.policy_id,
-            "matched_content": self.matched_content[:200] + "..." if len(self.matched_content) > 200 else self.matched_content,
-            "score": round(self.score, 4),
-            "match_type": self.match_type
-        }
+        """딕셔너리로 변환 (matched_content는 200자로 절단)"""
+        data = asdict(self)
+        if len(self.matched_content) > 200:
+            data["matched_content"] = self.matched_content[:200] + "..."
+        data["score"] = round(self.score, 4)
+        return data
 
 
 class SimpleSearchService:
@@ -110,9 +360,11 @@ class SimpleSearchService:
         self.hybrid_searcher = get_hybrid_searcher(
             dense_weight=self.config.dense_weight,
             sparse_weight=self.config.sparse_weight,
-            use_rrf=self.config.use_rrf
+            use_rrf=self.config.use_rrf,
+            rrf_k=self.config.rrf_k
         )
         self._bm25_index_built = False
+        self._load_bm25_index()
 
     @trace_workflow(
         name="simple_search",
@@ -153,25 +405,60 @@ class SimpleSearchService:
         start_time = time.time()
         session_id = session_id or str(uuid.uuid4())
 
-        logger.info(
-            "Starting simple search",
-            extra={
-                "session_id": session_id,
-                "query": query,
-                "region": region,
-                "category": category
-            }
+        cache_key = (
+            _normalize_query(query),
+            region,
+            category,
+            target_group,
+            include_web_search,
+            self.config.search_mode.value
         )
+        cached = _search_result_cache.get(cache_key)
+        if cached is not None:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Simple search cache hit",
+                    extra={"session_id": session_id, "query": query}
+                )
+            return {**cached, "session_id": session_id}
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Starting simple search",
+                extra={
+                    "session_id": session_id,
+                    "query": query,
+                    "region": region,
+                    "category": category
+                }
+            )
 
         metrics = SearchMetrics()
         evidence_list: List[SearchEvidence] = []
-        policies: List[Dict[str, Any]] = []
+        policies: List[PolicyResult] = []
         web_sources: List[Dict[str, Any]] = []
 
         try:
+            # 검색어 없이 필터만 있는 탐색 요청은 임베딩/벡터/BM25 검색 생략
+            filter_only = not query.strip()
+
             # 1. 키워드 추출 (간단한 규칙 기반)
             keywords = self._extract_keywords(query)
 
+            # 1-1. 웹 검색 선제 실행 (설정 시)
+            # 웹 결과는 지역/카테고리 필터를 적용할 수 없으므로 필터 없는 검색에서만 수행
+            web_future: Optional[Future] = None
+            if (
+                include_web_search and
+                self.config.speculative_web_search and
+                not filter_only and
+                not region and
+                not category
+            ):
+                web_future = _web_search_executor.submit(
+                    self._web_search, query, keywords, region, target_group
+                )
+
             # 2. 동적 유사도 임계값 계산
             initial_threshold = self.config.calculate_threshold(
                 keywords=keywords,
@@ -182,7 +469,14 @@ class SimpleSearchService:
             metrics.search_mode = self.config.search_mode.value
 
             # 3. 검색 수행 (모드에 따라 다른 검색 전략)
-            if self.config.search_mode == SearchMode.HYBRID:
+            if filter_only:
+                metrics.search_mode = "filter_only"
+                retrieved_docs, evidence_list = self._filter_only_search(
+                    region=region,
+                    category=category,
+                    target_group=target_group
+                )
+            elif self.config.search_mode == SearchMode.HYBRID:
                 # 하이브리드 검색 (Dense + Sparse)
                 retrieved_docs, evidence_list = self._hybrid_search(
                     query=query,
@@ -205,7 +499,7 @@ class SimpleSearchService:
             metrics.total_candidates = len(retrieved_docs)
 
             # 4. 결과가 부족하면 임계값 낮춰서 재검색
-            if len(retrieved_docs) < self.config.target_min_results:
+            if not filter_only and len(retrieved_docs) < self.config.target_min_results:
                 lower_threshold = self.config.calculate_threshold(
                     keywords=keywords,
                     region=region,
@@ -243,21 +537,25 @@ class SimpleSearchService:
                         )
                     metrics.total_candidates = len(retrieved_docs)
 
-            # 5. 결과 정렬 및 제한
-            retrieved_docs.sort(key=lambda x: x.get("score", 0), reverse=True)
+            # 5. 결과 제한 (검색 단계에서 이미 점수순으로 조립됨)
             retrieved_docs = retrieved_docs[:self.config.result_limit]
             metrics.filtered_count = len(retrieved_docs)
 
             # 6. 점수 통계 계산
             if retrieved_docs:
-                scores = [doc.get("score", 0) for doc in retrieved_docs]
-                metrics.top_score = max(scores)
-                metrics.avg_score = sum(scores) / len(scores)
-                metrics.min_score = min(scores)
+                scores = np.fromiter(
+                    (doc["score"] for doc in retrieved_docs),
+                    dtype=np.float64,
+                    count=len(retrieved_docs)
+                )
+                metrics.top_score = float(scores.max())
+                metrics.avg_score = float(scores.mean())
+                metrics.min_score = float(scores.min())
 
             # 7. 웹 검색 충분성 검사
             should_web_search = (
                 include_web_search and
+                not filter_only and
                 self.config.should_trigger_web_search(
                     result_count=len(retrieved_docs),
                     top_score=metrics.top_score
@@ -270,87 +568,84 @@ class SimpleSearchService:
                     f"내부 검색 결과 부족 (결과: {len(retrieved_docs)}건, "
                     f"최고 점수: {metrics.top_score:.2f}). 웹 검색으로 보충합니다."
                 )
-                web_sources = self._web_search(query, keywords, region, target_group)
+                if web_future is not None:
+                    try:
+                        web_sources = web_future.result(
+                            timeout=self.config.web_search_timeout
+                        )
+                    except FutureTimeoutError:
+                        logger.warning(
+                            "Speculative web search timed out",
+                            extra={
+                                "session_id": session_id,
+                                "timeout": self.config.web_search_timeout
+                            }
+                        )
+                else:
+                    web_sources = self._web_search(query, keywords, region, target_group)
                 metrics.web_search_count = len(web_sources)
             else:
+                if web_future is not None:
+                    # 내부 결과가 충분하면 선제 웹 검색 결과는 사용하지 않음
+                    web_future.cancel()
                 metrics.sufficiency_reason = (
                     f"내부 검색 결과 충분 (결과: {len(retrieved_docs)}건, "
                     f"최고 점수: {metrics.top_score:.2f})."
                 )
 
             # 8. 최종 정책 리스트 구성
-            for doc in retrieved_docs:
-                metadata = doc.get("metadata", {})
-                
-                # contact_agency가 리스트인 경우 문자열로 변환 (이미 변환되었을 수도 있음)
-                contact_agency = metadata.get("contact_agency")
-                if isinstance(contact_agency, list):
-                    contact_agency = ", ".join(str(item) for item in contact_agency) if contact_agency else None
-                
-                # application_method가 리스트인 경우 문자열로 변환 (이미 변환되었을 수도 있음)
-                application_method = doc.get("application_method")
-                if isinstance(application_method, list):
-                    application_method = ", ".join(str(item) for item in application_method) if application_method else None
-                
-                policy = {
-                    "id": doc.get("policy_id"),
-                    "program_id": doc.get("policy_id"),
-                    "program_name": doc.get("program_name") or "",
-                    "program_overview": doc.get("program_overview"),
-                    "region": doc.get("region"),
-                    "category": doc.get("category"),
-                    "support_description": doc.get("support_description") or "",
-                    "support_budget": doc.get("support_budget"),
-                    "support_scale": metadata.get("support_scale"),
-                    "supervising_ministry": metadata.get("supervising_ministry"),
-                    "apply_target": doc.get("apply_target") or "",
-                    "announcement_date": doc.get("announcement_date"),
-                    "application_method": application_method,
-                    "contact_agency": contact_agency,
-                    "created_at": doc.get("created_at"),
-                    "score": doc.get("score"),
-                    "source_type": "internal"
-                }
-                policies.append(policy)
+            for (
+                policy_id, program_name, program_overview, doc_region, doc_category,
+                support_description, support_budget, apply_target, announcement_date,
+                application_method, created_at, score, metadata
+            ) in map(_DOC_FIELDS, retrieved_docs):
+                support_scale, supervising_ministry, contact_agency = _DOC_METADATA_FIELDS(metadata)
+
+                policies.append(PolicyResult(
+                    id=policy_id,
+                    program_id=policy_id,
+                    program_name=program_name or "",
+                    program_overview=program_overview,
+                    region=doc_region,
+                    category=doc_category,
+                    support_description=support_description or "",
+                    support_budget=support_budget,
+                    support_scale=support_scale,
+                    supervising_ministry=supervising_ministry,
+                    apply_target=apply_target or "",
+                    announcement_date=announcement_date,
+                    # JSON 컬럼(리스트)은 응답용 문자열로 변환
+                    application_method=_as_csv(application_method),
+                    contact_agency=_as_csv(contact_agency),
+                    created_at=created_at,
+                    score=score,
+                    source_type="internal"
+                ))
 
             # 웹 검색 결과 추가 (region/category 필터가 적용되지 않은 경우에만)
             # 웹 검색 결과는 필터링할 수 없으므로, 필터가 있으면 제외
             if not region and not category:
-                for idx, source in enumerate(web_sources):
-                    url = source.get("url", "")
-                    
-                    # Favicon URL 생성 (Google favicon API 사용)
-                    from urllib.parse import urlparse
-                    try:
-                        parsed_url = urlparse(url)
-                        domain = parsed_url.netloc
-                        favicon_url = f"https://www.google.com/s2/favicons?domain={domain}&sz=64"
-                    except:
-                        favicon_url = ""
-                    
-                    web_policy = {
-                        "id": -1000 - idx,
-                        "program_id": -1,
-                        "program_name": source.get("title", "웹 검색 결과"),
-                        "program_overview": source.get("snippet", ""),
-                        "region": "웹 검색",
-                        "category": "웹 검색 결과",
-                        "support_description": source.get("snippet", ""),
-                        "support_budget": None,
-                        "support_scale": None,
-                        "supervising_ministry": None,
-                        "apply_target": "웹 검색 결과 - 자세한 내용은 출처 링크를 확인하세요",
-                        "announcement_date": source.get("fetched_date"),
-                        "application_method": url,
-                        "contact_agency": None,
-                        "created_at": source.get("fetched_date"),
-                        "score": source.get("score", 0.5),
-                        "source_type": "web",
-                        "url": url,
-                        "favicon_url": favicon_url,
-                        "screenshot_url": ""  # 스크린샷은 비활성화 (유료 서비스)
-                    }
-                    policies.append(web_policy)
+                for idx, (url, title, snippet, fetched_date, score) in enumerate(
+                    map(_WEB_SOURCE_FIELDS, web_sources)
+                ):
+                    policies.append(PolicyResult(
+                        id=-1000 - idx,
+                        program_id=-1,
+                        program_name=title,
+                        program_overview=snippet,
+                        region="웹 검색",
+                        category="웹 검색 결과",
+                        support_description=snippet,
+                        apply_target="웹 검색 결과 - 자세한 내용은 출처 링크를 확인하세요",
+                        announcement_date=fetched_date,
+                        application_method=url,
+                        created_at=fetched_date,
+                        score=score,
+                        source_type="web",
+                        url=url,
+                        favicon_url=_favicon_for(url),
+                        screenshot_url=""  # 스크린샷은 비활성화 (유료 서비스)
+                    ))
 
             metrics.final_count = len(policies)
 
@@ -364,22 +659,23 @@ class SimpleSearchService:
             elapsed_time = time.time() - start_time
             metrics.search_time_ms = int(elapsed_time * 1000)
 
-            logger.info(
-                "Simple search completed",
-                extra={
-                    "session_id": session_id,
-                    "total_count": metrics.final_count,
-                    "search_time_ms": metrics.search_time_ms,
-                    "top_score": metrics.top_score,
-                    "web_search_triggered": metrics.web_search_triggered
-                }
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Simple search completed",
+                    extra={
+                        "session_id": session_id,
+                        "total_count": metrics.final_count,
+                        "search_time_ms": metrics.search_time_ms,
+                        "top_score": metrics.top_score,
+                        "web_search_triggered": metrics.web_search_triggered
+                    }
+                )
 
-            return {
+            result = {
                 "session_id": session_id,
                 "original_query": query,
                 "summary": summary,
-                "policies": policies,
+                "policies": [asdict(policy) for policy in policies],
                 "total_count": len(policies),
                 "top_score": metrics.top_score,
                 "is_sufficient": not metrics.web_search_triggered,
@@ -400,6 +696,9 @@ class SimpleSearchService:
                 },
                 "error": None
             }
+            _search_result_cache.set(cache_key, result)
+
+            return result
 
         except Exception as e:
             elapsed_time = time.time() - start_time
@@ -448,61 +747,205 @@ class SimpleSearchService:
         Returns:
             List[str]: 키워드 리스트
         """
-        # 불용어
-        stopwords = {"을", "를", "이", "가", "은", "는", "에", "의", "로", "와", "과", "도", "만", "뿐"}
-
-        # 공백으로 분리 후 필터링
-        words = query.split()
-        keywords = [w for w in words if w not in stopwords and len(w) > 1]
-
-        return keywords
+        return [token for token in _TOKEN_RE.findall(query) if token not in _STOPWORDS]
 
     def _build_bm25_index_if_needed(self) -> None:
         """
         BM25 인덱스 구축 (필요시)
 
-        처음 하이브리드 검색 호출 시 한 번만 인덱스 구축
+        디스크 캐시가 없으면 처음 하이브리드 검색 호출 시 한 번만 인덱스 구축
         """
         if self._bm25_index_built:
             return
 
         logger.info("Building BM25 index for hybrid search")
+        # 인덱스 구축 실패 시 Dense 검색만 사용
+        self._bm25_index_built = self._rebuild_bm25_index()
 
-        try:
-            # Qdrant에서 모든 문서 조회
-            all_docs = self.qdrant_manager.get_all_documents(limit=10000)
+    def _rebuild_bm25_index(self) -> bool:
+        """
+        Qdrant 전체 문서로 BM25 인덱스를 구축하고 디스크에 저장
 
-            # BM25 인덱스용 문서 준비
-            documents = []
-            for doc in all_docs:
-                payload = doc.get("payload", {})
+        Returns:
+            bool: 구축 성공 여부
+        """
+        try:
+            # Qdrant scroll로 페이지 단위 순회하며 policy_id별 첫 문서만 수집
+            contents: Dict[int, str] = {}
+            for doc in self.qdrant_manager.iter_documents(
+                with_payload=["policy_id", "content"]
+            ):
+                payload = doc.get("payload") or {}
                 policy_id = payload.get("policy_id")
-                content = payload.get("content", "")
-
-                if policy_id and content:
-                    documents.append({
-                        "id": policy_id,
-                        "content": content
-                    })
-
-            # 중복 제거 (같은 policy_id는 한 번만)
-            seen_ids = set()
-            unique_docs = []
-            for doc in documents:
-                if doc["id"] not in seen_ids:
-                    unique_docs.append(doc)
-                    seen_ids.add(doc["id"])
+                content = payload.get("content")
+
+                if policy_id and content and policy_id not in contents:
+                    contents[policy_id] = content
+
+            unique_docs = [
+                {"id": policy_id, "content": content}
+                for policy_id, content in contents.items()
+            ]
 
             # BM25 인덱스 구축
             self.hybrid_searcher.build_sparse_index(unique_docs)
-            self._bm25_index_built = True
 
             logger.info(f"BM25 index built with {len(unique_docs)} documents")
 
+            self._save_bm25_index(len(unique_docs))
+            return True
+
         except Exception as e:
             logger.error(f"Error building BM25 index: {e}", exc_info=True)
-            # 인덱스 구축 실패 시 Dense 검색만 사용
-            self._bm25_index_built = False
+            return False
+
+    def _save_bm25_index(self, doc_count: int) -> None:
+        """
+        구축된 BM25 인덱스를 디스크에 저장
+
+        다른 워커가 읽는 중일 수 있으므로 임시 파일에 쓴 뒤 교체
+
+        Args:
+            doc_count: 인덱스 문서 수
+        """
+        path = Path(settings.bm25_cache_path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as f:
+                pickle.dump(
+                    (self.hybrid_searcher.bm25_index, doc_count, time.time()),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, path)
+
+        except Exception as e:
+            logger.warning(f"Failed to save BM25 index cache: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _load_bm25_index(self) -> None:
+        """
+        디스크에 저장된 BM25 인덱스 로드
+
+        캐시가 TTL을 넘겼으면 저장된 인덱스로 먼저 서비스하고
+        백그라운드 스레드에서 재구축
+        """
+        path = Path(settings.bm25_cache_path)
+
+        try:
+            with path.open("rb") as f:
+                bm25_index, doc_count, built_at = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Failed to load BM25 index cache: {e}")
+            return
+
+        self.hybrid_searcher.bm25_index = bm25_index
+        self._bm25_index_built = True
+
+        logger.info(f"BM25 index loaded from {path} ({doc_count} documents)")
+
+        if time.time() - built_at > settings.bm25_cache_ttl_seconds:
+            threading.Thread(
+                target=self._rebuild_bm25_index,
+                name="bm25-rebuild",
+                daemon=True
+            ).start()
+
+    @staticmethod
+    def _filtered_policies(
+        db: Session,
+        policy_ids: List[int],
+        region: Optional[str],
+        category: Optional[str],
+        target_group: Optional[str]
+    ) -> Dict[int, Row]:
+        """
+        검색된 정책 ID 중 필터 조건을 만족하는 정책 조회
+
+        필터는 WHERE 절로 처리하여 걸러질 행을 MySQL에서 가져오지 않으며,
+        ORM 객체 대신 필요한 컬럼만 Row 튜플로 조회. 조회한 Row 는
+        정책 Row 캐시에 보관하여 이후 검색에서 MySQL 조회를 생략
+
+        Args:
+            db: DB 세션
+            policy_ids: 검색된 정책 ID 리스트
+            region: 지역 필터
+            category: 카테고리 필터
+            target_group: 대상 그룹 필터 (apply_target 부분 일치)
+
+        Returns:
+            Dict[int, Row]: 정책 ID -> 정책 Row
+        """
+        # 캐시된 Row 는 필터를 Python 에서 확인하고, 미스 ID 만 MySQL 에서 조회
+        row_cache = get_policy_row_cache()
+        by_id: Dict[int, Row] = {}
+        misses: List[int] = []
+
+        for policy_id in policy_ids:
+            row = row_cache.get(policy_id)
+            if row is None:
+                misses.append(policy_id)
+            elif _matches_filters(row, region, category, target_group):
+                by_id[policy_id] = row
+
+        if not misses:
+            return by_id
+
+        stmt = select(*_POLICY_COLUMNS).where(Policy.id.in_(misses))
+
+        if region:
+            stmt = stmt.where(Policy.region == region)
+        if category:
+            stmt = stmt.where(Policy.category == category)
+        if target_group:
+            stmt = stmt.where(Policy.apply_target.contains(target_group, autoescape=True))
+
+        for row in db.execute(stmt):
+            row_cache.set(row.id, row)
+            by_id[row.id] = row
+
+        return by_id
+
+    def _filter_only_search(
+        self,
+        region: Optional[str],
+        category: Optional[str],
+        target_group: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], List[SearchEvidence]]:
+        """
+        필터 전용 검색 (검색어 없음)
+
+        임베딩/벡터/BM25 검색 없이 MySQL에서 필터 조건으로 최신 공고순 조회
+
+        Args:
+            region: 지역 필터
+            category: 카테고리 필터
+            target_group: 대상 그룹 필터
+
+        Returns:
+            Tuple[List[Dict], List[SearchEvidence]]: (검색 결과, 빈 검색 근거)
+        """
+        stmt = select(*_POLICY_COLUMNS)
+
+        if region:
+            stmt = stmt.where(Policy.region == region)
+        if category:
+            stmt = stmt.where(Policy.category == category)
+        if target_group:
+            stmt = stmt.where(Policy.apply_target.contains(target_group, autoescape=True))
+
+        stmt = stmt.order_by(Policy.announcement_date.desc()).limit(self.config.result_limit)
+
+        with get_db() as db:
+            rows = db.execute(stmt).all()
+
+        retrieved_docs = [_build_doc(row, "", 0.0, "filter") for row in rows]
+
+        return retrieved_docs, []
 
     def _hybrid_search(
         self,
@@ -530,53 +973,42 @@ class SimpleSearchService:
         # BM25 인덱스 구축 (처음 한 번만)
         self._build_bm25_index_if_needed()
 
-        # 1. Dense 검색 (벡터)
-        query_vector = self.embedder.embed_text(query)
-
         qdrant_filter = {}
         if region:
             qdrant_filter["region"] = region
         if category:
             qdrant_filter["category"] = category
 
-        dense_results = self.qdrant_manager.search(
-            query_vector=query_vector,
-            limit=self.config.qdrant_limit,
-            score_threshold=score_threshold,
-            filter_dict=qdrant_filter if qdrant_filter else None
+        # 1. Dense(임베딩 + Qdrant) / Sparse(BM25) 검색을 동시에 실행
+        dense_future = _retrieval_executor.submit(
+            self._dense_search,
+            query,
+            score_threshold,
+            qdrant_filter if qdrant_filter else None
         )
 
-        # Dense 결과를 (policy_id, score) 형태로 변환
-        dense_policy_scores: List[Tuple[int, float]] = []
-        policy_contents: Dict[int, str] = {}
-
-        for result in dense_results:
-            payload = result.get("payload", {})
-            policy_id = payload.get("policy_id")
-            score = result.get("score", 0.0)
-            content = payload.get("content", "")
-
-            if policy_id:
-                # 같은 policy_id가 여러 번 나올 수 있으므로 최고 점수만 유지
-                existing = next((i for i, (pid, _) in enumerate(dense_policy_scores) if pid == policy_id), None)
-                if existing is not None:
-                    if score > dense_policy_scores[existing][1]:
-                        dense_policy_scores[existing] = (policy_id, score)
-                        policy_contents[policy_id] = content
-                else:
-                    dense_policy_scores.append((policy_id, score))
-                    policy_contents[policy_id] = content
-
-        # 2. Sparse 검색 (BM25)
-        sparse_policy_scores: List[Tuple[int, float]] = []
-
+        sparse_future = None
         if self.hybrid_searcher.bm25_index:
-            sparse_results = self.hybrid_searcher.bm25_index.search(
+            sparse_future = _retrieval_executor.submit(
+                self.hybrid_searcher.bm25_index.search,
                 query=query,
                 top_k=self.config.qdrant_limit,
                 min_score=self.config.sparse_min_score
             )
-            sparse_policy_scores = sparse_results
+
+        dense_results = dense_future.result()
+
+        # Dense 결과를 (policy_id, score) 형태로 변환
+        # 같은 policy_id가 여러 번 나올 수 있으므로 최고 점수만 유지 (첫 등장 순서 보존)
+        best = _best_chunks(dense_results)
+        dense_policy_scores: List[Tuple[int, float]] = [
+            (policy_id, score) for policy_id, (score, _) in best.items()
+        ]
+
+        # 2. Sparse 검색 (BM25) 결과 수집
+        sparse_policy_scores: List[Tuple[int, float]] = (
+            sparse_future.result() if sparse_future else []
+        )
 
         # 3. 하이브리드 결합
         combined_results = self.hybrid_searcher.combine_results(
@@ -586,99 +1018,99 @@ class SimpleSearchService:
         )
 
         # 매칭 타입별 카운트
-        for _, _, match_type in combined_results:
-            if match_type == "dense":
-                metrics.dense_count += 1
-            elif match_type == "sparse":
-                metrics.sparse_count += 1
-            elif match_type == "hybrid":
-                metrics.hybrid_count += 1
-
-        logger.info(
-            "Hybrid search completed",
-            extra={
-                "dense_count": len(dense_policy_scores),
-                "sparse_count": len(sparse_policy_scores),
-                "combined_count": len(combined_results),
-                "hybrid_matches": metrics.hybrid_count
-            }
-        )
+        match_counts = Counter(match_type for _, _, match_type in combined_results)
+        metrics.dense_count += match_counts["dense"]
+        metrics.sparse_count += match_counts["sparse"]
+        metrics.hybrid_count += match_counts["hybrid"]
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Hybrid search completed",
+                extra={
+                    "dense_count": len(dense_policy_scores),
+                    "sparse_count": len(sparse_policy_scores),
+                    "combined_count": len(combined_results),
+                    "hybrid_matches": metrics.hybrid_count
+                }
+            )
 
         # 4. MySQL에서 정책 상세 정보 조회
         policy_ids = [pid for pid, _, _ in combined_results]
         if not policy_ids:
             return [], []
 
-        # 점수 및 매칭 타입 저장
-        policy_scores = {pid: score for pid, score, _ in combined_results}
-        policy_match_types = {pid: match_type for pid, _, match_type in combined_results}
+        with get_db() as db:
+            by_id = self._filtered_policies(
+                db, policy_ids, region, category, target_group
+            )
+
+        # combined_results 순위 순서대로 조립 (이미 점수 내림차순)
+        # Sparse 전용 결과는 Dense 청크가 없으므로 콘텐츠 None
+        ranked = [
+            (by_id[policy_id], score, match_type, best[policy_id][1] if policy_id in best else None)
+            for policy_id, score, match_type in combined_results
+            if policy_id in by_id
+        ]
+
+        retrieved_docs = [
+            _build_doc(policy, content or "", score, match_type)
+            for policy, score, match_type, content in ranked
+        ]
+
+        # 검색 근거
+        evidence_list: List[SearchEvidence] = [
+            SearchEvidence(
+                policy_id=policy.id,
+                matched_content=content if content is not None else (policy.program_name or ""),
+                score=score,
+                match_type=match_type
+            )
+            for policy, score, match_type, content in ranked
+        ]
 
-        retrieved_docs = []
-        evidence_list: List[SearchEvidence] = []
+        return retrieved_docs, evidence_list
 
-        with get_db() as db:
-            policies = db.query(Policy).filter(Policy.id.in_(policy_ids)).all()
-
-            # 필터링 적용
-            if region:
-                policies = [p for p in policies if p.region == region]
-            if category:
-                policies = [p for p in policies if p.category == category]
-            if target_group:
-                policies = [
-                    p for p in policies
-                    if p.apply_target and target_group in p.apply_target
-                ]
-
-            for policy in policies:
-                score = policy_scores.get(policy.id, 0.0)
-                match_type = policy_match_types.get(policy.id, "hybrid")
-
-                # contact_agency와 application_method가 리스트인 경우 문자열로 변환
-                contact_agency = policy.contact_agency
-                if isinstance(contact_agency, list):
-                    contact_agency = ", ".join(str(item) for item in contact_agency) if contact_agency else None
-                
-                application_method = policy.application_method
-                if isinstance(application_method, list):
-                    application_method = ", ".join(str(item) for item in application_method) if application_method else None
-
-                doc = {
-                    "policy_id": policy.id,
-                    "program_name": policy.program_name,
-                    "program_overview": policy.program_overview,
-                    "content": policy_contents.get(policy.id, ""),
-                    "score": score,
-                    "match_type": match_type,
-                    "region": policy.region,
-                    "category": policy.category,
-                    "support_description": policy.support_description,
-                    "support_budget": policy.support_budget,
-                    "apply_target": policy.apply_target,
-                    "announcement_date": policy.announcement_date,
-                    "application_method": application_method,
-                    "created_at": str(policy.created_at) if policy.created_at else None,
-                    "metadata": {
-                        "supervising_ministry": policy.supervising_ministry,
-                        "support_scale": policy.support_scale,
-                        "contact_agency": contact_agency
-                    }
-                }
-                retrieved_docs.append(doc)
+    def _embed_query(self, query: str) -> List[float]:
+        """
+        쿼리 임베딩 (정규화된 쿼리 기준 TTL 캐시)
 
-                # 검색 근거 추가
-                evidence_list.append(SearchEvidence(
-                    policy_id=policy.id,
-                    matched_content=policy_contents.get(policy.id, policy.program_name or ""),
-                    score=score,
-                    match_type=match_type
-                ))
+        Args:
+            query: 검색 쿼리
 
-        # 점수순 정렬
-        retrieved_docs.sort(key=lambda x: x.get("score", 0), reverse=True)
-        evidence_list.sort(key=lambda x: x.score, reverse=True)
+        Returns:
+            List[float]: 임베딩 벡터
+        """
+        normalized = _normalize_query(query)
+        vector = _query_embedding_cache.get(normalized)
+        if vector is None:
+            vector = self.embedder.embed_text(normalized)
+            _query_embedding_cache.set(normalized, vector)
+        return vector
+
+    def _dense_search(
+        self,
+        query: str,
+        score_threshold: float,
+        filter_dict: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Dense 검색 (쿼리 임베딩 + Qdrant 검색)
 
-        return retrieved_docs, evidence_list
+        Args:
+            query: 검색 쿼리
+            score_threshold: 유사도 임계값
+            filter_dict: Qdrant 필터
+
+        Returns:
+            List[Dict]: Qdrant 검색 결과
+        """
+        query_vector = self._embed_query(query)
+        return self.qdrant_manager.search(
+            query_vector=query_vector,
+            limit=self.config.qdrant_limit,
+            score_threshold=score_threshold,
+            filter_dict=filter_dict
+        )
 
     def _vector_search(
         self,
@@ -702,7 +1134,7 @@ class SimpleSearchService:
             Tuple[List[Dict], List[SearchEvidence]]: (검색 결과, 검색 근거)
         """
         # 쿼리 임베딩 생성
-        query_vector = self.embedder.embed_text(query)
+        query_vector = self._embed_query(query)
 
         # Qdrant 필터 구성
         qdrant_filter = {}
@@ -719,76 +1151,35 @@ class SimpleSearchService:
             filter_dict=qdrant_filter if qdrant_filter else None
         )
 
-        # 정책 ID별 최고 점수 및 콘텐츠 추적
-        policy_scores: Dict[int, float] = {}
-        policy_contents: Dict[int, str] = {}
-        evidence_list: List[SearchEvidence] = []
-
-        for result in results:
-            payload = result.get("payload", {})
-            policy_id = payload.get("policy_id")
-            score = result.get("score", 0.0)
-            content = payload.get("content", "")
-
-            if policy_id:
-                # 최고 점수 유지
-                if policy_id not in policy_scores or score > policy_scores[policy_id]:
-                    policy_scores[policy_id] = score
-                    policy_contents[policy_id] = content
-
-                    # 검색 근거 추가
-                    evidence_list.append(SearchEvidence(
-                        policy_id=policy_id,
-                        matched_content=content,
-                        score=score,
-                        match_type="vector"
-                    ))
+        # 정책 ID별 최고 점수 청크 (Qdrant 결과가 점수순이므로 삽입 순서 = 순위)
+        best = _best_chunks(results)
 
-        if not policy_scores:
+        if not best:
             return [], []
 
+        # 검색 근거는 정책당 최고 점수 청크 하나만
+        evidence_list: List[SearchEvidence] = [
+            SearchEvidence(
+                policy_id=policy_id,
+                matched_content=content,
+                score=score,
+                match_type="vector"
+            )
+            for policy_id, (score, content) in best.items()
+        ]
+
         # MySQL에서 정책 상세 정보 조회
-        retrieved_docs = []
         with get_db() as db:
-            policy_ids = list(policy_scores.keys())
-            policies = db.query(Policy).filter(Policy.id.in_(policy_ids)).all()
-
-            # 필터링 적용
-            if region:
-                policies = [p for p in policies if p.region == region]
-            if category:
-                policies = [p for p in policies if p.category == category]
-            if target_group:
-                policies = [
-                    p for p in policies
-                    if p.apply_target and target_group in p.apply_target
-                ]
-
-            for policy in policies:
-                doc = {
-                    "policy_id": policy.id,
-                    "program_name": policy.program_name,
-                    "program_overview": policy.program_overview,
-                    "content": policy_contents.get(policy.id, ""),
-                    "score": policy_scores.get(policy.id, 0.0),
-                    "region": policy.region,
-                    "category": policy.category,
-                    "support_description": policy.support_description,
-                    "support_budget": policy.support_budget,
-                    "apply_target": policy.apply_target,
-                    "announcement_date": policy.announcement_date,
-                    "application_method": policy.application_method,
-                    "created_at": str(policy.created_at) if policy.created_at else None,
-                    "metadata": {
-                        "supervising_ministry": policy.supervising_ministry,
-                        "support_scale": policy.support_scale,
-                        "contact_agency": policy.contact_agency
-                    }
-                }
-                retrieved_docs.append(doc)
+            by_id = self._filtered_policies(
+                db, list(best), region, category, target_group
+            )
 
-        # 점수순 정렬된 evidence 반환
-        evidence_list.sort(key=lambda x: x.score, reverse=True)
+        # 검색 순위 순서대로 조립
+        retrieved_docs = [
+            _build_doc(by_id[policy_id], content, score, "vector")
+            for policy_id, (score, content) in best.items()
+            if policy_id in by_id
+        ]
 
         return retrieved_docs, evidence_list
 
@@ -817,20 +1208,9 @@ class SimpleSearchService:
 
         try:
             # 검색 쿼리 구성
-            search_parts = []
-
-            if keywords:
-                search_parts.extend(keywords[:3])
-            else:
-                search_parts.append(query)
-
-            if region and region != "전국":
-                search_parts.append(region)
-            if target_group:
-                search_parts.append(target_group)
-
-            search_parts.append("정부 지원 사업")
-            search_query = " ".join(search_parts)
+            search_query = _build_tavily_query(
+                tuple(keywords[:3]), region, target_group, query
+            )
 
             # Tavily 검색
             tavily_client = get_tavily_client()
@@ -840,24 +1220,35 @@ class SimpleSearchService:
                 search_depth="advanced"
             )
 
-            web_sources = []
-            for result in results:
-                web_sources.append({
+            # 관련도 내림차순 정렬 (Tavily 응답 순서가 점수순이면 그대로 유지)
+            scores = np.fromiter(
+                (result.get("score") or 0.0 for result in results),
+                dtype=np.float32,
+                count=len(results)
+            )
+            order = np.argsort(-scores, kind="stable")
+
+            today = date.today().isoformat()
+            web_sources = [
+                {
                     "url": result.get("url", ""),
                     "title": result.get("title", ""),
                     "snippet": result.get("content", ""),
                     "score": result.get("score", 0.0),
-                    "fetched_date": date.today().isoformat(),
+                    "fetched_date": today,
                     "source_type": "tavily"
-                })
-
-            logger.info(
-                "Web search completed",
-                extra={
-                    "query": search_query,
-                    "results_count": len(web_sources)
                 }
-            )
+                for result in map(results.__getitem__, order.tolist())
+            ]
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Web search completed",
+                    extra={
+                        "query": search_query,
+                        "results_count": len(web_sources)
+                    }
+                )
 
             return web_sources
 
@@ -872,7 +1263,7 @@ class SimpleSearchService:
     def _generate_summary(
         self,
         query: str,
-        policies: List[Dict[str, Any]],
+        policies: List[PolicyResult],
         metrics: SearchMetrics
     ) -> str:
         """
@@ -886,46 +1277,32 @@ class SimpleSearchService:
         Returns:
             str: 검색 요약
         """
-        internal_count = sum(1 for p in policies if p.get("source_type") == "internal")
-        web_count = sum(1 for p in policies if p.get("source_type") == "web")
-        total = len(policies)
-
-        if total == 0:
-            return f"'{query}'에 대한 검색 결과가 없습니다."
-
-        if internal_count > 0:
-            top_policy = policies[0].get("program_name", "정책")
-            if metrics.top_score >= 0.5:
-                summary = (
-                    f"'{query}' 검색 결과 {total}건을 찾았습니다. "
-                    f"'{top_policy}'이(가) 가장 관련도가 높습니다 (유사도: {metrics.top_score:.0%})."
-                )
-            else:
-                summary = f"'{query}' 검색 결과 {total}건을 찾았습니다."
-
-            if web_count > 0:
-                summary += f" 웹 검색으로 {web_count}건의 추가 정보를 확인했습니다."
-        else:
-            summary = (
-                f"'{query}'에 대한 내부 정책을 찾지 못해 "
-                f"웹 검색 결과 {web_count}건을 제공합니다."
-            )
-
-        return summary
+        return _format_summary(
+            query,
+            len(policies),
+            sum(1 for p in policies if p.source_type == "web"),
+            policies[0].program_name if policies else None,
+            metrics.top_score
+        )
 
 
-# 싱글톤 인스턴스
+# 싱글톤 인스턴스 (앱 시작 시 lifespan 에서 미리 생성)
 _simple_search_service: Optional[SimpleSearchService] = None
+_simple_search_service_lock = threading.Lock()
 
 
 def get_simple_search_service() -> SimpleSearchService:
     """
     SimpleSearchService 싱글톤 인스턴스 반환
 
+    검색 요청은 워커 스레드에서 실행되므로 생성 시 락으로 중복 초기화를 막습니다.
+
     Returns:
         SimpleSearchService: 검색 서비스 인스턴스
     """
     global _simple_search_service
     if _simple_search_service is None:
-        _simple_search_service = SimpleSearchService()
+        with _simple_search_service_lock:
+            if _simple_search_service is None:
+                _simple_search_service = SimpleSearchService()
     return _simple_search_service
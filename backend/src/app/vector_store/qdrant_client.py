@@ -3,7 +3,7 @@ Qdrant 클라이언트
 벡터 DB 연결 및 관리
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Union
 from functools import lru_cache
 
 from qdrant_client import QdrantClient
@@ -15,6 +15,11 @@ from qdrant_client.models import (
     FieldCondition,
     MatchValue,
     SearchRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    QuantizationSearchParams,
 )
 
 from ..config import get_settings
@@ -23,6 +28,23 @@ from ..config.logger import get_logger
 logger = get_logger()
 settings = get_settings()
 
+# int8 스칼라 양자화: 양자화 벡터는 RAM에, 원본 float32 벡터는 디스크에 보관
+QUANTIZATION_CONFIG = ScalarQuantization(
+    scalar=ScalarQuantizationConfig(
+        type=ScalarType.INT8,
+        quantile=0.99,
+        always_ram=True
+    )
+)
+
+# 양자화 벡터로 후보를 oversampling만큼 뽑은 뒤 원본 벡터로 재채점
+SEARCH_PARAMS = SearchParams(
+    quantization=QuantizationSearchParams(
+        rescore=True,
+        oversampling=2.0
+    )
+)
+
 
 class QdrantManager:
     """
@@ -94,6 +116,7 @@ class QdrantManager:
                         "Collection already exists",
                         extra={"collection": self.collection_name}
                     )
+                    self.enable_quantization()
                     return True
             
             # Create collection
@@ -101,8 +124,10 @@ class QdrantManager:
                 collection_name=self.collection_name,
                 vectors_config=VectorParams(
                     size=vector_size,
-                    distance=distance
-                )
+                    distance=distance,
+                    on_disk=True
+                ),
+                quantization_config=QUANTIZATION_CONFIG
             )
             
             logger.info(
@@ -124,6 +149,31 @@ class QdrantManager:
             )
             raise
     
+    def enable_quantization(self) -> bool:
+        """
+        기존 컬렉션에 int8 스칼라 양자화 적용 (미적용 시에만)
+
+        양자화 이전에 생성된 컬렉션을 재생성 없이 마이그레이션
+
+        Returns:
+            bool: 양자화 설정을 새로 적용했으면 True
+        """
+        info = self.client.get_collection(self.collection_name)
+        if info.config.quantization_config is not None:
+            return False
+
+        self.client.update_collection(
+            collection_name=self.collection_name,
+            quantization_config=QUANTIZATION_CONFIG
+        )
+
+        logger.info(
+            "Scalar quantization enabled",
+            extra={"collection": self.collection_name}
+        )
+
+        return True
+    
     def upsert_points(
         self,
         points: List[PointStruct]
@@ -200,7 +250,8 @@ class QdrantManager:
                 query_vector=query_vector,
                 limit=limit,
                 score_threshold=score_threshold,
-                query_filter=query_filter
+                query_filter=query_filter,
+                search_params=SEARCH_PARAMS
             )
             
             # Format results
@@ -329,6 +380,55 @@ class QdrantManager:
             )
             raise
     
+    def iter_documents(
+        self,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1024,
+        with_payload: Union[bool, List[str]] = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        컬렉션 전체 문서를 scroll 페이지 단위로 순회
+
+        전체 결과를 한 번에 리스트로 만들지 않으므로 대량 조회 시 메모리 사용을 줄임
+
+        Args:
+            filter_dict: 필터 조건 (예: {"policy_id": 1})
+            batch_size: scroll 페이지 크기
+            with_payload: 반환할 payload (True면 전체, 리스트면 해당 필드만)
+
+        Yields:
+            Dict: {"id": ..., "payload": {...}} 문서
+        """
+        query_filter = None
+        if filter_dict:
+            query_filter = Filter(must=[
+                FieldCondition(
+                    key=key,
+                    match=MatchValue(value=value)
+                )
+                for key, value in filter_dict.items()
+            ])
+
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=query_filter,
+                limit=batch_size,
+                offset=offset,
+                with_payload=with_payload,
+                with_vectors=False
+            )
+
+            for point in points:
+                yield {
+                    "id": point.id,
+                    "payload": point.payload
+                }
+
+            if offset is None:
+                break
+
     def get_collection_info(self) -> Dict[str, Any]:
         """
         컬렉션 정보 조회
@@ -9,13 +9,19 @@ import re
 import math
 from typing import List, Dict, Any, Optional, Tuple
 from collections import Counter
+from itertools import chain
 from dataclasses import dataclass
 from functools import lru_cache
 
+import numpy as np
+
 from ..config.logger import get_logger
 
 logger = get_logger()
 
+# 토큰화 시 제거할 특수문자 패턴
+_NON_WORD_RE = re.compile(r'[^\w\s가-힣]')
+
 
 @dataclass
 class BM25Config:
@@ -33,7 +39,7 @@ class KoreanTokenizer:
     """
 
     # 불용어 리스트
-    STOPWORDS = {
+    STOPWORDS = frozenset({
         # 조사
         "은", "는", "이", "가", "을", "를", "의", "에", "에서", "로", "으로",
         "와", "과", "도", "만", "뿐", "부터", "까지", "에게", "한테", "께",
@@ -43,7 +49,7 @@ class KoreanTokenizer:
         "하다", "되다", "있다", "없다", "같다", "위한", "통한", "대한",
         # 기타
         "것", "수", "등", "중", "내", "외"
-    }
+    })
 
     # 중요 키워드 (가중치 부여용)
     IMPORTANT_KEYWORDS = {
@@ -70,7 +76,7 @@ class KoreanTokenizer:
         text = text.lower()
 
         # 특수문자 제거 (한글, 영문, 숫자만 유지)
-        text = re.sub(r'[^\w\s가-힣]', ' ', text)
+        text = _NON_WORD_RE.sub(' ', text)
 
         # 공백으로 분리
         tokens = text.split()
@@ -342,8 +348,10 @@ class HybridSearcher:
         Args:
             documents: 문서 리스트
         """
-        self.bm25_index = BM25Index()
-        self.bm25_index.build_index(documents)
+        # 구축이 끝난 뒤 교체하여 검색 중인 요청이 빈 인덱스를 보지 않도록 함
+        bm25_index = BM25Index()
+        bm25_index.build_index(documents)
+        self.bm25_index = bm25_index
 
     def combine_results(
         self,
@@ -362,112 +370,124 @@ class HybridSearcher:
         Returns:
             List[Tuple[int, float, str]]: [(doc_id, combined_score, match_type), ...]
         """
+        dense_ids, dense_scores = _to_arrays(dense_results)
+        sparse_ids, sparse_scores = _to_arrays(sparse_results)
+
+        # 두 결과의 doc_id 합집합을 첫 등장 순서 (Dense -> Sparse) 로 구성
+        # 안정 정렬이므로 동점(RRF 에서 흔함)은 먼저 나온 문서가 앞에 옴
+        positions: Dict[int, int] = {}
+        for doc_id in chain(dense_ids.tolist(), sparse_ids.tolist()):
+            positions.setdefault(doc_id, len(positions))
+        ids = np.fromiter(positions, dtype=np.int64, count=len(positions))
+        dense_pos = np.fromiter(
+            (positions[doc_id] for doc_id in dense_ids.tolist()), dtype=np.intp, count=len(dense_ids)
+        )
+        sparse_pos = np.fromiter(
+            (positions[doc_id] for doc_id in sparse_ids.tolist()), dtype=np.intp, count=len(sparse_ids)
+        )
+
         if self.use_rrf:
-            return self._combine_rrf(dense_results, sparse_results)
+            scores = self._combine_rrf(ids, dense_pos, sparse_pos)
         else:
-            return self._combine_weighted(dense_results, sparse_results, normalize)
+            scores = self._combine_weighted(
+                ids, dense_pos, dense_scores, sparse_pos, sparse_scores, normalize
+            )
+
+        # Match type 결정
+        in_dense = np.isin(ids, dense_ids)
+        in_sparse = np.isin(ids, sparse_ids)
+        match_types = np.where(
+            in_dense & in_sparse, "hybrid", np.where(in_dense, "dense", "sparse")
+        )
+
+        order = np.argsort(-scores, kind="stable")
+
+        return list(zip(
+            ids[order].tolist(),
+            scores[order].tolist(),
+            match_types[order].tolist()
+        ))
 
     def _combine_rrf(
         self,
-        dense_results: List[Tuple[int, float]],
-        sparse_results: List[Tuple[int, float]]
-    ) -> List[Tuple[int, float, str]]:
+        ids: np.ndarray,
+        dense_pos: np.ndarray,
+        sparse_pos: np.ndarray
+    ) -> np.ndarray:
         """
         Reciprocal Rank Fusion으로 결합
 
         RRF score = sum(1 / (k + rank))
 
         Args:
-            dense_results: Dense 검색 결과
-            sparse_results: Sparse 검색 결과
+            ids: 결합 대상 doc_id 배열 (첫 등장 순서)
+            dense_pos: Dense 결과 순서대로 ids 내 위치
+            sparse_pos: Sparse 결과 순서대로 ids 내 위치
 
         Returns:
-            List[Tuple[int, float, str]]: 결합된 결과
+            np.ndarray: ids에 대응하는 RRF 점수
         """
-        rrf_scores: Dict[int, float] = {}
-        match_types: Dict[int, str] = {}
-        k = self.rrf_k
-
-        # Dense results RRF
-        for rank, (doc_id, _) in enumerate(dense_results, 1):
-            rrf_scores[doc_id] = rrf_scores.get(doc_id, 0) + 1 / (k + rank)
-            match_types[doc_id] = "dense"
-
-        # Sparse results RRF
-        for rank, (doc_id, _) in enumerate(sparse_results, 1):
-            rrf_scores[doc_id] = rrf_scores.get(doc_id, 0) + 1 / (k + rank)
-            if doc_id in match_types:
-                match_types[doc_id] = "hybrid"  # 둘 다 매칭
-            else:
-                match_types[doc_id] = "sparse"
-
-        # 정렬
-        results = [
-            (doc_id, score, match_types[doc_id])
-            for doc_id, score in rrf_scores.items()
-        ]
-        results.sort(key=lambda x: x[1], reverse=True)
+        k = float(self.rrf_k)
+        scores = np.zeros(len(ids), dtype=np.float64)
+
+        np.add.at(scores, dense_pos, 1.0 / (k + np.arange(1, len(dense_pos) + 1)))
+        np.add.at(scores, sparse_pos, 1.0 / (k + np.arange(1, len(sparse_pos) + 1)))
 
-        return results
+        return scores
 
     def _combine_weighted(
         self,
-        dense_results: List[Tuple[int, float]],
-        sparse_results: List[Tuple[int, float]],
+        ids: np.ndarray,
+        dense_pos: np.ndarray,
+        dense_scores: np.ndarray,
+        sparse_pos: np.ndarray,
+        sparse_scores: np.ndarray,
         normalize: bool = True
-    ) -> List[Tuple[int, float, str]]:
+    ) -> np.ndarray:
         """
         가중 평균으로 결합
 
         Args:
-            dense_results: Dense 검색 결과
-            sparse_results: Sparse 검색 결과
+            ids: 결합 대상 doc_id 배열 (첫 등장 순서)
+            dense_pos: Dense 결과 순서대로 ids 내 위치
+            dense_scores: Dense 점수
+            sparse_pos: Sparse 결과 순서대로 ids 내 위치
+            sparse_scores: Sparse 점수
             normalize: 점수 정규화 여부
 
         Returns:
-            List[Tuple[int, float, str]]: 결합된 결과
+            np.ndarray: ids에 대응하는 가중 점수
         """
-        combined: Dict[int, Dict[str, float]] = {}
-
-        # 정규화를 위한 최대값
-        max_dense = max((s for _, s in dense_results), default=1.0) or 1.0
-        max_sparse = max((s for _, s in sparse_results), default=1.0) or 1.0
-
-        # Dense scores
-        for doc_id, score in dense_results:
-            if normalize:
-                score = score / max_dense
-            combined[doc_id] = {"dense": score, "sparse": 0.0}
-
-        # Sparse scores
-        for doc_id, score in sparse_results:
-            if normalize:
-                score = score / max_sparse
-            if doc_id in combined:
-                combined[doc_id]["sparse"] = score
-            else:
-                combined[doc_id] = {"dense": 0.0, "sparse": score}
-
-        # 가중 평균 계산
-        results = []
-        for doc_id, scores in combined.items():
-            weighted_score = (
-                self.dense_weight * scores["dense"] +
-                self.sparse_weight * scores["sparse"]
-            )
+        if normalize:
+            # 정규화를 위한 최대값
+            max_dense = (dense_scores.max() if dense_scores.size else 1.0) or 1.0
+            max_sparse = (sparse_scores.max() if sparse_scores.size else 1.0) or 1.0
+            dense_scores = dense_scores / max_dense
+            sparse_scores = sparse_scores / max_sparse
 
-            # Match type 결정
-            if scores["dense"] > 0 and scores["sparse"] > 0:
-                match_type = "hybrid"
-            elif scores["dense"] > 0:
-                match_type = "dense"
-            else:
-                match_type = "sparse"
+        dense = np.zeros(len(ids), dtype=np.float64)
+        sparse = np.zeros(len(ids), dtype=np.float64)
+        dense[dense_pos] = dense_scores
+        sparse[sparse_pos] = sparse_scores
 
-            results.append((doc_id, weighted_score, match_type))
+        return self.dense_weight * dense + self.sparse_weight * sparse
 
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results
+
+def _to_arrays(results: List[Tuple[int, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    [(doc_id, score), ...] 결과를 id / 점수 배열로 변환
+
+    Args:
+        results: 검색 결과
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (int64 id 배열, float64 점수 배열)
+    """
+    if not results:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    ids, scores = zip(*results)
+    return np.asarray(ids, dtype=np.int64), np.asarray(scores, dtype=np.float64)
 
 
 # 싱글톤 인스턴스
@@ -477,7 +497,8 @@ _hybrid_searcher: Optional[HybridSearcher] = None
 def get_hybrid_searcher(
     dense_weight: float = 0.7,
     sparse_weight: float = 0.3,
-    use_rrf: bool = True
+    use_rrf: bool = True,
+    rrf_k: int = 60
 ) -> HybridSearcher:
     """
     HybridSearcher 싱글톤 인스턴스 반환
@@ -486,6 +507,7 @@ def get_hybrid_searcher(
         dense_weight: Dense 가중치
         sparse_weight: Sparse 가중치
         use_rrf: RRF 사용 여부
+        rrf_k: RRF 파라미터 k
 
     Returns:
         HybridSearcher: 검색기 인스턴스
@@ -495,6 +517,7 @@ def get_hybrid_searcher(
         _hybrid_searcher = HybridSearcher(
             dense_weight=dense_weight,
             sparse_weight=sparse_weight,
-            use_rrf=use_rrf
+            use_rrf=use_rrf,
+            rrf_k=rrf_k
         )
     return _hybrid_searcher
@@ -3,9 +3,16 @@ Tavily Web Search Client
 Tavily API를 사용한 웹 검색 클라이언트
 """
 
-from typing import List, Dict, Any, Optional
-from tavily import TavilyClient
+import atexit
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Dict, Any, Optional, Tuple
 
+import httpx
+import orjson
+
+from ...cache import TTLCache
 from ...config import get_settings
 from ...config.logger import get_logger
 from ...observability import trace_tool
@@ -13,6 +20,124 @@ from ...observability import trace_tool
 logger = get_logger()
 settings = get_settings()
 
+TAVILY_API_URL = "https://api.tavily.com"
+
+# 검색 결과 캐시 (요청 파라미터 -> 결과 튜플)
+# SimpleSearchService, web_search_node 등 모든 호출 경로가 공유
+# 불변 튜플로 저장해 호출마다 방어적 복사를 하지 않음
+SEARCH_CACHE_TTL_SECONDS = 600
+_search_cache: TTLCache[Tuple[Dict[str, Any], ...]] = TTLCache(
+    maxsize=1024,
+    ttl_seconds=SEARCH_CACHE_TTL_SECONDS
+)
+
+# 진행 중인 검색 (요청 파라미터 -> 결과 Future), 동시 요청 중복 제거용
+_inflight: Dict[Tuple[Any, ...], Future] = {}
+_inflight_lock = threading.Lock()
+
+# 재시도 설정 (일시적 장애만 재시도, 지수 백오프)
+MAX_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 5.0
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class TavilyCircuitOpenError(RuntimeError):
+    """Tavily 장애로 회로가 열려 호출을 건너뛸 때 발생"""
+
+
+class _CircuitBreaker:
+    """
+    연속 실패 시 일정 시간 호출을 차단하는 회로 차단기
+    
+    장애 중에는 요청마다 타임아웃(30초)을 기다리지 않고 즉시 실패시킵니다.
+    복구 대기 시간이 지나면 한 번의 시험 호출(half-open)을 허용합니다.
+    """
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+        """
+        Args:
+            failure_threshold: 회로를 여는 연속 실패 횟수
+            recovery_timeout: 회로를 연 뒤 시험 호출까지 대기 시간 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """
+        호출 허용 여부 (복구 대기 시간이 지났으면 시험 호출 1회 허용)
+        
+        Returns:
+            bool: 호출 가능 여부
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.recovery_timeout:
+                # half-open: 다음 시험 호출 결과가 나올 때까지 다른 호출은 차단
+                self._opened_at = time.monotonic()
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        """성공 기록 (회로 닫힘)"""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+    
+    def record_failure(self) -> None:
+        """실패 기록 (임계치 도달 시 회로 열림)"""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(
+                        "Tavily circuit opened",
+                        extra={
+                            "failures": self._failures,
+                            "recovery_timeout": self.recovery_timeout
+                        }
+                    )
+                self._opened_at = time.monotonic()
+
+
+_breaker = _CircuitBreaker()
+
+
+def _log_expected(message: str, error: Exception, **context: Any) -> None:
+    """
+    예상 가능한 외부 API 오류 로깅 (WARNING, 트레이스백 없음)
+    
+    타임아웃/HTTP 오류는 원인이 명확하므로 traceback 포맷 비용을 들이지 않습니다.
+    
+    Args:
+        message: 로그 메시지
+        error: 발생한 예외
+        **context: 추가 로그 필드
+    """
+    logger.warning(
+        message,
+        extra={**context, "error": str(error), "error_type": type(error).__name__}
+    )
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    일시적 장애(네트워크 오류, 타임아웃, 429/5xx) 여부
+    
+    Args:
+        error: 발생한 예외
+    
+    Returns:
+        bool: 회로 차단기에 실패로 기록할지 여부
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
 
 class TavilySearchClient:
     """
@@ -22,6 +147,9 @@ class TavilySearchClient:
     고품질의 관련성 높은 결과를 제공합니다.
     """
     
+    # 모든 인스턴스가 공유하는 커넥션 풀 (TLS 핸드셰이크 재사용)
+    _http: Optional[httpx.Client] = None
+    
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Tavily client
@@ -34,9 +162,75 @@ class TavilySearchClient:
             logger.warning("Tavily API key not configured")
             self.client = None
         else:
-            self.client = TavilyClient(api_key=self.api_key)
+            self.client = self._get_http_client()
             logger.info("Tavily client initialized")
     
+    @classmethod
+    def _get_http_client(cls) -> httpx.Client:
+        """
+        공유 HTTP 클라이언트 반환 (keep-alive + HTTP/2)
+        
+        Returns:
+            httpx.Client: 프로세스 전체에서 재사용하는 클라이언트
+        """
+        if cls._http is None:
+            cls._http = httpx.Client(
+                base_url=TAVILY_API_URL,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=httpx.Timeout(30.0, connect=5.0)
+            )
+            atexit.register(cls._http.close)
+        return cls._http
+    
+    def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Tavily REST API 호출 (회로 차단기 + 지수 백오프 재시도)
+        
+        Args:
+            path: API 경로 (예: "/search")
+            payload: 요청 본문
+        
+        Returns:
+            Dict: 응답 JSON
+        
+        Raises:
+            TavilyCircuitOpenError: 연속 실패로 회로가 열려 있는 경우
+            httpx.HTTPError: 재시도 후에도 실패한 경우
+        """
+        # 요청/응답 본문은 orjson 으로 직렬화 (advanced 검색 응답은 수십 KB)
+        content = orjson.dumps(payload)
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            if not _breaker.allow():
+                raise TavilyCircuitOpenError("Tavily circuit is open")
+            
+            try:
+                response = self.client.post(path, content=content, headers=headers)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                if not _is_transient(e):
+                    # 4xx (인증/요청 오류)는 장애가 아니므로 회로에 반영하지 않음
+                    raise
+                _breaker.record_failure()
+                # 타임아웃은 이미 오래 기다렸으므로 재시도하지 않음
+                if attempt == MAX_ATTEMPTS or isinstance(e, httpx.TimeoutException):
+                    raise
+                delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempt - 1), BACKOFF_MAX_SECONDS)
+                logger.warning(
+                    "Tavily request failed, retrying",
+                    extra={"attempt": attempt, "delay": delay, "error": str(e)}
+                )
+                time.sleep(delay)
+                continue
+            
+            _breaker.record_success()
+            return orjson.loads(response.content)
+    
     @trace_tool(name="tavily_search", tags=["web_search", "tavily"])
     def search(
         self,
@@ -46,7 +240,7 @@ class TavilySearchClient:
         include_domains: Optional[List[str]] = None,
         exclude_domains: Optional[List[str]] = None,
         days: int = 90  # 최근 90일 이내 결과만
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[Dict[str, Any], ...]:
         """
         Tavily 웹 검색 실행
         
@@ -59,7 +253,7 @@ class TavilySearchClient:
             days: 최근 N일 이내 결과만 (기본값: 90일)
         
         Returns:
-            List[Dict]: 검색 결과 리스트
+            Tuple[Dict]: 검색 결과 (캐시와 공유하는 불변 튜플)
                 - title: 제목
                 - url: URL
                 - content: 내용
@@ -68,8 +262,33 @@ class TavilySearchClient:
         """
         if not self.client:
             logger.error("Tavily client not initialized")
-            return []
+            return ()
         
+        cache_key = (
+            query,
+            max_results,
+            search_depth,
+            tuple(include_domains or ()),
+            tuple(exclude_domains or ()),
+            days
+        )
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Tavily search cache hit", extra={"query": query})
+            return cached
+        
+        # 동일 요청이 이미 진행 중이면 새로 호출하지 않고 그 결과를 공유
+        with _inflight_lock:
+            pending = _inflight.get(cache_key)
+            is_leader = pending is None
+            if is_leader:
+                pending = _inflight[cache_key] = Future()
+        
+        if not is_leader:
+            logger.debug("Joining in-flight Tavily search", extra={"query": query})
+            return pending.result()
+        
+        results: Tuple[Dict[str, Any], ...] = ()
         try:
             logger.info(
                 "Executing Tavily search",
@@ -82,54 +301,65 @@ class TavilySearchClient:
             )
             
             # Execute search
-            response = self.client.search(
-                query=query,
-                max_results=max_results,
-                search_depth=search_depth,
-                include_domains=include_domains,
-                exclude_domains=exclude_domains,
-                include_answer=True,  # Get AI-generated answer
-                include_raw_content=False,  # Don't include full HTML
-                days=days  # 최근 N일 이내 결과만
-            )
+            response = self._post("/search", {
+                "query": query,
+                "max_results": max_results,
+                "search_depth": search_depth,
+                "include_domains": include_domains or [],
+                "exclude_domains": exclude_domains or [],
+                "include_answer": False,  # AI 답변은 사용하지 않음 (응답 크기/지연 절감)
+                "include_raw_content": False,  # Don't include full HTML
+                "days": days  # 최근 N일 이내 결과만
+            })
             
-            # Parse results
-            results = []
-            for item in response.get("results", []):
-                results.append({
+            # Parse results (응답 dict 에서 바로 튜플로 변환)
+            results = tuple(
+                {
                     "title": item.get("title", ""),
                     "url": item.get("url", ""),
                     "content": item.get("content", ""),
                     "score": item.get("score", 0.0),
                     "published_date": item.get("published_date")
-                })
-            
-            # Add AI answer if available
-            ai_answer = response.get("answer")
-            if ai_answer:
-                logger.info(
-                    "Tavily AI answer received",
-                    extra={"answer_length": len(ai_answer)}
-                )
+                }
+                for item in response.get("results", ())
+            )
             
             logger.info(
                 "Tavily search completed",
                 extra={
                     "query": query,
-                    "results_count": len(results),
-                    "has_ai_answer": bool(ai_answer)
+                    "results_count": len(results)
                 }
             )
             
+            # 실패 시에는 캐시하지 않음 (except 경로)
+            _search_cache.set(cache_key, results)
+            
+            return results
+        
+        except TavilyCircuitOpenError:
+            results = ()
+            logger.warning("Tavily circuit open, skipping search", extra={"query": query})
+            return results
+        
+        except httpx.HTTPError as e:
+            results = ()
+            _log_expected("Tavily search failed", e, query=query)
             return results
             
         except Exception as e:
+            results = ()
             logger.error(
                 "Tavily search failed",
                 extra={"query": query, "error": str(e)},
                 exc_info=True
             )
-            return []
+            return results
+        
+        finally:
+            with _inflight_lock:
+                _inflight.pop(cache_key, None)
+            pending.set_result(results)
     
     @trace_tool(name="tavily_qna_search", tags=["web_search", "tavily", "qna"])
     def qna_search(self, query: str) -> Optional[str]:
@@ -149,7 +379,12 @@ class TavilySearchClient:
         try:
             logger.info("Executing Tavily Q&A search", extra={"query": query})
             
-            response = self.client.qna_search(query=query)
+            response = self._post("/search", {
+                "query": query,
+                "search_depth": "advanced",
+                "include_answer": True,
+                "include_raw_content": False
+            }).get("answer")
             
             logger.info(
                 "Tavily Q&A search completed",
@@ -157,6 +392,14 @@ class TavilySearchClient:
             )
             
             return response
+        
+        except TavilyCircuitOpenError:
+            logger.warning("Tavily circuit open, skipping Q&A search", extra={"query": query})
+            return None
+        
+        except httpx.HTTPError as e:
+            _log_expected("Tavily Q&A search failed", e, query=query)
+            return None
             
         except Exception as e:
             logger.error(
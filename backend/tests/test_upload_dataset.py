@@ -0,0 +1,84 @@
+"""
+평가 데이터셋 업로드 동기화 테스트 (LangSmith Client mock)
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langsmith.utils import LangSmithNotFoundError
+
+from app.evaluation import upload_dataset
+from app.evaluation.datasets import iter_examples
+
+
+def _remote_examples():
+    """로컬 데이터셋과 동일한 원격 예시 목록"""
+    return [
+        SimpleNamespace(
+            id=f"ex-{i}",
+            inputs=dict(example["input"]),
+            outputs=dict(example["expected_output"]),
+        )
+        for i, example in enumerate(iter_examples())
+    ]
+
+
+@pytest.fixture
+def client():
+    with patch.object(upload_dataset, "Client") as client_cls:
+        client = MagicMock()
+        client_cls.return_value = client
+        client.read_dataset.return_value = SimpleNamespace(id="dataset-1")
+        yield client
+
+
+def test_creates_dataset_and_examples_when_missing(client):
+    client.read_dataset.side_effect = LangSmithNotFoundError("not found")
+    client.create_dataset.return_value = SimpleNamespace(id="dataset-1")
+    client.list_examples.return_value = []
+    
+    upload_dataset.upload_evaluation_dataset()
+    
+    client.create_dataset.assert_called_once()
+    assert "metadata" not in client.create_dataset.call_args.kwargs
+    
+    local = list(iter_examples())
+    client.create_examples.assert_called_once_with(
+        inputs=[ex["input"] for ex in local],
+        outputs=[ex["expected_output"] for ex in local],
+        dataset_id="dataset-1",
+    )
+    client.update_example.assert_not_called()
+    client.delete_example.assert_not_called()
+
+
+def test_updates_changed_and_deletes_stale_examples(client):
+    remote = _remote_examples()
+    remote[0].outputs["answer_should_contain"] = ["이전 키워드"]
+    stale = SimpleNamespace(id="ex-stale", inputs={"session_id": "eval_removed"}, outputs={})
+    client.list_examples.return_value = remote + [stale]
+    
+    upload_dataset.upload_evaluation_dataset()
+    
+    first = next(iter_examples())
+    client.update_example.assert_called_once_with(
+        example_id="ex-0",
+        inputs=first["input"],
+        outputs=first["expected_output"],
+    )
+    client.delete_example.assert_called_once_with("ex-stale")
+    client.create_dataset.assert_not_called()
+    client.create_examples.assert_not_called()
+
+
+def test_skips_writes_when_content_unchanged(client):
+    client.list_examples.return_value = _remote_examples()
+    
+    dataset = upload_dataset.upload_evaluation_dataset()
+    
+    assert dataset.id == "dataset-1"
+    client.create_dataset.assert_not_called()
+    client.create_examples.assert_not_called()
+    client.update_example.assert_not_called()
+    client.delete_example.assert_not_called()
@@ -189,9 +189,9 @@ export const sendChatMessageStream = async (
  * 정책 문서 초기화 (캐시에 저장)
  */
 export const initPolicy = async (sessionId: string, policyId: number): Promise<void> => {
-  await apiClient.post('/api/v1/chat/init-policy', {
-    session_id: sessionId,
-    policy_id: policyId,
+  // GET 경로를 사용해야 브라우저가 ETag 로 재요청을 생략할 수 있음
+  await apiClient.get(`/api/v1/chat/init-policy/${policyId}`, {
+    params: { session_id: sessionId },
   });
 };
 
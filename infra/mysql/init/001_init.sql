@@ -37,7 +37,8 @@ CREATE TABLE IF NOT EXISTS policies (
     INDEX idx_region (region),
     INDEX idx_category (category),
     INDEX idx_program_name (program_name),
-    INDEX idx_created_at (created_at)
+    INDEX idx_created_at (created_at),
+    FULLTEXT INDEX ft_search (program_name, program_overview) WITH PARSER ngram
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='정책 메타 정보';
 
 -- ============================================================